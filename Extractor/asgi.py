@@ -1,7 +1,13 @@
 import os
 
 from django.core.asgi import get_asgi_application
+from django.urls import get_resolver
+
+from Extractor.settings import ROOT_URLCONF
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "Extractor.settings")
 
 application = get_asgi_application()
+
+# URL Pre Load
+get_resolver(ROOT_URLCONF).url_patterns
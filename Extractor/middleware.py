@@ -1,20 +1,46 @@
+import asyncio
 import logging
 import time
 from typing import Callable
 
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.http import HttpRequest, HttpResponse
 
 
 class PerformanceMiddleware:
+    async_capable = True
+    sync_capable = True
+
     def __init__(self, getResponse: Callable[[HttpRequest], HttpResponse]):
         self.getResponse = getResponse
         self.logger = logging.getLogger("performance")
 
+        if iscoroutinefunction(self.getResponse):
+            markcoroutinefunction(self)
+
     def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
         startTime = time.perf_counter()
         response = self.getResponse(request)
         elapsedTime = (time.perf_counter() - startTime) * 1000
 
+        self.logPerformance(request, response, elapsedTime)
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        startTime = time.perf_counter()
+        response = await self.getResponse(request)
+        elapsedTime = (time.perf_counter() - startTime) * 1000
+
+        # Webhook 전송이 이벤트 루프를 막지 않도록 별도 스레드에서 기록
+        await asyncio.to_thread(self.logPerformance, request, response, elapsedTime)
+        return response
+
+    def logPerformance(
+        self, request: HttpRequest, response: HttpResponse, elapsedTime: float
+    ):
         if request.path.startswith("/v"):
             self.logger.info(
                 "API Request Completed",
@@ -25,4 +51,3 @@ class PerformanceMiddleware:
                     "status": response.status_code,
                 },
             )
-        return response
@@ -89,6 +89,8 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "Extractor.wsgi.application"
 
+ASGI_APPLICATION = "Extractor.asgi.application"
+
 
 # Database
 DATABASES = {
@@ -128,6 +130,58 @@ USE_L10N = True
 USE_TZ = False
 
 
+# Extractor HTML 파싱 실행 방식 ("thread" 또는 "inline")
+EXTRACTOR_PARSE_EXECUTOR = env("EXTRACTOR_PARSE_EXECUTOR", default="thread")
+EXTRACTOR_PARSE_WORKERS = env.int("EXTRACTOR_PARSE_WORKERS", default=4)
+
+# Extractor HTML 파싱 백엔드 ("lxml" 또는 "bs4")
+EXTRACTOR_PARSE_BACKEND = env("EXTRACTOR_PARSE_BACKEND", default="lxml")
+
+# Extractor 응답 본문 수신 중 증분 파싱 여부
+EXTRACTOR_PARSE_STREAMING = env.bool("EXTRACTOR_PARSE_STREAMING", default=False)
+
+# Extractor 비동기 추출 작업 작업자 수, 대기열 크기, 완료 결과 보관 시간(초)
+EXTRACTOR_JOB_WORKERS = env.int("EXTRACTOR_JOB_WORKERS", default=4)
+EXTRACTOR_JOB_QUEUE_SIZE = env.int("EXTRACTOR_JOB_QUEUE_SIZE", default=100)
+EXTRACTOR_JOB_TTL = env.int("EXTRACTOR_JOB_TTL", default=600)
+
+# Extractor 워커 프로세스 간 공유하는 추출 작업 저장소 경로
+EXTRACTOR_JOB_STORE_PATH = env(
+    "EXTRACTOR_JOB_STORE_PATH", default=str(BASE_DIR / "data" / "job_store.sqlite3")
+)
+
+# Extractor 사용자별 추출 결과 캐시 크기
+EXTRACTOR_RESULT_CACHE_SIZE = env.int("EXTRACTOR_RESULT_CACHE_SIZE", default=2048)
+
+# Extractor 학교 시스템 요청 승인 제어
+# (전체 동시 실행 수, 학생별 동시 실행 수, 대기열 크기, 최대 대기 시간(초), 학생별 최대 대기 시간(초))
+EXTRACTOR_ADMISSION_MAX_IN_FLIGHT = env.int(
+    "EXTRACTOR_ADMISSION_MAX_IN_FLIGHT", default=32
+)
+EXTRACTOR_ADMISSION_PER_STUDENT = env.int("EXTRACTOR_ADMISSION_PER_STUDENT", default=8)
+EXTRACTOR_ADMISSION_QUEUE_SIZE = env.int("EXTRACTOR_ADMISSION_QUEUE_SIZE", default=64)
+EXTRACTOR_ADMISSION_MAX_WAIT = env.float("EXTRACTOR_ADMISSION_MAX_WAIT", default=10.0)
+EXTRACTOR_ADMISSION_STUDENT_WAIT = env.float(
+    "EXTRACTOR_ADMISSION_STUDENT_WAIT", default=5.0
+)
+
+# Extractor 종료된 학기 데이터(강좌 목록, 시간표) 저장소 경로
+EXTRACTOR_TERM_STORE_PATH = env(
+    "EXTRACTOR_TERM_STORE_PATH", default=str(BASE_DIR / "data" / "term_store.sqlite3")
+)
+
+# Extractor 종료된 학기 데이터 보관 기간(초)
+EXTRACTOR_TERM_STORE_RETENTION = env.int(
+    "EXTRACTOR_TERM_STORE_RETENTION", default=60 * 60 * 24 * 180
+)
+
+# 내부용 API(지표 조회) 접근 허용 주소 또는 네트워크, 토큰(Authorization: Bearer)
+EXTRACTOR_INTERNAL_ALLOWED_IPS = env.list(
+    "EXTRACTOR_INTERNAL_ALLOWED_IPS", default=["127.0.0.1", "::1"]
+)
+EXTRACTOR_INTERNAL_TOKEN = env("EXTRACTOR_INTERNAL_TOKEN", default="")
+
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
@@ -0,0 +1 @@
+from .controller import AdmissionController, AdmissionRejected, admission
@@ -0,0 +1,282 @@
+import asyncio
+import math
+import time
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
+from typing import Hashable
+
+from Scrape.extractor.exception import ErrorType, ExtractorException
+from Scrape.extractor.metrics import metrics
+from Scrape.extractor.settings import getSetting
+
+# 승인 제어 기본값
+ADMISSION_MAX_IN_FLIGHT = 32
+ADMISSION_MIN_IN_FLIGHT = 4
+ADMISSION_PER_STUDENT = 8
+ADMISSION_STUDENT_WAIT = 5.0
+ADMISSION_QUEUE_SIZE = 64
+ADMISSION_MAX_WAIT = 10.0
+ADMISSION_LATENCY_TARGET = 2.0
+ADMISSION_EWMA_WEIGHT = 0.2
+ADMISSION_INITIAL_SERVICE_TIME = 1.0
+
+
+class AdmissionRejected(ExtractorException):
+    """
+    과부하로 요청을 승인하지 않은 경우 발생하는 예외입니다.
+
+    Parameters:
+        errorType: 거절 유형 (SERVER_BUSY, TOO_MANY_REQUESTS)
+        retryAfter: 재시도까지 권장 대기 시간(초)
+    """
+
+    def __init__(self, errorType: ErrorType, retryAfter: int):
+        super().__init__(errorType=errorType)
+        self.retryAfter: int = retryAfter
+
+
+class AdmissionController:
+    """
+    학교 시스템 스크래핑 요청의 동시 실행 수를 제한하는 승인 제어기입니다.
+
+    전체 동시 실행 한도를 넘는 요청은 제한된 크기의 대기열에서 순서대로 기다리며,
+    대기열이 가득 찼거나 예상 대기 시간이 최대 대기 시간을 넘으면 즉시 거절합니다.
+    학생별 동시 실행 한도를 넘는 요청은 같은 학생의 요청이 끝날 때까지 잠시 기다리며,
+    학생별 대기 시간 안에 슬롯이 나지 않으면 거절합니다.
+    학생별 한도는 학번이 아닌 인증 정보 키 단위로 적용하므로,
+    다른 사용자가 잘못된 비밀번호로 보낸 요청이 학생 본인의 슬롯을 차지하지 않습니다.
+
+    전체 동시 실행 한도는 LMS 응답 지연 시간이 목표를 넘으면 비율에 맞춰 줄어들며,
+    재시도 권장 시간은 최근 요청 처리 시간으로 계산합니다.
+    """
+
+    def __init__(
+        self,
+        maxInFlight: int,
+        perStudent: int,
+        queueSize: int,
+        maxWait: float,
+        studentWait: float = ADMISSION_STUDENT_WAIT,
+        minInFlight: int = ADMISSION_MIN_IN_FLIGHT,
+        latencyTarget: float = ADMISSION_LATENCY_TARGET,
+    ):
+        self.maxInFlight: int = maxInFlight
+        self.minInFlight: int = min(minInFlight, maxInFlight)
+        self.perStudent: int = perStudent
+        self.queueSize: int = queueSize
+        self.maxWait: float = maxWait
+        self.studentWait: float = studentWait
+        self.latencyTarget: float = latencyTarget
+
+        self.inFlight: int = 0
+        self.serviceTime: float = ADMISSION_INITIAL_SERVICE_TIME
+        self.upstreamLatency: float | None = None
+
+        self._students: dict[Hashable, int] = defaultdict(int)
+        self._studentWaiters: dict[Hashable, list[asyncio.Future]] = defaultdict(list)
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        """
+        LMS 응답 지연 시간을 반영한 전체 동시 실행 한도입니다.
+        """
+        if self.upstreamLatency is None or self.upstreamLatency <= self.latencyTarget:
+            return self.maxInFlight
+
+        scale = self.latencyTarget / self.upstreamLatency
+        return max(self.minInFlight, int(self.maxInFlight * scale))
+
+    @asynccontextmanager
+    async def slot(self, credentialKey: Hashable):
+        """
+        실행 슬롯을 할당받고, 종료 시 처리 시간을 반영하여 반환합니다.
+
+        Parameters:
+            credentialKey: 인증 정보 키
+        """
+        await self.acquire(credentialKey)
+        startTime = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release(credentialKey, serviceTime=time.monotonic() - startTime)
+
+    async def acquire(self, credentialKey: Hashable):
+        """
+        실행 슬롯을 할당받습니다.
+
+        Parameters:
+            credentialKey: 인증 정보 키
+        """
+        # 학생별 동시 실행 한도 검증
+        if self._students.get(credentialKey, 0) >= self.perStudent:
+            await self._acquireStudent(credentialKey)
+
+        self._students[credentialKey] += 1
+        try:
+            await self._acquireGlobal()
+        except BaseException:
+            self._releaseStudent(credentialKey)
+            raise
+
+    def release(self, credentialKey: Hashable, serviceTime: float | None = None):
+        """
+        실행 슬롯을 반환하고 대기 중인 요청을 승인합니다.
+
+        Parameters:
+            credentialKey: 인증 정보 키
+            serviceTime: 요청 처리 시간(초)
+        """
+        self.inFlight -= 1
+        self._releaseStudent(credentialKey)
+
+        if serviceTime is not None:
+            self.serviceTime += ADMISSION_EWMA_WEIGHT * (serviceTime - self.serviceTime)
+        self._wakeup()
+
+    def observeUpstream(self, latency: float):
+        """
+        LMS 응답 지연 시간을 반영합니다.
+
+        Parameters:
+            latency: 응답 지연 시간(초)
+        """
+        if self.upstreamLatency is None:
+            self.upstreamLatency = latency
+        else:
+            self.upstreamLatency += ADMISSION_EWMA_WEIGHT * (
+                latency - self.upstreamLatency
+            )
+        self._wakeup()
+
+    def stats(self) -> dict:
+        """
+        승인 제어기 상태를 반환합니다.
+        """
+        return {
+            "limit": self.limit,
+            "inFlight": self.inFlight,
+            "waiting": len(self._waiters),
+            "students": len(self._students),
+            "serviceTime": round(self.serviceTime, 4),
+            "upstreamLatency": (
+                round(self.upstreamLatency, 4)
+                if self.upstreamLatency is not None
+                else None
+            ),
+        }
+
+    async def _acquireGlobal(self):
+        """
+        전체 동시 실행 한도 안에서 슬롯을 할당받습니다.
+        """
+        if self.inFlight < self.limit and not self._waiters:
+            self.inFlight += 1
+            metrics.increment("admission.admitted")
+            return
+
+        # 대기열 초과 또는 예상 대기 시간 초과 시 즉시 거절
+        expectedWait = self.serviceTime * (len(self._waiters) + 1) / self.limit
+        if len(self._waiters) >= self.queueSize or expectedWait > self.maxWait:
+            metrics.increment("admission.rejectedBusy")
+            raise AdmissionRejected(
+                errorType=ErrorType.SERVER_BUSY,
+                retryAfter=self._getRetryAfter(expectedWait),
+            )
+
+        # 슬롯 대기
+        metrics.increment("admission.queued")
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout=self.maxWait)
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # 시간 초과 직전 할당받은 슬롯 사용
+                metrics.increment("admission.admitted")
+                return
+            self._cancelWaiter(waiter)
+            metrics.increment("admission.timeout")
+            raise AdmissionRejected(
+                errorType=ErrorType.SERVER_BUSY,
+                retryAfter=self._getRetryAfter(self.serviceTime),
+            )
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # 할당받은 슬롯 반환
+                self.inFlight -= 1
+                self._wakeup()
+            else:
+                self._cancelWaiter(waiter)
+            raise
+        metrics.increment("admission.admitted")
+
+    async def _acquireStudent(self, credentialKey: Hashable):
+        """
+        같은 학생의 요청이 끝나 학생별 동시 실행 한도 안에 들 때까지 기다립니다.
+        """
+        metrics.increment("admission.queuedStudent")
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.studentWait
+
+        while self._students.get(credentialKey, 0) >= self.perStudent:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                metrics.increment("admission.rejectedStudent")
+                raise AdmissionRejected(
+                    errorType=ErrorType.TOO_MANY_REQUESTS,
+                    retryAfter=self._getRetryAfter(self.serviceTime),
+                )
+
+            waiter = loop.create_future()
+            waiters = self._studentWaiters[credentialKey]
+            waiters.append(waiter)
+            try:
+                await asyncio.wait_for(waiter, timeout=remaining)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                if waiter in waiters:
+                    waiters.remove(waiter)
+                if not waiters:
+                    self._studentWaiters.pop(credentialKey, None)
+
+    def _cancelWaiter(self, waiter: asyncio.Future):
+        waiter.cancel()
+        if waiter in self._waiters:
+            self._waiters.remove(waiter)
+
+    def _releaseStudent(self, credentialKey: Hashable):
+        self._students[credentialKey] -= 1
+        if self._students[credentialKey] <= 0:
+            del self._students[credentialKey]
+
+        # 같은 학생의 대기 요청 재확인
+        for waiter in self._studentWaiters.get(credentialKey, ()):
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def _wakeup(self):
+        while self._waiters and self.inFlight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.inFlight += 1
+                waiter.set_result(None)
+
+    @staticmethod
+    def _getRetryAfter(seconds: float) -> int:
+        return max(1, math.ceil(seconds))
+
+
+admission = AdmissionController(
+    maxInFlight=getSetting(
+        "EXTRACTOR_ADMISSION_MAX_IN_FLIGHT", ADMISSION_MAX_IN_FLIGHT
+    ),
+    perStudent=getSetting("EXTRACTOR_ADMISSION_PER_STUDENT", ADMISSION_PER_STUDENT),
+    queueSize=getSetting("EXTRACTOR_ADMISSION_QUEUE_SIZE", ADMISSION_QUEUE_SIZE),
+    maxWait=getSetting("EXTRACTOR_ADMISSION_MAX_WAIT", ADMISSION_MAX_WAIT),
+    studentWait=getSetting("EXTRACTOR_ADMISSION_STUDENT_WAIT", ADMISSION_STUDENT_WAIT),
+)
+
+metrics.registerGauge("admission", admission.stats)
@@ -0,0 +1,3 @@
+from .content import ContentCache
+from .lru import LruCache
+from .result import CachedResult, ResultCache, resultCache
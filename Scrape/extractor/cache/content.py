@@ -0,0 +1,55 @@
+import copy
+from typing import Any, Hashable
+
+from Scrape.extractor.cache.lru import LruCache
+from Scrape.extractor.metrics import metrics
+
+
+class ContentCache:
+    """
+    사용자 간에 공유하는 강좌 콘텐츠 캐시입니다.
+
+    공지사항 본문, 첨부 파일, 과제 설명처럼 같은 강좌의 모든 수강생에게 동일한
+    추출 결과를 (범위, 콘텐츠 Url) 키로 저장합니다.
+    저장 및 조회 시 값을 복사하므로, 반환된 값을 수정해도 캐시에는 영향이 없습니다.
+    """
+
+    def __init__(self, name: str, maxSize: int, ttl: float):
+        self.name: str = name
+        self._cache = LruCache(maxSize=maxSize, ttl=ttl)
+
+    def get(self, scope: Hashable, url: str) -> Any:
+        """
+        캐시된 콘텐츠를 조회합니다.
+
+        Parameters:
+            scope: 콘텐츠 범위 (강좌, 게시판 코드 등)
+            url: 정규화된 콘텐츠 Url
+
+        Returns:
+            value: 콘텐츠 복사본, 없거나 만료된 경우 None
+        """
+        value = self._cache.get((scope, url))
+        if value is None:
+            metrics.increment(f"{self.name}.miss")
+            return None
+
+        metrics.increment(f"{self.name}.hit")
+        return copy.deepcopy(value)
+
+    def set(self, scope: Hashable, url: str, value: Any):
+        """
+        콘텐츠를 저장합니다.
+
+        Parameters:
+            scope: 콘텐츠 범위 (강좌, 게시판 코드 등)
+            url: 정규화된 콘텐츠 Url
+            value: 콘텐츠
+        """
+        self._cache.set((scope, url), copy.deepcopy(value))
+
+    def stats(self) -> dict:
+        """
+        캐시 상태를 반환합니다.
+        """
+        return {"size": len(self._cache), "maxSize": self._cache.maxSize}
@@ -0,0 +1,130 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class LruCache:
+    """
+    TTL 만료와 LRU 제거 정책을 적용하는 캐시입니다.
+
+    만료된 항목은 조회 시점 또는 저장 시점에 최근 사용 순서의 앞쪽부터 제거하며,
+    전체 항목 정리는 maxSize번 저장할 때마다 한 번만 실행하여 저장 비용을 일정하게 유지합니다.
+    만료 또는 용량 초과로 제거된 항목은 onEvict 콜백으로 전달됩니다.
+    """
+
+    def __init__(
+        self,
+        maxSize: int,
+        ttl: float,
+        onEvict: Callable[[Hashable, Any], None] | None = None,
+    ):
+        self.maxSize: int = maxSize
+        self.ttl: float = ttl
+        self.onEvict = onEvict
+
+        self._entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        # 마지막 전체 정리 이후 저장 횟수
+        self._inserts: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        캐시 항목을 조회하고, 최근 사용 항목으로 갱신합니다.
+
+        Parameters:
+            key: 캐시 키
+            default: 항목이 없거나 만료된 경우 반환값
+
+        Returns:
+            value: 캐시 값
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        value, expiresAt = entry
+        if expiresAt <= time.monotonic():
+            self.delete(key)
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None):
+        """
+        캐시 항목을 저장하고, 용량을 초과한 오래된 항목을 제거합니다.
+
+        Parameters:
+            key: 캐시 키
+            value: 캐시 값
+            ttl: 항목 만료 시간(초), 미지정 시 기본 TTL 적용
+        """
+        previous = self._entries.pop(key, None)
+        if previous is not None and previous[0] is not value:
+            self._evict(key, previous[0])
+
+        now = time.monotonic()
+        self._entries[key] = (value, now + (self.ttl if ttl is None else ttl))
+
+        # 오래 사용되지 않은 항목부터 만료 항목 정리
+        self._purgeOldest(now)
+
+        # 주기적으로 전체 만료 항목 정리
+        self._inserts += 1
+        if self._inserts >= self.maxSize:
+            self.purge()
+
+        # 용량 초과 항목 제거
+        while len(self._entries) > self.maxSize:
+            oldKey, (oldValue, _) = self._entries.popitem(last=False)
+            self._evict(oldKey, oldValue)
+
+    def delete(self, key: Hashable):
+        """
+        캐시 항목을 제거합니다.
+
+        Parameters:
+            key: 캐시 키
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._evict(key, entry[0])
+
+    def purge(self):
+        """
+        만료된 캐시 항목을 모두 제거합니다.
+        """
+        self._inserts = 0
+        now = time.monotonic()
+        expiredKeys = [
+            key for key, (_, expiresAt) in self._entries.items() if expiresAt <= now
+        ]
+        for key in expiredKeys:
+            self.delete(key)
+
+    def items(self) -> list[tuple[Hashable, Any]]:
+        """
+        만료되지 않은 캐시 항목 목록을 반환합니다.
+        """
+        self.purge()
+        return [(key, value) for key, (value, _) in self._entries.items()]
+
+    def _purgeOldest(self, now: float):
+        """
+        가장 오래 사용되지 않은 항목부터 만료되지 않은 항목이 나올 때까지 제거합니다.
+        """
+        while self._entries:
+            key, (value, expiresAt) = next(iter(self._entries.items()))
+            if expiresAt > now:
+                return
+            del self._entries[key]
+            self._evict(key, value)
+
+    def _evict(self, key: Hashable, value: Any):
+        if self.onEvict:
+            self.onEvict(key, value)
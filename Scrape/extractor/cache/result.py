@@ -0,0 +1,201 @@
+import asyncio
+import json
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable
+
+from Scrape.extractor.cache.lru import LruCache
+from Scrape.extractor.exception import CREDENTIAL_ERROR_TYPES, ExtractorException
+from Scrape.extractor.metrics import metrics
+from Scrape.extractor.settings import getSetting
+
+# 결과 캐시 기본값
+RESULT_CACHE_SIZE = 2048
+
+
+@dataclass
+class CachedResult:
+    value: Any
+    freshUntil: float
+
+
+class ResultCache:
+    """
+    사용자별 추출 결과를 (엔드포인트, 인증 정보 키, 요청 인자) 단위로 저장하는 캐시입니다.
+
+    TTL 이내의 결과는 그대로 반환하고, TTL이 지난 뒤 유예 시간 이내의 결과는
+    즉시 반환하면서 백그라운드에서 다시 추출합니다(stale-while-revalidate).
+    추출 중 학교 시스템이 인증 정보를 거부하면 해당 인증 정보의 모든 결과를 제거합니다.
+
+    같은 키로 진행 중인 추출이 있다면 새로 추출하지 않고 그 결과를 기다리며,
+    먼저 요청한 클라이언트의 연결이 끊겨도 진행 중인 추출은 취소되지 않습니다.
+    """
+
+    def __init__(self, maxSize: int):
+        self._cache = LruCache(maxSize=maxSize, ttl=0)
+        self._flights: dict[Hashable, asyncio.Task] = {}
+        self._refreshes: set[asyncio.Task] = set()
+        self._waiters: int = 0
+
+    async def get(
+        self,
+        endpoint: str,
+        credentialKey: tuple[str, str],
+        params: dict,
+        load: Callable[[], Awaitable[Any]],
+        ttl: float,
+        grace: float = 0,
+    ) -> Any:
+        """
+        캐시된 결과를 반환하고, 없다면 추출하여 저장합니다.
+
+        Parameters:
+            endpoint: 엔드포인트 이름
+            credentialKey: 인증 정보 키
+            params: 결과에 영향을 주는 요청 인자
+            load: 결과를 추출하는 코루틴 함수
+            ttl: 결과 유효 시간(초)
+            grace: 유효 시간이 지난 결과를 반환하며 다시 추출하는 유예 시간(초)
+
+        Returns:
+            value: 추출 결과
+        """
+        key = (endpoint, credentialKey, self._getParamsKey(params))
+
+        entry: CachedResult | None = self._cache.get(key)
+        if entry is not None:
+            if entry.freshUntil > time.monotonic():
+                metrics.increment("resultCache.hit")
+                return entry.value
+
+            # 유예 시간 이내의 결과 반환 후 백그라운드 갱신
+            metrics.increment("resultCache.stale")
+            if self._getFlight(key) is None:
+                flight = self._startFlight(key, load, ttl, grace)
+                task = asyncio.get_running_loop().create_task(self._refresh(flight))
+                self._refreshes.add(task)
+                task.add_done_callback(self._refreshes.discard)
+            return entry.value
+
+        # 진행 중인 같은 추출 병합
+        flight = self._getFlight(key)
+        if flight is None:
+            metrics.increment("resultCache.miss")
+            flight = self._startFlight(key, load, ttl, grace)
+        else:
+            metrics.increment("resultCache.coalesced")
+
+        self._waiters += 1
+        try:
+            return await asyncio.shield(flight)
+        finally:
+            self._waiters -= 1
+
+    def invalidate(self, credentialKey: tuple[str, str]):
+        """
+        인증 정보의 모든 결과를 제거합니다.
+
+        Parameters:
+            credentialKey: 인증 정보 키
+        """
+        for key, _ in self._cache.items():
+            if key[1] == credentialKey:
+                self._cache.delete(key)
+
+    def stats(self) -> dict:
+        """
+        캐시 상태를 반환합니다.
+        """
+        return {
+            "size": len(self._cache),
+            "maxSize": self._cache.maxSize,
+            "inflight": len(self._flights),
+            "waiters": self._waiters,
+        }
+
+    def _getFlight(self, key: Hashable) -> asyncio.Task | None:
+        """
+        현재 이벤트 루프에서 진행 중인 추출 작업을 반환합니다.
+        """
+        flight = self._flights.get(key)
+        if flight is None or flight.get_loop() is not asyncio.get_running_loop():
+            return None
+        return flight
+
+    def _startFlight(
+        self,
+        key: Hashable,
+        load: Callable[[], Awaitable[Any]],
+        ttl: float,
+        grace: float,
+    ) -> asyncio.Task:
+        """
+        추출 작업을 시작하고 진행 중인 작업으로 등록합니다.
+        """
+        flight = asyncio.get_running_loop().create_task(
+            self._load(key, load, ttl, grace)
+        )
+        self._flights[key] = flight
+        flight.add_done_callback(lambda _: self._endFlight(key, flight))
+        return flight
+
+    def _endFlight(self, key: Hashable, flight: asyncio.Task):
+        """
+        완료된 추출 작업의 등록을 해제합니다.
+        """
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+        # 기다리는 요청이 없는 경우의 예외 확인 처리
+        if not flight.cancelled():
+            flight.exception()
+
+    async def _load(
+        self,
+        key: Hashable,
+        load: Callable[[], Awaitable[Any]],
+        ttl: float,
+        grace: float,
+    ) -> Any:
+        """
+        결과를 추출하여 저장합니다.
+        """
+        try:
+            value = await load()
+        except ExtractorException as e:
+            # 거부된 인증 정보의 결과 제거
+            if e.type in CREDENTIAL_ERROR_TYPES:
+                self.invalidate(key[1])
+            raise
+
+        entry = CachedResult(value=value, freshUntil=time.monotonic() + ttl)
+        self._cache.set(key, entry, ttl=ttl + grace)
+        return value
+
+    async def _refresh(self, flight: asyncio.Task):
+        """
+        유효 시간이 지난 결과의 백그라운드 추출을 기다리고 결과를 기록합니다.
+
+        실패한 경우 기존 결과는 유예 시간이 지나면 제거됩니다.
+        """
+        try:
+            await flight
+            metrics.increment("resultCache.refreshed")
+
+        except ExtractorException as e:
+            metrics.increment("resultCache.refreshFailed")
+            await asyncio.to_thread(e.logError, excInfo=sys.exc_info())
+        except Exception:
+            metrics.increment("resultCache.refreshFailed")
+
+    @staticmethod
+    def _getParamsKey(params: dict) -> str:
+        return json.dumps(params, sort_keys=True, default=sorted, ensure_ascii=False)
+
+
+resultCache = ResultCache(
+    maxSize=getSetting("EXTRACTOR_RESULT_CACHE_SIZE", RESULT_CACHE_SIZE)
+)
+
+metrics.registerGauge("resultCache", resultCache.stats)
@@ -1,2 +1,2 @@
 from .error_type import ErrorType
-from .exception import ExtractorException
+from .exception import CREDENTIAL_ERROR_TYPES, ExtractorException
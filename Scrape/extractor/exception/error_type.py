@@ -60,6 +60,28 @@ class ErrorType(Enum):
         status.HTTP_404_NOT_FOUND,
     )
 
+    JOB_QUEUE_FULL = (
+        "작업 대기열 초과",
+        "요청이 많아 작업을 등록하지 못했습니다. 잠시 후 다시 시도해주세요.",
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
+    JOB_NOT_EXIST = (
+        "작업 미존재",
+        "작업이 존재하지 않거나 만료되었습니다.",
+        status.HTTP_404_NOT_FOUND,
+    )
+
+    SERVER_BUSY = (
+        "서버 과부하",
+        "요청이 많아 처리하지 못했습니다. 잠시 후 다시 시도해주세요.",
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
+    TOO_MANY_REQUESTS = (
+        "요청 한도 초과",
+        "처리 중인 요청이 많습니다. 이전 요청이 완료된 후 다시 시도해주세요.",
+        status.HTTP_429_TOO_MANY_REQUESTS,
+    )
+
     def __init__(self, title: str, message: str, httpStatus: status):
         self.title = title
         self.message = message
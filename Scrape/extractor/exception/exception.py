@@ -1,8 +1,7 @@
 import logging
 
-from bs4 import BeautifulSoup
-
 from Scrape.extractor.exception import ErrorType
+from Scrape.extractor.parser import Node
 
 EXCEPT_ERROR_TYPES = (
     ErrorType.AUTHENTICATION_FAIL,
@@ -10,6 +9,16 @@ EXCEPT_ERROR_TYPES = (
     ErrorType.COURSE_NOT_EXIST,
     ErrorType.TIMETABLE_NOT_EXIST,
     ErrorType.KUTIS_PASSWORD_ERROR,
+    ErrorType.JOB_QUEUE_FULL,
+    ErrorType.JOB_NOT_EXIST,
+    ErrorType.SERVER_BUSY,
+    ErrorType.TOO_MANY_REQUESTS,
+)
+
+# 학교 시스템이 인증 정보를 거부한 오류 유형
+CREDENTIAL_ERROR_TYPES = (
+    ErrorType.AUTHENTICATION_FAIL,
+    ErrorType.KUTIS_PASSWORD_ERROR,
 )
 
 
@@ -18,7 +27,7 @@ class ExtractorException(Exception):
         self,
         errorType: ErrorType,
         message: str | None = None,
-        content: BeautifulSoup | None = None,
+        content: Node | None = None,
         data: str | None = None,
         *args
     ):
@@ -28,7 +37,7 @@ class ExtractorException(Exception):
         self.data = data or None
         super().__init__(self.message, *args)
 
-    def logError(self):
+    def logError(self, excInfo: bool | tuple = True):
         if self.type in EXCEPT_ERROR_TYPES:
             return
 
@@ -42,10 +51,10 @@ class ExtractorException(Exception):
                 ),
                 "data": self.data,
             },
-            exc_info=True,
+            exc_info=excInfo,
         )
 
-    def logWarning(self):
+    def logWarning(self, excInfo: bool | tuple = True):
         if self.type in EXCEPT_ERROR_TYPES:
             return
 
@@ -59,5 +68,5 @@ class ExtractorException(Exception):
                 ),
                 "data": self.data,
             },
-            exc_info=True,
+            exc_info=excInfo,
         )
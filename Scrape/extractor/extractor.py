@@ -1,7 +1,11 @@
 import asyncio
+import contextlib
+from typing import AsyncGenerator
 
 from Scrape.extractor.exception import ErrorType, ExtractorException
 from Scrape.extractor.parts import KutisExtractor, LmsExtractor, Utils
+from Scrape.extractor.parts.constants import LMS_COURSE_FIELDS, LMS_COURSE_PAGE_URL
+from Scrape.extractor.parts.schemas import CourseHomeSchema, CourseNoticeLinkSchema
 
 
 class Extractor(KutisExtractor, LmsExtractor):
@@ -14,7 +18,13 @@ class Extractor(KutisExtractor, LmsExtractor):
         LmsExtractor.__init__(self, studentId=studentId, password=password)
 
     async def getCourses(
-        self, year: int | None, semester: int | None, extract: bool
+        self,
+        year: int | None,
+        semester: int | None,
+        extract: bool,
+        include: set[str] | None = None,
+        assignmentDetail: bool = True,
+        knownNotices: set[str] | None = None,
     ) -> list:
         """
         모든 강좌의 데이터를 스크래핑합니다.
@@ -23,10 +33,55 @@ class Extractor(KutisExtractor, LmsExtractor):
             year: 추출 연도
             semester: 추출 학기
             extract: 개별 강좌 데이터 추출 여부
+            include: 추출 항목 (LMS_COURSE_FIELDS), 미지정 시 모든 항목
+            assignmentDetail: 과제 상세 정보 추출 여부
+            knownNotices: 클라이언트가 이미 가진 공지사항 식별값
 
         Returns:
             courseList: 모든 강좌 데이터
         """
+        async with contextlib.aclosing(
+            self.iterCourses(
+                year=year,
+                semester=semester,
+                extract=extract,
+                include=include,
+                assignmentDetail=assignmentDetail,
+                knownNotices=knownNotices,
+                ordered=True,
+            )
+        ) as courses:
+            return [course async for course in courses]
+
+    async def iterCourses(
+        self,
+        year: int | None,
+        semester: int | None,
+        extract: bool,
+        include: set[str] | None = None,
+        assignmentDetail: bool = True,
+        knownNotices: set[str] | None = None,
+        ordered: bool = False,
+    ) -> AsyncGenerator[dict, None]:
+        """
+        모든 강좌의 데이터를 스크래핑하고, 강좌별로 완료되는 즉시 반환합니다.
+
+        강좌 데이터는 완료된 순서대로 반환되므로, 강좌 목록의 순서와 다를 수 있습니다.
+        반환을 중단하면 진행 중인 강좌 스크래핑은 취소됩니다.
+
+        Parameters:
+            year: 추출 연도
+            semester: 추출 학기
+            extract: 개별 강좌 데이터 추출 여부
+            include: 추출 항목 (LMS_COURSE_FIELDS), 미지정 시 모든 항목
+            assignmentDetail: 과제 상세 정보 추출 여부
+            knownNotices: 클라이언트가 이미 가진 공지사항 식별값
+            ordered: 완료 순서 대신 강좌 목록 순서대로 반환할지 여부
+
+        Returns:
+            course: 강좌 데이터
+        """
+        tasks = []
         try:
             # 과거 또는 현재 강좌 목록 요청
             if year and semester:
@@ -36,10 +91,25 @@ class Extractor(KutisExtractor, LmsExtractor):
             else:
                 courseList = await self._getCourseList(close=False)
 
-            if extract:
-                tasks = [self._getCourseData(course) for course in courseList]
-                courseList = await asyncio.gather(*tasks)
-            return courseList
+            if not extract:
+                for course in courseList:
+                    yield course
+                return
+
+            # 강좌별 스크래핑 동시 실행 후 완료 순서 또는 목록 순서대로 반환
+            tasks = [
+                asyncio.ensure_future(
+                    self._getCourseData(
+                        course,
+                        include=include,
+                        assignmentDetail=assignmentDetail,
+                        knownNotices=knownNotices,
+                    )
+                )
+                for course in courseList
+            ]
+            for task in tasks if ordered else asyncio.as_completed(tasks):
+                yield await task
 
         except ExtractorException:
             # 스크래핑 문제 예외 처리
@@ -50,35 +120,64 @@ class Extractor(KutisExtractor, LmsExtractor):
             raise ExtractorException(errorType=ErrorType.SYSTEM_ERROR) from e
 
         finally:
-            if self.lmsSession:
-                await self.lmsSession.close()
-                self.lmsSession = None
+            # 중단된 경우 남은 작업 취소
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self._releaseLmsSession()
 
-    async def getCourseDetail(self, courseCode: str):
+    async def getCourseDetail(
+        self,
+        courseCode: str,
+        include: set[str] | None = None,
+        assignmentDetail: bool = True,
+        knownNotices: set[str] | None = None,
+    ):
         """
         특정 강좌의 데이터를 스크래핑합니다.
 
+        강좌 목록을 거치지 않고 강좌 페이지에서 바로 시작하며,
+        강좌 정보(제목, 담당 교수 등)는 공지사항, 활동, 출석 스크래핑과 동시에 추출합니다.
+
         Parameters:
             courseCode: 강좌 코드
+            include: 추출 항목 (LMS_COURSE_FIELDS), 미지정 시 모든 항목
+            assignmentDetail: 과제 상세 정보 추출 여부
+            knownNotices: 클라이언트가 이미 가진 공지사항 식별값
 
         Returns:
             course: 강좌 데이터
         """
         try:
-            courses = await self._getCourseList(close=False)
-            course = next(
-                (course for course in courses if course["code"] == courseCode), None
+            course = {
+                "link": LMS_COURSE_PAGE_URL.format(courseCode),
+                "code": courseCode,
+            }
+
+            # 강좌 정보, 강좌 데이터 동시 스크래핑
+            header, course = await asyncio.gather(
+                self._getCourseHeader(courseCode=courseCode),
+                self._getCourseData(
+                    course,
+                    include=include,
+                    assignmentDetail=assignmentDetail,
+                    knownNotices=knownNotices,
+                ),
+                return_exceptions=True,
             )
-            if not course:
-                raise ExtractorException(errorType=ErrorType.COURSE_NOT_EXIST)
 
-            course = await self._getCourseData(course)
+            # 강좌 미존재 등 강좌 정보 예외 우선 처리
+            if isinstance(header, BaseException):
+                raise header
+            if isinstance(course, BaseException):
+                raise course
+
             response = {
-                "title": course["title"],
+                "title": header["title"],
                 "link": course["link"],
-                "identifier": course["identifier"],
+                "identifier": header["identifier"],
                 "code": course["code"],
-                "professor": course["professor"],
+                "professor": header["professor"],
                 "noticeCode": course.get("noticeCode"),
                 "notices": course.get("notices", []),
                 "activities": course.get("activities", []),
@@ -94,50 +193,65 @@ class Extractor(KutisExtractor, LmsExtractor):
             raise ExtractorException(errorType=ErrorType.SYSTEM_ERROR) from e
 
         finally:
-            if self.lmsSession:
-                await self.lmsSession.close()
-                self.lmsSession = None
+            await self._releaseLmsSession()
 
-    async def _getCourseData(self, course: dict) -> dict:
+    async def _getCourseData(
+        self,
+        course: dict,
+        include: set[str] | None = None,
+        assignmentDetail: bool = True,
+        knownNotices: set[str] | None = None,
+    ) -> dict:
         """
         해당 강좌의 데이터를 스크래핑합니다.
 
+        추출 항목에서 제외된 데이터는 요청하지 않으며, 결과에도 포함하지 않습니다.
+        출석 정보는 활동 데이터에 병합되므로 활동 항목이 포함된 경우에만 요청합니다.
+        (활동 없이 출석만 요청하는 경우는 CourseFieldsField에서 거절합니다.)
+
         Parameters:
             course: 강좌 정보
+            include: 추출 항목 (LMS_COURSE_FIELDS), 미지정 시 모든 항목
+            assignmentDetail: 과제 상세 정보 추출 여부
+            knownNotices: 클라이언트가 이미 가진 공지사항 식별값
 
         Returns:
             course: 스크래핑 데이터 추가된 강좌 정보
         """
         try:
             # 페이지 요청
-            content = await self._lmsFetch(course["link"])
+            content = await self._lmsFetch(course["link"], profile="course")
 
             # 접근 권한 검증
-            container = content.find("div", class_="course-content")
-            alert = container.find("div", class_="alert")
-            if alert:
+            if CourseHomeSchema.extract(content)["content"]["alert"]:
                 return course
 
             # 공지사항 URL 및 게시판 코드 추출
-            noticeUrl = (
-                content.find("li", id="section-0")
-                .find("li", class_="activity")
-                .find("a")
-                .get("href")
-            )
+            noticeUrl = CourseNoticeLinkSchema.extract(content)["link"]
             noticeBoardCode = Utils.extractCodeFromUrl(url=noticeUrl, paramName="id")
 
-            # 공지사항, 활동, 출석 비동기 작업 생성 및 실행
-            noticeTask = self.getCourseNotice(boardCode=noticeBoardCode, close=False)
-            activityTask = self.getCourseActivites(
-                courseCode=course["code"], close=False
-            )
-            attendanceTask = self.getLectureAttendance(
-                courseCode=course["code"], close=False
-            )
-            noticeData, activityData, attendanceData = await asyncio.gather(
-                noticeTask, activityTask, attendanceTask
-            )
+            # 추출 항목별 공지사항, 활동, 출석 비동기 작업 생성 및 실행
+            if include is None:
+                include = set(LMS_COURSE_FIELDS)
+
+            tasks = {}
+            if "notices" in include:
+                tasks["notices"] = self.getCourseNotice(
+                    boardCode=noticeBoardCode, close=False, knownNotices=knownNotices
+                )
+            if "activities" in include:
+                tasks["activities"] = self.getCourseActivites(
+                    courseCode=course["code"],
+                    close=False,
+                    assignmentDetail=assignmentDetail,
+                )
+                if "attendance" in include:
+                    tasks["attendance"] = self.getLectureAttendance(
+                        courseCode=course["code"], close=False
+                    )
+            results = dict(zip(tasks, await asyncio.gather(*tasks.values())))
+            activityData = results.get("activities")
+            attendanceData = results.get("attendance")
 
             # 추출된 데이터 병합
             if attendanceData is not None:
@@ -162,13 +276,11 @@ class Extractor(KutisExtractor, LmsExtractor):
                                 activity["attendance"] = False
 
             # 추출된 데이터 추가
-            course.update(
-                {
-                    "noticeCode": noticeBoardCode,
-                    "notices": noticeData,
-                    "activities": activityData,
-                }
-            )
+            course["noticeCode"] = noticeBoardCode
+            if "notices" in results:
+                course["notices"] = results["notices"]
+            if "activities" in results:
+                course["activities"] = activityData
 
             return course
 
@@ -0,0 +1 @@
+from .queue import Job, JobQueue, JobStatus, jobQueue
@@ -0,0 +1,300 @@
+import asyncio
+import secrets
+import sys
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Awaitable, Callable, Hashable
+
+from Scrape.extractor.admission import AdmissionController, admission
+from Scrape.extractor.cache import LruCache
+from Scrape.extractor.exception import ErrorType, ExtractorException
+from Scrape.extractor.metrics import metrics
+from Scrape.extractor.settings import getSetting
+from Scrape.extractor.store import JobStore, jobStore
+
+# 작업 실행 기본값
+JOB_WORKERS = 4
+JOB_QUEUE_SIZE = 100
+JOB_TTL = 60 * 10
+JOB_MAX_RESULTS = 1000
+
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+# 결과 조회 후 제거하는 작업 상태
+FINISHED_STATUSES = (JobStatus.DONE.value, JobStatus.FAILED.value)
+
+
+@dataclass
+class Job:
+    """
+    비동기 추출 작업입니다.
+
+    실행 중에는 완료된 부분 결과가 partial에 누적되며, 완료 후 result에 최종 결과가 저장됩니다.
+    실패한 작업은 실패 전까지 완료된 부분 결과를 유지합니다.
+    """
+
+    run: Callable[["Job"], Awaitable[Any]] | None = field(default=None, repr=False)
+    # 승인 제어기의 학생별 한도에 사용할 인증 정보 키
+    credentialKey: Hashable | None = field(default=None, repr=False)
+    id: str = field(default_factory=lambda: secrets.token_urlsafe(16))
+    status: JobStatus = JobStatus.PENDING
+    partial: list = field(default_factory=list)
+    result: Any = None
+    error: ExtractorException | None = None
+    createdAt: float = field(default_factory=time.time)
+    finishedAt: float | None = None
+    # 저장소에 기록된 상태의 순서
+    version: int = field(default=0, repr=False)
+    # 최종 상태 기록 전 결과가 조회되었는지 여부
+    fetched: bool = field(default=False, repr=False)
+
+    def toDict(self) -> dict:
+        """
+        작업 상태를 응답 객체로 변환합니다.
+
+        Returns:
+            job: 작업 상태
+        """
+        return {
+            "jobId": self.id,
+            "status": self.status.value,
+            "partial": list(self.partial),
+            "result": self.result,
+            "message": self.error.message if self.error else None,
+            "createdAt": self.createdAt,
+            "finishedAt": self.finishedAt,
+        }
+
+
+class JobQueue:
+    """
+    추출 작업을 대기열에 등록하고, 제한된 수의 작업자가 순서대로 실행하는 작업 큐입니다.
+
+    작업자는 별도의 이벤트 루프가 아닌, 작업을 등록한 요청을 처리하는 서버의 이벤트 루프에서 실행되므로
+    요청 처리와 같은 커넥터, 세션 풀을 공유합니다.
+    작업은 실행 시점에 승인 제어기의 실행 슬롯을 할당받으므로 요청 처리와 같은 동시 실행 한도를 따릅니다.
+    대기열이 가득 차면 작업을 등록하지 않습니다.
+
+    작업 상태와 부분 결과, 최종 결과는 바뀔 때마다 작업 저장소에 기록하므로,
+    작업을 등록하지 않은 워커 프로세스에서도 조회할 수 있습니다.
+    완료된 작업의 결과는 한 번 조회되면 제거되며, 조회되지 않더라도 TTL이 지나면 제거됩니다.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        maxSize: int,
+        ttl: float,
+        maxResults: int,
+        store: JobStore | None = None,
+        admission: AdmissionController | None = None,
+    ):
+        self.workers: int = workers
+        self.maxSize: int = maxSize
+        self.ttl: float = ttl
+        self.store: JobStore | None = store
+        self.admission: AdmissionController | None = admission
+
+        # 대기 및 실행 중인 작업
+        self._active: dict[str, Job] = {}
+        # 완료된 작업
+        self._finished = LruCache(maxSize=maxResults, ttl=ttl)
+
+        self._queue: asyncio.Queue | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._workers: set[asyncio.Task] = set()
+
+    async def submit(
+        self,
+        run: Callable[[Job], Awaitable[Any]],
+        credentialKey: Hashable | None = None,
+    ) -> Job:
+        """
+        작업을 대기열에 등록합니다.
+
+        Parameters:
+            run: 작업을 받아 최종 결과를 반환하는 코루틴 함수
+            credentialKey: 인증 정보 키, 지정 시 실행 시점에 승인 제어기의 실행 슬롯을 할당받음
+
+        Returns:
+            job: 등록된 작업
+        """
+        self._ensureWorkers()
+
+        job = Job(run=run, credentialKey=credentialKey)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            metrics.increment("job.rejected")
+            raise ExtractorException(errorType=ErrorType.JOB_QUEUE_FULL)
+
+        self._active[job.id] = job
+        metrics.increment("job.submitted")
+        await self._save(job)
+        return job
+
+    async def addPartial(self, job: Job, value: Any):
+        """
+        작업의 부분 결과를 추가하고 저장소에 기록합니다.
+
+        Parameters:
+            job: 작업
+            value: 완료된 부분 결과
+        """
+        job.partial.append(value)
+        await self._save(job)
+
+    async def get(self, jobId: str) -> dict | None:
+        """
+        작업 상태를 조회합니다.
+
+        현재 워커 프로세스에서 등록한 작업이 아니라면 작업 저장소에서 조회합니다.
+        완료된 작업은 결과를 반환한 뒤 메모리와 작업 저장소에서 제거합니다.
+
+        Parameters:
+            jobId: 작업 ID
+
+        Returns:
+            job: 작업 상태, 없거나 만료되었다면 None
+        """
+        job: Job | None = self._active.get(jobId)
+        if job is not None:
+            if job.status.value in FINISHED_STATUSES:
+                # 최종 상태 기록이 끝나면 제거
+                job.fetched = True
+                metrics.increment("job.fetched")
+            return job.toDict()
+
+        job = self._finished.get(jobId)
+        if job is not None:
+            self._finished.delete(jobId)
+            value = job.toDict()
+        elif self.store is not None:
+            value = await self.store.get(jobId)
+            if value is None or value["status"] not in FINISHED_STATUSES:
+                return value
+        else:
+            return None
+
+        if self.store is not None:
+            await self.store.delete(jobId)
+        metrics.increment("job.fetched")
+        return value
+
+    def stats(self) -> dict:
+        """
+        작업 큐 상태를 반환합니다.
+        """
+        return {
+            "pending": self._queue.qsize() if self._queue else 0,
+            "active": len(self._active),
+            "finished": len(self._finished),
+        }
+
+    def _ensureWorkers(self):
+        """
+        현재 이벤트 루프에 대기열과 작업자를 생성합니다.
+
+        이벤트 루프가 바뀌었다면 이전 루프의 대기열과 작업자는 사용하지 않습니다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.maxSize)
+            self._workers = set()
+
+        # 종료된 작업자 보충
+        self._workers = {worker for worker in self._workers if not worker.done()}
+        while len(self._workers) < self.workers:
+            self._workers.add(loop.create_task(self._work(self._queue)))
+
+    async def _work(self, queue: asyncio.Queue):
+        while True:
+            job: Job = await queue.get()
+            try:
+                await self._execute(job)
+            finally:
+                queue.task_done()
+
+    async def _save(self, job: Job):
+        """
+        작업 상태를 저장소에 기록합니다.
+
+        기록할 상태와 버전은 호출 시점에 확정되므로, 기록 순서가 바뀌어도 최신 상태가 유지됩니다.
+        """
+        if self.store is None:
+            return
+
+        job.version += 1
+        await self.store.set(
+            jobId=job.id, version=job.version, value=job.toDict(), ttl=self.ttl
+        )
+
+    async def _execute(self, job: Job):
+        job.status = JobStatus.RUNNING
+        await self._save(job)
+        startTime = time.perf_counter()
+        try:
+            if self.admission is not None and job.credentialKey is not None:
+                async with self.admission.slot(job.credentialKey):
+                    job.result = await job.run(job)
+            else:
+                job.result = await job.run(job)
+            job.status = JobStatus.DONE
+            # 최종 결과에 포함된 부분 결과 정리
+            job.partial = []
+            metrics.increment("job.done")
+
+        except ExtractorException as e:
+            job.error = e
+            job.status = JobStatus.FAILED
+            metrics.increment("job.failed")
+            await asyncio.to_thread(e.logError, excInfo=sys.exc_info())
+        except Exception as e:
+            job.error = ExtractorException(
+                errorType=ErrorType.SYSTEM_ERROR, message=str(e)
+            )
+            job.status = JobStatus.FAILED
+            metrics.increment("job.failed")
+            await asyncio.to_thread(job.error.logError, excInfo=sys.exc_info())
+
+        finally:
+            job.finishedAt = time.time()
+            # 인증 정보를 참조하는 실행 함수 해제
+            job.run = None
+            job.credentialKey = None
+            metrics.increment("job.seconds", time.perf_counter() - startTime)
+
+            # 최종 상태를 기록한 뒤 완료된 작업으로 이동
+            await self._save(job)
+            self._active.pop(job.id, None)
+
+            if job.fetched:
+                # 기록 중 조회된 결과 제거
+                if self.store is not None:
+                    await self.store.delete(job.id)
+            else:
+                # 완료된 작업은 조회되거나 TTL이 지날 때까지 보관
+                self._finished.set(job.id, job)
+
+            if self.store is not None:
+                await self.store.purge()
+
+
+jobQueue = JobQueue(
+    workers=getSetting("EXTRACTOR_JOB_WORKERS", JOB_WORKERS),
+    maxSize=getSetting("EXTRACTOR_JOB_QUEUE_SIZE", JOB_QUEUE_SIZE),
+    ttl=getSetting("EXTRACTOR_JOB_TTL", JOB_TTL),
+    maxResults=getSetting("EXTRACTOR_JOB_MAX_RESULTS", JOB_MAX_RESULTS),
+    store=jobStore,
+    admission=admission,
+)
+
+metrics.registerGauge("job", jobQueue.stats)
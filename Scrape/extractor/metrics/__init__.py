@@ -0,0 +1 @@
+from .registry import Metrics, metrics
@@ -0,0 +1,61 @@
+import threading
+from collections import defaultdict
+from typing import Any, Callable
+
+
+class Metrics:
+    """
+    워커 프로세스 단위의 스크래핑 지표를 수집하는 클래스입니다.
+
+    카운터는 누적 값을, 게이지는 조회 시점에 콜백으로 계산한 값을 제공합니다.
+    """
+
+    def __init__(self):
+        self._counters: dict[str, float] = defaultdict(int)
+        self._gauges: dict[str, Callable[[], Any]] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: float = 1):
+        """
+        카운터 값을 증가시킵니다.
+
+        Parameters:
+            name: 지표 이름
+            value: 증가량
+        """
+        with self._lock:
+            self._counters[name] += value
+
+    def get(self, name: str) -> float:
+        """
+        카운터 값을 반환합니다.
+
+        Parameters:
+            name: 지표 이름
+        """
+        return self._counters.get(name, 0)
+
+    def registerGauge(self, name: str, callback: Callable[[], Any]):
+        """
+        조회 시점에 값을 계산하는 게이지를 등록합니다.
+
+        Parameters:
+            name: 지표 이름
+            callback: 게이지 값을 반환하는 함수
+        """
+        self._gauges[name] = callback
+
+    def snapshot(self) -> dict:
+        """
+        현재 수집된 모든 지표를 반환합니다.
+
+        Returns:
+            snapshot: 카운터 및 게이지 값
+        """
+        with self._lock:
+            counters = dict(self._counters)
+        gauges = {name: callback() for name, callback in self._gauges.items()}
+        return {"counters": counters, "gauges": gauges}
+
+
+metrics = Metrics()
@@ -0,0 +1,4 @@
+from .executor import parseDocument, parseStream
+from .node import Node
+from .profile import ParseProfile
+from .selector import Selector
@@ -0,0 +1,150 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncGenerator, Callable
+
+from Scrape.extractor.metrics import metrics
+from Scrape.extractor.parser.lxml_backend import LxmlDocumentStream, parseLxml
+from Scrape.extractor.parser.node import Node
+from Scrape.extractor.parser.profile import ParseProfile
+from Scrape.extractor.parser.soup_backend import parseSoup
+from Scrape.extractor.settings import getSetting
+
+# 파싱 실행 방식 기본값
+PARSE_EXECUTOR = "thread"
+PARSE_WORKERS = 4
+PARSE_BACKEND = "lxml"
+PARSE_STREAMING = False
+
+# 파싱 백엔드
+BACKENDS = {
+    "lxml": parseLxml,
+    "bs4": parseSoup,
+}
+
+# 증분 파싱을 지원하는 파싱 백엔드
+STREAM_BACKENDS = {
+    "lxml": LxmlDocumentStream,
+}
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def _getExecutor() -> ThreadPoolExecutor | None:
+    """
+    설정된 파싱 실행기를 반환합니다.
+
+    EXTRACTOR_PARSE_EXECUTOR 설정이 "inline"이면 이벤트 루프에서 직접 파싱합니다.
+    """
+    global _executor
+
+    if getSetting("EXTRACTOR_PARSE_EXECUTOR", PARSE_EXECUTOR) == "inline":
+        return None
+
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=getSetting("EXTRACTOR_PARSE_WORKERS", PARSE_WORKERS),
+            thread_name_prefix="extractor-parser",
+        )
+    return _executor
+
+
+def _parse(data: bytes, encoding: str | None, profile: ParseProfile | None) -> Node:
+    backend = BACKENDS[getSetting("EXTRACTOR_PARSE_BACKEND", PARSE_BACKEND)]
+
+    startTime = time.perf_counter()
+    content = backend(data, encoding, profile)
+    metrics.increment("parser.seconds", time.perf_counter() - startTime)
+    metrics.increment("parser.documents")
+    return content
+
+
+async def parseDocument(
+    data: bytes, encoding: str | None = None, profile: ParseProfile | None = None
+) -> Node:
+    """
+    HTML 문서를 파싱 실행기에서 Node 객체로 변환합니다.
+
+    파싱이 이벤트 루프를 막지 않으므로, 같은 gather의 다른 요청이 네트워크 I/O를 계속 진행할 수 있습니다.
+    파싱 백엔드는 EXTRACTOR_PARSE_BACKEND 설정("lxml" 또는 "bs4")으로 선택합니다.
+
+    Parameters:
+        data: HTML 문서
+        encoding: 문서 인코딩, 미지정 시 문서에서 감지
+        profile: 부분 파싱 설정, 미지정 시 전체 문서 파싱
+
+    Returns:
+        content: 문서 요소
+    """
+    executor = _getExecutor()
+    if executor is None:
+        return _parse(data, encoding, profile)
+    return await asyncio.get_running_loop().run_in_executor(
+        executor, _parse, data, encoding, profile
+    )
+
+
+async def parseStream(
+    chunks: AsyncGenerator[bytes, None], encoding: str | None, profile: ParseProfile
+) -> Node:
+    """
+    본문 조각을 받는 동안 증분 파싱하여 Node 객체로 변환합니다.
+
+    부분 파싱 설정의 모든 규칙에 맞는 요소가 닫히면 나머지 본문을 읽지 않고 반환합니다.
+    조각 파싱은 parseDocument와 같은 파싱 실행기에서 순서대로 수행하므로 이벤트 루프를 막지 않습니다.
+    EXTRACTOR_PARSE_STREAMING 설정이 꺼져 있거나(기본값) 백엔드가 증분 파싱을 지원하지 않으면
+    본문을 모두 받은 뒤 parseDocument로 파싱합니다.
+
+    Parameters:
+        chunks: 본문 조각 비동기 제너레이터
+        encoding: 문서 인코딩
+        profile: 부분 파싱 설정
+
+    Returns:
+        content: 문서 요소
+    """
+    streamClass = STREAM_BACKENDS.get(
+        getSetting("EXTRACTOR_PARSE_BACKEND", PARSE_BACKEND)
+    )
+    if streamClass is None or not getSetting(
+        "EXTRACTOR_PARSE_STREAMING", PARSE_STREAMING
+    ):
+        data = b"".join([chunk async for chunk in chunks])
+        return await parseDocument(data, encoding=encoding, profile=profile)
+
+    executor = _getExecutor()
+    loop = asyncio.get_running_loop()
+
+    async def run(function: Callable, *args) -> tuple:
+        if executor is None:
+            return _timed(function, *args)
+        return await loop.run_in_executor(executor, _timed, function, *args)
+
+    stream = streamClass(encoding=encoding, profile=profile)
+    parseTime = 0.0
+    try:
+        async for chunk in chunks:
+            done, seconds = await run(stream.feed, chunk)
+            parseTime += seconds
+            if done:
+                break
+
+        content, seconds = await run(stream.close)
+        parseTime += seconds
+
+    finally:
+        await chunks.aclose()
+
+    metrics.increment("parser.seconds", parseTime)
+    metrics.increment("parser.documents")
+    metrics.increment("parser.streamed")
+    return content
+
+
+def _timed(function: Callable, *args) -> tuple:
+    """
+    함수를 실행하고 (결과, 실행 시간)을 반환합니다.
+    """
+    startTime = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - startTime
@@ -0,0 +1,360 @@
+import re
+import threading
+from typing import Iterable
+
+from lxml import etree, html
+
+from Scrape.extractor.parser.node import TEXTLESS_TAGS, AttrValue, Node, TagName
+from Scrape.extractor.parser.profile import ParseProfile, matchRule
+from Scrape.extractor.parser.selector import Selector
+
+# 파서는 스레드 간 공유할 수 없으므로 스레드별로 생성
+_parsers = threading.local()
+
+# 검색 조건별 컴파일된 XPath 캐시
+_expressions: dict[tuple, etree.XPath] = {}
+
+# 공백만 있는 텍스트를 축약하지 않는 요소
+PRESERVE_WHITESPACE_TAGS = frozenset({"pre", "textarea"})
+
+# HTML 공백 문자
+ASCII_SPACES = " \n\t\f\r"
+
+
+class LxmlNode(Node):
+    """
+    lxml.html 요소를 감싼 Node 구현입니다.
+
+    요소 검색은 검색 조건별로 한 번 컴파일한 XPath로 처리합니다.
+    """
+
+    __slots__ = ("element",)
+
+    def __init__(self, element: html.HtmlElement):
+        self.element: html.HtmlElement = element
+
+    @property
+    def name(self) -> str:
+        return self.element.tag
+
+    def get(self, attr: str, default: str | None = None) -> str | None:
+        return self.element.get(attr, default)
+
+    def find(self, name: TagName = None, **attrs: AttrValue) -> Node | None:
+        patterns = _patterns(attrs)
+        if patterns:
+            elements = self._select(name, attrs, first=False)
+            element = next(
+                (element for element in elements if _matches(element, patterns)), None
+            )
+        else:
+            elements = self._select(name, attrs, first=True)
+            element = elements[0] if elements else None
+        return LxmlNode(element) if element is not None else None
+
+    def findAll(self, name: TagName = None, **attrs: AttrValue) -> list[Node]:
+        patterns = _patterns(attrs)
+        return [
+            LxmlNode(element)
+            for element in self._select(name, attrs, first=False)
+            if not patterns or _matches(element, patterns)
+        ]
+
+    def select(self, selector: Selector) -> list[Node]:
+        return [LxmlNode(element) for element in selector.xpath(self.element)]
+
+    def selectOne(self, selector: Selector) -> Node | None:
+        elements = selector.firstXpath(self.element)
+        return LxmlNode(elements[0]) if elements else None
+
+    def strings(
+        self, recursive: bool = True, lineBreak: str | None = None
+    ) -> Iterable[str]:
+        root = self.element
+        preserve = self._preservesWhitespace()
+        if root.text:
+            yield _collapse(root.text, preserve)
+
+        if not recursive:
+            for child in root:
+                if lineBreak is not None and child.tag == "br":
+                    yield lineBreak
+                if child.tail:
+                    yield _collapse(child.tail, preserve)
+            return
+
+        # 재귀 없이 하위 요소 순회 (요소 텍스트 -> 하위 요소 -> tail 순서)
+        stack = [(root, iter(root), preserve)]
+        while stack:
+            element, children, preserve = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                if element is not root and element.tail:
+                    yield _collapse(element.tail, stack[-1][2])
+                continue
+
+            tag = child.tag
+            if isinstance(tag, str) and tag not in TEXTLESS_TAGS:
+                if lineBreak is not None and tag == "br":
+                    yield lineBreak
+                childPreserve = preserve or tag in PRESERVE_WHITESPACE_TAGS
+                if child.text:
+                    yield _collapse(child.text, childPreserve)
+                stack.append((child, iter(child), childPreserve))
+                continue
+
+            # 주석, 스크립트 등은 tail만 포함
+            if child.tail:
+                yield _collapse(child.tail, preserve)
+
+    def walk(self) -> Iterable[tuple[str, str]]:
+        root = self.element
+        preserve = self._preservesWhitespace()
+        if root.text:
+            yield "text", _collapse(root.text, preserve)
+
+        stack = [(root, iter(root), preserve)]
+        while stack:
+            element, children, preserve = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                if element is not root:
+                    yield "end", element.tag
+                    if element.tail:
+                        yield "text", _collapse(element.tail, stack[-1][2])
+                continue
+
+            tag = child.tag
+            if isinstance(tag, str) and tag not in TEXTLESS_TAGS:
+                yield "start", tag
+                childPreserve = preserve or tag in PRESERVE_WHITESPACE_TAGS
+                if child.text:
+                    yield "text", _collapse(child.text, childPreserve)
+                stack.append((child, iter(child), childPreserve))
+                continue
+
+            # 주석, 스크립트 등은 tail만 포함
+            if child.tail:
+                yield "text", _collapse(child.tail, preserve)
+
+    def remove(self):
+        self.element.drop_tree()
+
+    def prettify(self) -> str:
+        return html.tostring(self.element, encoding="unicode", pretty_print=True)
+
+    def _preservesWhitespace(self) -> bool:
+        """
+        요소가 공백을 그대로 유지하는 요소(pre, textarea)이거나 그 하위 요소인지 여부입니다.
+        """
+        element = self.element
+        return element.tag in PRESERVE_WHITESPACE_TAGS or any(
+            ancestor.tag in PRESERVE_WHITESPACE_TAGS
+            for ancestor in element.iterancestors()
+        )
+
+    def _select(self, name: TagName, attrs: dict, first: bool) -> list:
+        keys = tuple(
+            (key, isinstance(value, re.Pattern)) for key, value in attrs.items()
+        )
+        expression = _compile(name, keys, first)
+        variables = {
+            f"v{index}": value
+            for index, value in enumerate(attrs.values())
+            if isinstance(value, str)
+        }
+        return expression(self.element, **variables)
+
+
+def _collapse(text: str, preserve: bool) -> str:
+    """
+    공백 문자로만 이루어진 텍스트를 BeautifulSoup과 같이 줄바꿈 또는 공백 하나로 축약합니다.
+    """
+    if preserve or text.strip(ASCII_SPACES):
+        return text
+    return "\n" if "\n" in text else " "
+
+
+def _compile(
+    name: TagName, keys: tuple[tuple[str, bool], ...], first: bool
+) -> etree.XPath:
+    """
+    검색 조건을 XPath로 컴파일합니다.
+
+    속성 값은 XPath 변수로 전달하므로, 같은 태그와 속성 이름의 조건은 하나의 XPath를 공유합니다.
+    정규식 조건은 속성 존재 여부만 XPath로 검사하고, 값은 별도로 검사합니다.
+    """
+    names = (name,) if name is None or isinstance(name, str) else tuple(name)
+    cacheKey = (names, keys, first)
+
+    expression = _expressions.get(cacheKey)
+    if expression is None:
+        # 태그 조건
+        if names == (None,):
+            path = ".//*"
+        elif len(names) == 1:
+            path = f".//{names[0]}"
+        else:
+            path = ".//*[{}]".format(" or ".join(f"self::{tag}" for tag in names))
+
+        # 속성 조건
+        for index, (key, isPattern) in enumerate(keys):
+            attr = "class" if key == "class_" else key
+            if isPattern:
+                path += f"[@{attr}]"
+            elif attr == "class":
+                path += (
+                    f"[contains(concat(' ', normalize-space(@class), ' '),"
+                    f" concat(' ', $v{index}, ' '))]"
+                )
+            else:
+                path += f"[@{attr} = $v{index}]"
+
+        if first:
+            path = f"({path})[1]"
+
+        expression = _expressions[cacheKey] = etree.XPath(path)
+    return expression
+
+
+def _patterns(attrs: dict) -> list[tuple[str, re.Pattern]]:
+    return [
+        ("class" if key == "class_" else key, value)
+        for key, value in attrs.items()
+        if isinstance(value, re.Pattern)
+    ]
+
+
+def _matches(element: html.HtmlElement, patterns: list[tuple[str, re.Pattern]]) -> bool:
+    for attr, pattern in patterns:
+        value = element.get(attr)
+        if value is None or not pattern.search(value):
+            return False
+    return True
+
+
+def _getParser(encoding: str | None) -> html.HTMLParser:
+    """
+    현재 스레드에서 사용할 인코딩별 HTML 파서를 반환합니다.
+
+    지원하지 않는 인코딩이라면 문서의 meta 선언으로 인코딩을 감지하는 파서를 반환합니다.
+    """
+    parsers: dict[str | None, html.HTMLParser] | None = getattr(
+        _parsers, "parsers", None
+    )
+    if parsers is None:
+        parsers = _parsers.parsers = {}
+
+    parser = parsers.get(encoding)
+    if parser is None:
+        try:
+            parser = html.HTMLParser(recover=True, encoding=encoding)
+        except LookupError:
+            return _getParser(None)
+        parsers[encoding] = parser
+    return parser
+
+
+def _prune(document: html.HtmlElement, profile: ParseProfile) -> html.HtmlElement:
+    """
+    부분 파싱 설정의 규칙에 맞는 하위 트리만 새 문서로 옮깁니다.
+
+    나머지 트리는 참조가 사라져 해제되므로, 캐시된 문서가 차지하는 메모리가 줄어듭니다.
+    """
+    root = html.Element("html")
+    kept = set()
+    for element in profile.xpath(document):
+        # 이미 포함된 하위 트리의 요소 제외
+        if any(ancestor in kept for ancestor in element.iterancestors()):
+            continue
+        kept.add(element)
+        element.tail = None
+        root.append(element)
+    return root
+
+
+def parseLxml(
+    data: bytes, encoding: str | None = None, profile: ParseProfile | None = None
+) -> LxmlNode:
+    """
+    HTML 문서를 lxml.html로 파싱합니다.
+
+    바이트 문서를 그대로 전달하므로, 디코딩은 파서 내부에서 한 번만 수행됩니다.
+    부분 파싱 설정이 주어지면 규칙에 맞는 하위 트리만 남깁니다.
+    lxml은 C 수준에서 전체 트리를 만드는 것이 Python 수준 필터보다 빠르므로, 파싱 후 정리합니다.
+
+    Parameters:
+        data: HTML 문서
+        encoding: 문서 인코딩, 미지정 시 문서에서 감지
+        profile: 부분 파싱 설정
+
+    Returns:
+        content: 문서 요소
+    """
+    document = html.document_fromstring(data, parser=_getParser(encoding))
+    if profile:
+        document = _prune(document, profile)
+    return LxmlNode(document)
+
+
+class LxmlDocumentStream:
+    """
+    응답 본문을 조각 단위로 받아 파싱하는 증분 파서입니다.
+
+    부분 파싱 설정의 모든 규칙에 맞는 첫 번째 요소가 닫히면 파싱을 완료할 수 있으므로,
+    나머지 본문(하단 스크립트, 푸터 등)을 받지 않고 추출을 시작할 수 있습니다.
+    """
+
+    def __init__(self, encoding: str | None, profile: ParseProfile):
+        self.profile: ParseProfile = profile
+
+        try:
+            self._parser = etree.HTMLPullParser(
+                events=("end",), tag=profile.tags, encoding=encoding, recover=True
+            )
+        except LookupError:
+            self._parser = etree.HTMLPullParser(
+                events=("end",), tag=profile.tags, recover=True
+            )
+        self._parser.set_element_class_lookup(html.HtmlElementClassLookup())
+
+        # 아직 닫힌 요소가 없는 규칙
+        self._pending: list = list(profile.rules)
+
+    @property
+    def done(self) -> bool:
+        """
+        모든 규칙의 첫 번째 요소가 닫혔는지 여부입니다.
+        """
+        return not self._pending
+
+    def feed(self, data: bytes) -> bool:
+        """
+        본문 조각을 파싱합니다.
+
+        Parameters:
+            data: 본문 조각
+
+        Returns:
+            done: 모든 규칙의 첫 번째 요소가 닫혔는지 여부
+        """
+        self._parser.feed(data)
+        for _, element in self._parser.read_events():
+            self._pending = [
+                rule
+                for rule in self._pending
+                if not matchRule(rule, element.tag, element.attrib)
+            ]
+        return self.done
+
+    def close(self) -> LxmlNode:
+        """
+        파싱을 종료하고, 규칙에 맞는 하위 트리만 남긴 문서를 반환합니다.
+
+        Returns:
+            content: 문서 요소
+        """
+        document = self._parser.close()
+        return LxmlNode(_prune(document, self.profile))
@@ -0,0 +1,180 @@
+import re
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+from Scrape.extractor.parser.selector import Selector
+
+# 텍스트 추출에서 제외되는 요소
+TEXTLESS_TAGS = frozenset(("script", "style", "template", "rt", "rp"))
+
+TagName = str | Iterable[str] | None
+AttrValue = str | re.Pattern
+
+
+class Node(ABC):
+    """
+    파싱 백엔드와 관계없이 사용하는 HTML 요소 인터페이스입니다.
+
+    추출기는 이 인터페이스만 사용하므로, 파싱 백엔드를 교체해도 추출 로직은 변경되지 않습니다.
+    요소 검색 조건은 BeautifulSoup의 find와 같이 태그 이름과 속성(class_, id 등)으로 지정합니다.
+    """
+
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """
+        요소의 태그 이름입니다.
+        """
+
+    @property
+    def classes(self) -> list[str]:
+        """
+        요소의 class 목록입니다.
+        """
+        return (self.get("class") or "").split()
+
+    @property
+    def text(self) -> str:
+        """
+        요소의 전체 텍스트입니다.
+        """
+        return self.getText()
+
+    @abstractmethod
+    def get(self, attr: str, default: str | None = None) -> str | None:
+        """
+        요소의 속성 값을 반환합니다.
+
+        Parameters:
+            attr: 속성 이름
+            default: 속성이 없는 경우 반환값
+
+        Returns:
+            value: 속성 값
+        """
+
+    def hasAttr(self, attr: str) -> bool:
+        """
+        요소에 속성이 존재하는지 확인합니다.
+
+        Parameters:
+            attr: 속성 이름
+        """
+        return self.get(attr) is not None
+
+    @abstractmethod
+    def find(self, name: TagName = None, **attrs: AttrValue) -> "Node | None":
+        """
+        조건에 맞는 첫 번째 하위 요소를 반환합니다.
+
+        Parameters:
+            name: 태그 이름 또는 태그 이름 목록
+            attrs: 속성 조건 (class는 class_로 지정, 정규식 사용 가능)
+
+        Returns:
+            node: 하위 요소, 없다면 None
+        """
+
+    @abstractmethod
+    def findAll(self, name: TagName = None, **attrs: AttrValue) -> list["Node"]:
+        """
+        조건에 맞는 모든 하위 요소를 문서 순서대로 반환합니다.
+
+        Parameters:
+            name: 태그 이름 또는 태그 이름 목록
+            attrs: 속성 조건 (class는 class_로 지정, 정규식 사용 가능)
+
+        Returns:
+            nodes: 하위 요소 목록
+        """
+
+    @abstractmethod
+    def select(self, selector: Selector) -> list["Node"]:
+        """
+        컴파일된 선택자에 맞는 모든 하위 요소를 문서 순서대로 반환합니다.
+
+        Parameters:
+            selector: 컴파일된 CSS 선택자
+
+        Returns:
+            nodes: 하위 요소 목록
+        """
+
+    @abstractmethod
+    def selectOne(self, selector: Selector) -> "Node | None":
+        """
+        컴파일된 선택자에 맞는 첫 번째 하위 요소를 반환합니다.
+
+        Parameters:
+            selector: 컴파일된 CSS 선택자
+
+        Returns:
+            node: 하위 요소, 없다면 None
+        """
+
+    @abstractmethod
+    def strings(
+        self, recursive: bool = True, lineBreak: str | None = None
+    ) -> Iterable[str]:
+        """
+        요소의 텍스트 조각을 문서 순서대로 반환합니다.
+
+        Parameters:
+            recursive: 하위 요소의 텍스트 포함 여부
+            lineBreak: 지정 시 br 요소 위치에 반환할 텍스트
+
+        Returns:
+            strings: 텍스트 조각
+        """
+
+    @abstractmethod
+    def walk(self) -> Iterable[tuple[str, str]]:
+        """
+        하위 요소를 문서 순서대로 한 번 순회하며 이벤트를 반환합니다.
+
+        이벤트는 ("start", 태그 이름), ("text", 텍스트), ("end", 태그 이름) 형태이며,
+        요소 자신의 start/end 이벤트는 포함하지 않습니다.
+        텍스트 이벤트는 getText에 포함되는 텍스트(주석, 스크립트 등 제외)만 반환합니다.
+
+        Returns:
+            events: 순회 이벤트
+        """
+
+    def getText(
+        self,
+        separator: str = "",
+        strip: bool = False,
+        recursive: bool = True,
+        lineBreak: str | None = None,
+    ) -> str:
+        """
+        요소의 텍스트를 추출합니다.
+
+        Parameters:
+            separator: 텍스트 조각 구분자
+            strip: 텍스트 조각 공백 제거 및 빈 조각 제외 여부
+            recursive: 하위 요소의 텍스트 포함 여부
+            lineBreak: 지정 시 br 요소 위치에 삽입할 텍스트
+
+        Returns:
+            text: 추출된 텍스트
+        """
+        strings = self.strings(recursive=recursive, lineBreak=lineBreak)
+        if strip:
+            strings = (string.strip() for string in strings)
+            strings = (string for string in strings if string)
+        return separator.join(strings)
+
+    @abstractmethod
+    def remove(self):
+        """
+        요소를 문서에서 제거합니다.
+        """
+
+    @abstractmethod
+    def prettify(self) -> str:
+        """
+        요소를 들여쓰기된 HTML 문자열로 변환합니다.
+        """
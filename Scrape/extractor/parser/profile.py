@@ -0,0 +1,78 @@
+from lxml import etree
+
+Rule = tuple[str, dict[str, str]]
+
+
+class ParseProfile:
+    """
+    문서에서 필요한 하위 트리만 남기는 부분 파싱 설정입니다.
+
+    규칙(태그 이름, 속성 조건)에 맞는 요소와 그 하위 요소만 문서에 포함되며,
+    나머지 요소(네비게이션, 사이드바, 스크립트 등)는 제외됩니다.
+    class 속성 조건은 class 목록에 값이 포함되어 있는지로 판단합니다.
+
+    스트리밍 파싱은 모든 규칙의 첫 번째 요소가 닫히면 나머지 문서를 읽지 않으므로,
+    추출기는 각 규칙에 맞는 첫 번째 요소만 사용해야 합니다.
+    """
+
+    def __init__(self, name: str, rules: tuple[Rule, ...]):
+        self.name: str = name
+        self.rules: tuple[Rule, ...] = rules
+        self.tags: tuple[str, ...] = tuple(sorted({tag for tag, _ in rules}))
+
+        # 규칙에 맞는 모든 요소를 문서 순서대로 선택하는 XPath
+        self.xpath = etree.XPath(" | ".join(_rulePath(rule) for rule in rules))
+
+    def __repr__(self) -> str:
+        return f"ParseProfile({self.name!r})"
+
+    def matches(self, name: str, attrs: dict[str, str] | None) -> bool:
+        """
+        요소가 규칙 중 하나에 맞는지 확인합니다.
+
+        Parameters:
+            name: 태그 이름
+            attrs: 요소 속성 (class는 공백으로 구분된 문자열)
+        """
+        return any(matchRule(rule, name, attrs) for rule in self.rules)
+
+
+def matchRule(rule: Rule, name: str, attrs: dict[str, str] | None) -> bool:
+    """
+    요소가 규칙에 맞는지 확인합니다.
+
+    Parameters:
+        rule: 규칙 (태그 이름, 속성 조건)
+        name: 태그 이름
+        attrs: 요소 속성 (class는 공백으로 구분된 문자열)
+    """
+    tag, conditions = rule
+    if tag != name:
+        return False
+
+    attrs = attrs or {}
+    for attr, value in conditions.items():
+        actual = attrs.get(attr)
+        if actual is None:
+            return False
+        if attr == "class":
+            if value not in actual.split():
+                return False
+        elif actual != value:
+            return False
+    return True
+
+
+def _rulePath(rule: Rule) -> str:
+    tag, conditions = rule
+    path = f"/descendant::{tag}"
+    for attr, value in conditions.items():
+        if attr == "class":
+            # 단순 포함 검사로 먼저 거른 뒤 class 목록 일치 검사
+            path += (
+                f"[contains(@class, '{value}')]"
+                f"[contains(concat(' ', normalize-space(@class), ' '), ' {value} ')]"
+            )
+        else:
+            path += f"[@{attr} = '{value}']"
+    return path
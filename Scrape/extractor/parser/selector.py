@@ -0,0 +1,102 @@
+import re
+
+import soupsieve
+from lxml import etree
+
+# 복합 선택자 구성 요소 (태그, #id, .class, [attr], [attr=value], :nth-of-type(n))
+_TOKEN = re.compile(
+    r"""
+    (?P<tag>[a-zA-Z][\w-]*|\*)
+    |\#(?P<id>[\w-]+)
+    |\.(?P<cls>[\w-]+)
+    |\[(?P<attr>[\w-]+)(?:=(?P<quote>["']?)(?P<value>[^\]"']*)(?P=quote))?\]
+    |:nth-of-type\((?P<nth>\d+)\)
+    """,
+    re.VERBOSE,
+)
+_COMBINATOR = re.compile(r"\s*(>)\s*|\s+")
+
+
+class Selector:
+    """
+    생성 시점에 컴파일되는 CSS 선택자입니다.
+
+    lxml 백엔드용 XPath와 BeautifulSoup 백엔드용 soupsieve 패턴으로 한 번 컴파일하며,
+    태그, #id, .class, [attr], [attr=value], :nth-of-type(n), 하위/자식 결합자와 쉼표 목록을 지원합니다.
+    선택 결과는 querySelectorAll과 같이 기준 요소의 하위 요소 중 선택자에 맞는 요소를 문서 순서대로 반환합니다.
+    """
+
+    def __init__(self, css: str):
+        self.css: str = css
+
+        expression = " | ".join(_toXPath(group) for group in css.split(","))
+        self.xpath = etree.XPath(expression)
+        self.firstXpath = etree.XPath(f"({expression})[1]")
+        self.pattern = soupsieve.compile(css)
+
+    def __repr__(self) -> str:
+        return f"Selector({self.css!r})"
+
+
+def _toXPath(css: str) -> str:
+    """
+    CSS 선택자를 XPath로 변환합니다.
+
+    마지막 복합 선택자부터 조상(하위 결합자) 또는 부모(자식 결합자) 조건을 중첩하여,
+    결합자로 연결된 조상 요소가 기준 요소 밖에 있어도 일치하도록 합니다.
+    """
+    css = css.strip()
+    compounds = []
+    combinators = []
+
+    position = 0
+    while True:
+        compound, position = _parseCompound(css, position)
+        compounds.append(compound)
+        if position >= len(css):
+            break
+
+        match = _COMBINATOR.match(css, position)
+        if not match or match.end() == position:
+            raise ValueError(f"Unsupported selector: {css!r}")
+        combinators.append("parent" if match.group(1) else "ancestor")
+        position = match.end()
+
+    expression = compounds[0]
+    for combinator, compound in zip(combinators, compounds[1:]):
+        expression = f"{compound}[{combinator}::{expression}]"
+    return f"descendant::{expression}"
+
+
+def _parseCompound(css: str, position: int) -> tuple[str, int]:
+    tag = "*"
+    predicates = []
+
+    start = position
+    while position < len(css):
+        match = _TOKEN.match(css, position)
+        if not match:
+            break
+        position = match.end()
+
+        if match.group("tag"):
+            tag = match.group("tag")
+        elif match.group("id"):
+            predicates.append(f"[@id = '{match.group('id')}']")
+        elif match.group("cls"):
+            predicates.append(
+                f"[contains(concat(' ', normalize-space(@class), ' '),"
+                f" ' {match.group('cls')} ')]"
+            )
+        elif match.group("nth"):
+            predicates.append(
+                f"[count(preceding-sibling::{tag}) = {int(match.group('nth')) - 1}]"
+            )
+        elif match.group("value") is not None and "=" in match.group(0):
+            predicates.append(f"[@{match.group('attr')} = '{match.group('value')}']")
+        else:
+            predicates.append(f"[@{match.group('attr')}]")
+
+    if position == start:
+        raise ValueError(f"Unsupported selector: {css!r}")
+    return tag + "".join(predicates), position
@@ -0,0 +1,139 @@
+from typing import Iterable
+
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+from bs4.filter import ElementFilter
+
+from Scrape.extractor.parser.node import AttrValue, Node, TagName
+from Scrape.extractor.parser.profile import ParseProfile
+from Scrape.extractor.parser.selector import Selector
+
+# get_text에 포함되는 문자열 유형
+TEXT_TYPES = (NavigableString, CData)
+
+
+class SoupNode(Node):
+    """
+    BeautifulSoup 요소를 감싼 Node 구현입니다.
+    """
+
+    __slots__ = ("element",)
+
+    def __init__(self, element: Tag):
+        self.element: Tag = element
+
+    @property
+    def name(self) -> str:
+        return self.element.name
+
+    def get(self, attr: str, default: str | None = None) -> str | None:
+        value = self.element.get(attr)
+        if value is None:
+            return default
+        # 다중 값 속성(class 등)은 원본 문자열로 변환
+        return " ".join(value) if isinstance(value, list) else value
+
+    def find(self, name: TagName = None, **attrs: AttrValue) -> Node | None:
+        element = self.element.find(_tagName(name), **attrs)
+        return SoupNode(element) if element is not None else None
+
+    def findAll(self, name: TagName = None, **attrs: AttrValue) -> list[Node]:
+        return [
+            SoupNode(element)
+            for element in self.element.find_all(_tagName(name), **attrs)
+        ]
+
+    def select(self, selector: Selector) -> list[Node]:
+        return [SoupNode(element) for element in selector.pattern.select(self.element)]
+
+    def selectOne(self, selector: Selector) -> Node | None:
+        element = selector.pattern.select_one(self.element)
+        return SoupNode(element) if element is not None else None
+
+    def strings(
+        self, recursive: bool = True, lineBreak: str | None = None
+    ) -> Iterable[str]:
+        children = self.element.descendants if recursive else self.element.children
+        for child in children:
+            if type(child) in TEXT_TYPES:
+                yield child
+            elif (
+                lineBreak is not None and isinstance(child, Tag) and child.name == "br"
+            ):
+                yield lineBreak
+
+    def walk(self) -> Iterable[tuple[str, str]]:
+        stack = [(None, iter(self.element.contents))]
+        while stack:
+            name, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                if name is not None:
+                    yield "end", name
+            elif isinstance(child, Tag):
+                yield "start", child.name
+                stack.append((child.name, iter(child.contents)))
+            elif type(child) in TEXT_TYPES:
+                yield "text", child
+
+    def getText(
+        self,
+        separator: str = "",
+        strip: bool = False,
+        recursive: bool = True,
+        lineBreak: str | None = None,
+    ) -> str:
+        if recursive and lineBreak is None:
+            return self.element.get_text(separator=separator, strip=strip)
+        return super().getText(
+            separator=separator, strip=strip, recursive=recursive, lineBreak=lineBreak
+        )
+
+    def remove(self):
+        self.element.extract()
+
+    def prettify(self) -> str:
+        return self.element.prettify()
+
+
+def _tagName(name: TagName) -> str | list[str] | None:
+    if name is None or isinstance(name, str):
+        return name
+    return list(name)
+
+
+class ProfileFilter(ElementFilter):
+    """
+    부분 파싱 설정의 규칙에 맞는 요소만 생성하는 BeautifulSoup 필터입니다.
+    """
+
+    def __init__(self, profile: ParseProfile):
+        self.profile: ParseProfile = profile
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        return self.profile.matches(name, attrs)
+
+    def allow_string_creation(self, string) -> bool:
+        return False
+
+
+def parseSoup(
+    data: bytes, encoding: str | None = None, profile: ParseProfile | None = None
+) -> SoupNode:
+    """
+    HTML 문서를 BeautifulSoup으로 파싱합니다.
+
+    부분 파싱 설정이 주어지면 규칙에 맞지 않는 요소는 객체를 생성하지 않습니다.
+
+    Parameters:
+        data: HTML 문서
+        encoding: 문서 인코딩, 미지정 시 문서에서 감지
+        profile: 부분 파싱 설정
+
+    Returns:
+        content: 문서 요소
+    """
+    parseOnly = ProfileFilter(profile) if profile else None
+    return SoupNode(
+        BeautifulSoup(data, "lxml", from_encoding=encoding, parse_only=parseOnly)
+    )
@@ -3,6 +3,20 @@ KUTIS_LOGIN_PAGE_URL = "https://kutis.kyonggi.ac.kr/webkutis/view/indexWeb.jsp"
 KUTIS_MAIN_PAGE_URL = "https://kutis.kyonggi.ac.kr/webkutis/view/main/mypage.jsp?flag=2"
 KUTIS_TIMETABLE_PAGE_URL = "https://kutis.kyonggi.ac.kr/webkutis/view/hs/wssu3/wssu330s.jsp?m_menu=wsco1s05&s_menu=wssu330s"
 
+KUTIS_SESSION_POOL_SIZE = 512
+KUTIS_SESSION_TTL = 60 * 20
+
+# 응답 헤더에 charset이 없는 경우의 문서 인코딩
+KUTIS_ENCODING = "utf-8"
+
+# 세션이 거부된 경우 200 응답으로 전달되는 로그인 페이지 이동 안내 (스크립트, meta refresh)
+KUTIS_LOGIN_REDIRECT_PATTERN = (
+    rb"(?:location(?:\.href)?\s*=|location\.replace\s*\(|http-equiv\s*=\s*[\"']?refresh)"
+    rb"[^<]{0,200}?indexWeb\.jsp"
+)
+# 로그인 페이지 이동 안내로 판단하는 최대 응답 크기 (일반 페이지 메뉴의 로그아웃 링크 제외)
+KUTIS_LOGIN_REDIRECT_MAX_SIZE = 4096
+
 LMS_LOGIN_URL = "https://lms.kyonggi.ac.kr/login/index.php"
 LMS_LOGIN_SUCCESS_URL = "https://lms.kyonggi.ac.kr/login/index.php?testsession="
 LMS_LOGIN_FAILURE_URL = "https://lms.kyonggi.ac.kr/login.php?errorcode=3"
@@ -19,9 +33,67 @@ LMS_ATTENDANCE_PAGE_URL = (
 LMS_BOARD_PAGE_URL = "https://lms.kyonggi.ac.kr/mod/ubboard/view.php?id={}"
 LMS_ASSIGNMENT_PAGE_URL = "https://lms.kyonggi.ac.kr/mod/assign/view.php?id={}"
 
+# 강좌 데이터 추출 항목 (출석은 활동 데이터에 병합되므로 활동 항목과 함께 사용)
+LMS_COURSE_FIELDS = ("notices", "activities", "attendance")
+
+# 페이지 유형별 부분 파싱 규칙 (태그 이름, 속성 조건)
+LMS_PARSE_PROFILES = {
+    "main": (
+        ("div", {"id": "region-main"}),
+        ("div", {"class": "course_lists"}),
+    ),
+    "pastCourse": (("div", {"class": "course_lists"}),),
+    "user": (
+        ("input", {"id": "id_firstname"}),
+        ("input", {"id": "id_institution"}),
+        ("input", {"id": "id_department"}),
+    ),
+    "course": (
+        ("div", {"class": "coursename"}),
+        ("div", {"id": "region-main"}),
+        ("div", {"class": "course-content"}),
+        ("div", {"class": "total_sections"}),
+        ("li", {"id": "section-0"}),
+    ),
+    "board": (
+        ("div", {"id": "region-main"}),
+        ("tbody", {}),
+    ),
+    "notice": (
+        ("div", {"id": "region-main"}),
+        ("ul", {"class": "files"}),
+        ("div", {"class": "text_to_html"}),
+    ),
+    "assignment": (("div", {"id": "region-main"}),),
+    "attendance": (
+        ("div", {"id": "region-main"}),
+        ("table", {"class": "user_progress_table"}),
+    ),
+}
+
 LMS_ACTIVITY_TYPES = {
     "xncommons": "lecture",
     "assign": "assignment",
     "url": "url",
     "ubfile": "file",
 }
+
+LMS_LOGIN_PAGE_URLS = (
+    "https://lms.kyonggi.ac.kr/login.php",
+    "https://lms.kyonggi.ac.kr/login/index.php",
+)
+
+LMS_SESSION_POOL_SIZE = 512
+LMS_SESSION_TTL = 60 * 30
+
+# 사용자 간 공유하는 강좌 콘텐츠(공지사항 본문, 과제 설명) 캐시 크기 및 만료 시간(초)
+LMS_CONTENT_CACHE_SIZE = 4096
+LMS_CONTENT_CACHE_TTL = 60 * 10
+
+# 사용자별 과제 정보 캐시 크기, 마감 전 만료 시간(초), 마감 후 만료 시간(초)
+LMS_ASSIGNMENT_CACHE_SIZE = 8192
+LMS_ASSIGNMENT_TTL = 60 * 5
+LMS_ASSIGNMENT_CLOSED_TTL = 60 * 60 * 6
+
+# 응답 헤더에 charset이 없는 경우의 문서 인코딩
+LMS_ENCODING = "utf-8"
@@ -1,9 +1,26 @@
+import re
+
 import aiohttp
-from bs4 import BeautifulSoup
 
 from Scrape.extractor.decorator import retryOnTimeout
 from Scrape.extractor.exception import ErrorType, ExtractorException
+from Scrape.extractor.metrics import metrics
+from Scrape.extractor.parser import Node, parseDocument
 from Scrape.extractor.parts.constants import *
+from Scrape.extractor.parts.schemas import TimetablePageSchema
+from Scrape.extractor.parts.utils import Utils
+from Scrape.extractor.session import (
+    SessionPool,
+    createSession,
+    getLimiter,
+    readResponse,
+)
+from Scrape.extractor.store import termStore
+
+kutisSessionPool = SessionPool(maxSize=KUTIS_SESSION_POOL_SIZE, ttl=KUTIS_SESSION_TTL)
+
+# 로그인 페이지 이동 안내
+kutisLoginRedirect = re.compile(KUTIS_LOGIN_REDIRECT_PATTERN, re.IGNORECASE)
 
 
 class KutisExtractor:
@@ -12,70 +29,170 @@ class KutisExtractor:
         self.password: str = password
 
         self.kutisSession: aiohttp.ClientSession | None = None
+        # 현재 세션을 세션 풀에서 재사용했는지 여부
+        self.kutisSessionReused: bool = False
+        self.kutisSessionKey: tuple[str, str] = Utils.getCredentialKey(
+            studentId=studentId, password=password
+        )
 
     @retryOnTimeout()
-    async def _kutisPostFetch(self, url: str, data: dict[str, int]) -> BeautifulSoup:
+    async def _kutisPostFetch(self, url: str, data: dict[str, int]) -> Node:
         """
-        POST 요청을 보내고, 응답을 BeautifulSoup 객체로 변환하여 반환합니다.
+        POST 요청을 보내고, 응답을 문서 요소로 변환하여 반환합니다.
 
-        인증 세션이 없다면 생성을 시도합니다.
+        인증 세션이 없다면 세션 풀에서 대여하거나 생성을 시도합니다.
 
         Parameters:
             url: 요청 Url
             data: 요청 body Data
 
         Returns:
-            content: BeautifulSoup 객체
+            content: 문서 요소
         """
-        try:
-            # 세션 검증 및 생성
-            if self.kutisSession is None:
-                await self._getKutisSession()
+        return await self._kutisRequest("POST", url, data=data)
 
-            # 페이지 요청 및 변환 후 반환
-            async with self.kutisSession.post(url, data=data) as response:
-                response.raise_for_status()
-                data = await response.text()
-                return BeautifulSoup(data, "lxml")
+    @retryOnTimeout()
+    async def _kutisFetch(self, url: str) -> Node:
+        """
+        GET 요청을 보내고, 응답을 문서 요소로 변환하여 반환합니다.
 
-        except ExtractorException:
-            raise
-        except Exception as e:
-            raise ExtractorException(errorType=ErrorType.SCRAPE_ERROR) from e
+        인증 세션이 없다면 세션 풀에서 대여하거나 생성을 시도합니다.
 
-    @retryOnTimeout()
-    async def _kutisFetch(self, url: str) -> BeautifulSoup:
+        Parameters:
+            url: 요청 Url
+
+        Returns:
+            content: 문서 요소
         """
-        GET 요청을 보내고, 응답을 BeautifulSoup 객체로 변환하여 반환합니다.
+        return await self._kutisRequest("GET", url)
 
-        인증 세션이 없다면 생성을 시도합니다.
+    async def _kutisRequest(
+        self, method: str, url: str, data: dict[str, int] | None = None
+    ) -> Node:
+        """
+        KUTIS 인증 세션으로 요청을 보내고, 응답을 문서 요소로 변환하여 반환합니다.
+
+        재사용한 세션의 쿠키가 거부되었다면(로그인 페이지로 이동 또는 200 응답의 이동 안내)
+        SSO 로그인을 다시 수행한 뒤 한 번 더 요청합니다.
 
         Parameters:
+            method: 요청 메서드
             url: 요청 Url
+            data: 요청 body Data
 
         Returns:
-            content: BeautifulSoup 객체
+            content: 문서 요소
         """
         try:
-            # 세션 검증 및 생성
-            if self.kutisSession is None:
-                await self._getKutisSession()
-
-            # 페이지 요청 및 변환 후 반환
-            async with self.kutisSession.get(url) as response:
-                response.raise_for_status()
-                data = await response.text()
-                return BeautifulSoup(data, "lxml")
+            for _ in range(2):
+                # 세션 검증 및 생성
+                if self.kutisSession is None:
+                    await self._acquireKutisSession()
+                session = self.kutisSession
+
+                # 호스트 동시성 제한 안에서 페이지 요청
+                async with getLimiter(url).slot():
+                    async with session.request(method, url, data=data) as response:
+                        response.raise_for_status()
+                        expired = self._isKutisLoginRedirect(response)
+                        if not expired:
+                            body, encoding = await readResponse(
+                                response, defaultEncoding=KUTIS_ENCODING
+                            )
+                            expired = self._isKutisLoginNotice(body)
+
+                # 페이지 변환 후 반환
+                if not expired:
+                    return await parseDocument(body, encoding=encoding)
+
+                # 만료된 세션 폐기
+                metrics.increment("kutis.sessionRejected")
+                await self._discardKutisSession(session)
+
+            raise ExtractorException(errorType=ErrorType.KUTIS_ERROR)
 
         except ExtractorException:
             raise
         except Exception as e:
             raise ExtractorException(errorType=ErrorType.SCRAPE_ERROR) from e
 
+    @staticmethod
+    def _isKutisLoginRedirect(response: aiohttp.ClientResponse) -> bool:
+        """
+        인증 쿠키가 거부되어 로그인 페이지로 이동되었는지 확인합니다.
+
+        Parameters:
+            response: 응답 객체
+        """
+        return str(response.url.with_query(None)) == KUTIS_LOGIN_PAGE_URL
+
+    @staticmethod
+    def _isKutisLoginNotice(body: bytes) -> bool:
+        """
+        인증 쿠키가 거부되어 200 응답으로 로그인 페이지 이동 안내(스크립트, meta refresh)를 받았는지 확인합니다.
+
+        Parameters:
+            body: 응답 본문
+        """
+        return (
+            len(body) <= KUTIS_LOGIN_REDIRECT_MAX_SIZE
+            and kutisLoginRedirect.search(body) is not None
+        )
+
+    async def _acquireKutisSession(self, renew: bool = False):
+        """
+        kutisSession 인스턴스 변수에 세션 풀의 KUTIS 인증 세션을 할당합니다.
+
+        재사용 가능한 세션이 없다면 SSO 로그인을 수행하며,
+        같은 학생의 SSO 로그인이 이미 진행 중이라면 그 결과를 공유합니다.
+
+        Parameters:
+            renew: 등록된 세션을 무시하고 새로 로그인할지 여부
+        """
+        loggedIn = False
+
+        async def login() -> aiohttp.ClientSession:
+            nonlocal loggedIn
+            loggedIn = True
+            return await self._getKutisSession()
+
+        session = await kutisSessionPool.acquire(
+            self.kutisSessionKey, login=login, renew=renew
+        )
+
+        # 기존 세션 반환 후 할당
+        await self._releaseKutisSession()
+        self.kutisSession = session
+        self.kutisSessionReused = not loggedIn
+
+    async def _releaseKutisSession(self):
+        """
+        KUTIS 인증 세션 사용을 종료하고 세션 풀에 반환합니다.
+        """
+        if self.kutisSession:
+            session, self.kutisSession = self.kutisSession, None
+            await kutisSessionPool.release(session)
+
+    async def _discardKutisSession(self, session: aiohttp.ClientSession):
+        """
+        쿠키가 거부된 KUTIS 인증 세션을 세션 풀에서 제거합니다.
+
+        Parameters:
+            session: 만료된 인증 세션
+        """
+        kutisSessionPool.invalidate(self.kutisSessionKey, session=session)
+        if self.kutisSession is session:
+            await self._releaseKutisSession()
+
     @retryOnTimeout()
-    async def _getKutisSession(self):
+    async def _getKutisSession(self) -> aiohttp.ClientSession:
         """
-        kutisSession 인스턴스 변수에 KUTIS 인증 세션을 할당합니다.
+        KUTIS SSO 로그인을 수행하고, 인증 세션을 반환합니다.
+
+        SSO 이후의 쿠키를 가진 세션은 세션 풀에 등록되어 이후 요청에서 재사용됩니다.
+
+        Returns:
+            session: KUTIS 인증 세션
         """
         # 세션 요청 헤더
         headers = {
@@ -88,19 +205,19 @@ class KutisExtractor:
         # 로그인 데이터
         loginData = {"id": self.studentId, "pw": self.password}
 
-        # 세션 초기화
-        self.kutisSession = aiohttp.ClientSession(headers=headers, timeout=timeout)
+        # 세션 초기화 (공유 커넥터, 개별 쿠키 저장소)
+        session = createSession(headers=headers, timeout=timeout)
 
         try:
             # KUTIS 로그인 페이지 GET 요청
-            async with self.kutisSession.get(
+            async with session.get(
                 KUTIS_LOGIN_PAGE_URL, allow_redirects=False
             ) as formResponse:
                 if formResponse.status != 200:
                     raise ExtractorException(errorType=ErrorType.KUTIS_ERROR)
 
             # KUTIS 로그인 POST 요청
-            async with self.kutisSession.post(
+            async with session.post(
                 KUTIS_LOGIN_URL, data=loginData, allow_redirects=False
             ) as loginResponse:
                 if loginResponse.status == 200:
@@ -114,7 +231,7 @@ class KutisExtractor:
                     raise ExtractorException(errorType=ErrorType.KUTIS_ERROR)
 
             # SSO GET 요청
-            async with self.kutisSession.get(
+            async with session.get(
                 loginRedirectUrl, allow_redirects=False
             ) as ssoResponse:
                 if ssoResponse.status != 302:
@@ -125,25 +242,64 @@ class KutisExtractor:
                     raise ExtractorException(errorType=ErrorType.KUTIS_ERROR)
 
             # SSO Redirect URL GET 요청
-            async with self.kutisSession.get(
+            async with session.get(
                 ssoRedirectUrl, allow_redirects=True
             ) as verifyResponse:
                 if verifyResponse.status != 200:
                     raise ExtractorException(errorType=ErrorType.KUTIS_ERROR)
 
             # 로그인 상태 검증
-            async with self.kutisSession.get(
+            async with session.get(
                 KUTIS_MAIN_PAGE_URL, allow_redirects=True
             ) as mainPageResponse:
                 if mainPageResponse.status != 200:
                     raise ExtractorException(errorType=ErrorType.KUTIS_ERROR)
-            return
+
+            return session
 
         except ExtractorException:
+            await session.close()
             raise
         except Exception as e:
+            await session.close()
             raise ExtractorException(errorType=ErrorType.SYSTEM_ERROR) from e
 
+    async def _getTimetableTables(
+        self, year: int | None, semester: int | None
+    ) -> tuple[Node, list]:
+        """
+        시간표 페이지를 요청하고 시간표 요소를 추출합니다.
+
+        재사용한 세션으로 받은 페이지에 시간표가 없다면 세션이 거부된 안내 페이지로 보고,
+        세션을 폐기하고 SSO 로그인을 다시 수행한 뒤 한 번 더 요청합니다.
+
+        Parameters:
+            year: 추출 연도
+            semester: 추출 학기
+
+        Returns:
+            content: 문서 요소
+            tables: 시간표 요소 목록
+        """
+        for _ in range(2):
+            if year and semester:
+                content = await self._kutisPostFetch(
+                    KUTIS_TIMETABLE_PAGE_URL,
+                    data={"hyear": year, "hakgi": semester * 10},
+                )
+            else:
+                content = await self._kutisFetch(KUTIS_TIMETABLE_PAGE_URL)
+
+            tables = TimetablePageSchema.extract(content)["timetables"]
+            if len(tables) >= 2 or not self.kutisSessionReused:
+                break
+
+            # 거부된 세션 폐기
+            metrics.increment("kutis.sessionRejected")
+            await self._discardKutisSession(self.kutisSession)
+
+        return content, tables
+
     async def getTimetable(
         self, year: int | None, semester: int | None, close: bool = True
     ) -> list:
@@ -154,6 +310,8 @@ class KutisExtractor:
             - 1 ~ 3교시(오전), 4 ~ 5교시, 6 ~ 7교시(오후) 시간대 외 수업 시간이 존재하면 문제 발생
                 -> 2차원 그리드 방식을 사용하여 문제 해결 완료
 
+        종료된 학기의 시간표는 저장소에 보관하며, 저장된 시간표는 KUTIS에 요청하지 않고 반환합니다.
+
         Parameters:
             year: 추출 연도
             semester: 추출 학기
@@ -162,18 +320,27 @@ class KutisExtractor:
         Returns:
             classes: 시간표 정보
         """
+        content = None
         try:
-            # 과거 또는 현재 시간표 페이지 요청
-            if year and semester:
-                content = await self._kutisPostFetch(
-                    KUTIS_TIMETABLE_PAGE_URL,
-                    data={"hyear": year, "hakgi": semester * 10},
+            # 종료된 학기 저장소 조회
+            finished = bool(
+                year
+                and semester
+                and Utils.isFinishedSemester(year=year, semester=semester)
+            )
+            if finished:
+                classes = await termStore.get(
+                    "timetable",
+                    studentId=self.studentId,
+                    password=self.password,
+                    year=year,
+                    semester=semester,
                 )
-            else:
-                content = await self._kutisFetch(KUTIS_TIMETABLE_PAGE_URL)
+                if classes is not None:
+                    return classes
 
-            # 시간표 요소 선택
-            tables = content.find_all("table", class_="list06")
+            # 과거 또는 현재 시간표 페이지 요청 및 시간표 요소 추출
+            content, tables = await self._getTimetableTables(year, semester)
             classes = []
             days = ["월요일", "화요일", "수요일", "목요일", "금요일", "토요일"]
 
@@ -184,7 +351,7 @@ class KutisExtractor:
 
             for timetable in timetables:
                 # 시간표 존재 여부 검증
-                if timetable.find("p", class_="caution"):
+                if timetable["caution"]:
                     raise ExtractorException(errorType=ErrorType.TIMETABLE_NOT_EXIST)
 
                 # 테이블 2차원 그리드 확장
@@ -192,13 +359,13 @@ class KutisExtractor:
                 rowspanTracker = {}
 
                 # 시간표 정보 추출
-                rows = timetable.find_all("tr")
+                rows = timetable["rows"]
                 timetableRows = rows[1:]
                 totalColumns = 7
 
                 for r, row in enumerate(timetableRows):
                     currentRow = []
-                    rowCells = row.find_all(["th", "td"])
+                    rowCells = row["cells"]
                     cellIndex = 0
                     colIndex = 0
                     while colIndex < totalColumns:
@@ -215,9 +382,9 @@ class KutisExtractor:
                                 cell = rowCells[cellIndex]
                                 cellIndex += 1
                                 currentRow.append((cell, r))
-                                if cell.has_attr("rowspan"):
+                                if cell.hasAttr("rowspan"):
                                     try:
-                                        span = int(cell["rowspan"])
+                                        span = int(cell.get("rowspan"))
                                     except ValueError:
                                         span = 1
                                     if span > 1:
@@ -230,17 +397,17 @@ class KutisExtractor:
 
                 for r, row in enumerate(grid):
                     timeCell, _ = row[0]
-                    periodText = timeCell.get_text(strip=True)
+                    periodText = timeCell.getText(strip=True)
                     period = int(periodText)
 
                     for col in range(1, totalColumns):
                         cell, origin = row[col]
                         if cell and cell.name == "th" and r == origin:
-                            cellText = cell.get_text(separator="<br>", strip=True)
+                            cellText = cell.getText(separator="<br>", strip=True)
                             parts = cellText.split("<br>")
                             if len(parts) >= 4:
                                 title, identifier, professor, lectureRoom = parts[:4]
-                                classTime = int(cell["rowspan"]) // 2
+                                classTime = int(cell.get("rowspan")) // 2
                                 classes.append(
                                     {
                                         "title": title,
@@ -254,6 +421,16 @@ class KutisExtractor:
                                     }
                                 )
 
+            # 종료된 학기 시간표 저장
+            if finished:
+                await termStore.set(
+                    "timetable",
+                    studentId=self.studentId,
+                    password=self.password,
+                    year=year,
+                    semester=semester,
+                    value=classes,
+                )
             return classes
 
         except ExtractorException:
@@ -264,6 +441,5 @@ class KutisExtractor:
             ) from e
 
         finally:
-            if close and self.kutisSession:
-                await self.kutisSession.close()
-                self.kutisSession = None
+            if close:
+                await self._releaseKutisSession()
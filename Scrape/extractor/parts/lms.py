@@ -1,13 +1,59 @@
 import asyncio
-import re
+import datetime
+import functools
+import time
 
 import aiohttp
-from bs4 import BeautifulSoup
 
+from Scrape.extractor.admission import admission
+from Scrape.extractor.cache import ContentCache, LruCache
 from Scrape.extractor.decorator import retryOnTimeout
 from Scrape.extractor.exception import ErrorType, ExtractorException
+from Scrape.extractor.metrics import metrics
+from Scrape.extractor.parser import Node, ParseProfile, parseDocument, parseStream
 from Scrape.extractor.parts.constants import *
+from Scrape.extractor.parts.schemas import (
+    AccessSchema,
+    AssignmentPageSchema,
+    AttendancePageSchema,
+    BoardPageSchema,
+    CourseHeaderSchema,
+    CoursePageSchema,
+    MainPageSchema,
+    NoticeSchema,
+    PastCoursePageSchema,
+    UserSchema,
+    WeekSchema,
+)
 from Scrape.extractor.parts.utils import Utils
+from Scrape.extractor.session import (
+    SessionPool,
+    createSession,
+    getEncoding,
+    getLimiter,
+    iterResponse,
+    readResponse,
+    releaseEarly,
+)
+from Scrape.extractor.store import termStore
+
+lmsSessionPool = SessionPool(maxSize=LMS_SESSION_POOL_SIZE, ttl=LMS_SESSION_TTL)
+
+# 사용자 간 공유하는 강좌 콘텐츠 캐시
+lmsContentCache = ContentCache(
+    name="lms.contentCache", maxSize=LMS_CONTENT_CACHE_SIZE, ttl=LMS_CONTENT_CACHE_TTL
+)
+metrics.registerGauge("lms.contentCache", lmsContentCache.stats)
+
+# 사용자별 과제 정보 캐시
+lmsAssignmentCache = LruCache(maxSize=LMS_ASSIGNMENT_CACHE_SIZE, ttl=LMS_ASSIGNMENT_TTL)
+metrics.registerGauge("lms.assignmentCache", lambda: {"size": len(lmsAssignmentCache)})
+
+# 페이지 유형별 부분 파싱 설정
+lmsParseProfiles = {
+    name: ParseProfile(name=name, rules=rules)
+    for name, rules in LMS_PARSE_PROFILES.items()
+}
 
 
 class LmsExtractor:
@@ -16,61 +62,196 @@ class LmsExtractor:
         self.password: str = password
 
         self.lmsSession: aiohttp.ClientSession | None = None
+        self.lmsSessionKey: tuple[str, str] = Utils.getCredentialKey(
+            studentId=studentId, password=password
+        )
 
-    @retryOnTimeout()
-    async def _lmsFetch(self, url: str) -> BeautifulSoup:
+        # 추출 단위 페이지 캐시
+        self.lmsPages: dict[tuple[str, str | None], asyncio.Future] = {}
+
+    async def _lmsFetch(self, url: str, profile: str | None = None) -> Node:
         """
-        GET 요청을 보내고, 응답을 BeautifulSoup 객체로 변환하여 반환합니다.
+        GET 요청을 보내고, 응답을 문서 요소로 변환하여 반환합니다.
 
-        인증 세션이 없다면 생성을 시도합니다.
+        같은 추출에서 이미 요청한 페이지는 다시 요청하지 않고 변환된 객체를 공유하며,
+        진행 중인 요청이 있다면 그 결과를 기다립니다.
+        부분 파싱 설정을 지정하면 해당 페이지 유형에 필요한 요소만 파싱합니다.
+        새로 요청한 페이지의 지연 시간은 승인 제어기에 반영됩니다.
 
         Parameters:
             url: 요청 url
+            profile: 부분 파싱 설정 이름 (LMS_PARSE_PROFILES), 미지정 시 전체 파싱
 
         Returns:
-            content: BeautifulSoup 객체
+            content: 문서 요소
         """
+        key = (Utils.normalizeUrl(url), profile)
+
+        page = self.lmsPages.get(key)
+        if page is None:
+            page = asyncio.ensure_future(
+                self._lmsRequest(url, profile=lmsParseProfiles.get(profile))
+            )
+            self.lmsPages[key] = page
+            page.add_done_callback(
+                functools.partial(self._observeLatency, time.monotonic())
+            )
+        else:
+            metrics.increment("lms.pageCacheHit")
+
         try:
-            # 세션 검증 및 생성
-            if self.lmsSession is None:
-                await self._getLmsSession()
+            return await asyncio.shield(page)
+        except BaseException:
+            # 실패한 요청은 캐시하지 않음
+            if page.done() and self.lmsPages.get(key) is page:
+                del self.lmsPages[key]
+            raise
 
-            # 페이지 요청 및 변환 후 반환
-            async with self.lmsSession.get(url) as response:
-                data = await response.text()
-                return BeautifulSoup(data, "lxml")
+    @staticmethod
+    def _observeLatency(startTime: float, page: asyncio.Future):
+        """
+        LMS 페이지 요청 지연 시간을 승인 제어기에 반영합니다. (취소된 요청 제외)
+        """
+        if not page.cancelled():
+            admission.observeUpstream(time.monotonic() - startTime)
+
+    @retryOnTimeout()
+    async def _lmsRequest(self, url: str, profile: ParseProfile | None = None) -> Node:
+        """
+        LMS 인증 세션으로 GET 요청을 보내고, 응답을 문서 요소로 변환하여 반환합니다.
+
+        인증 세션이 없다면 세션 풀에서 대여하거나 생성을 시도합니다.
+        재사용한 세션이 만료되었다면 다시 로그인한 뒤 한 번 더 요청합니다.
+
+        Parameters:
+            url: 요청 url
+            profile: 부분 파싱 설정
+
+        Returns:
+            content: 문서 요소
+        """
+        try:
+            for _ in range(2):
+                # 세션 검증 및 생성
+                if self.lmsSession is None:
+                    await self._acquireLmsSession()
+                session = self.lmsSession
+
+                # 호스트 동시성 제한 안에서 페이지 요청
+                async with getLimiter(url).slot() as slot:
+                    async with session.get(url) as response:
+                        if response.status >= 500:
+                            slot.fail()
+                        expired = self._isLmsLoginRedirect(response)
+                        if not expired and profile:
+                            # 본문 수신 중 증분 파싱, 필요한 요소가 모두 닫히면 나머지 본문 생략
+                            content = await parseStream(
+                                iterResponse(response),
+                                encoding=getEncoding(
+                                    response, defaultEncoding=LMS_ENCODING
+                                ),
+                                profile=profile,
+                            )
+                            await releaseEarly(response)
+                        elif not expired:
+                            data, encoding = await readResponse(
+                                response, defaultEncoding=LMS_ENCODING
+                            )
+                            content = None
+
+                # 페이지 변환 후 반환
+                if not expired:
+                    if content is None:
+                        content = await parseDocument(data, encoding=encoding)
+                    return content
+
+                # 만료된 세션 폐기
+                await self._discardLmsSession(session)
+
+            raise ExtractorException(errorType=ErrorType.LMS_ERROR)
 
         except ExtractorException:
             raise
         except Exception as e:
             raise ExtractorException(errorType=ErrorType.SCRAPE_ERROR) from e
 
+    @staticmethod
+    def _isLmsLoginRedirect(response: aiohttp.ClientResponse) -> bool:
+        """
+        인증 세션 만료로 로그인 페이지로 이동되었는지 확인합니다.
+
+        Parameters:
+            response: 응답 객체
+        """
+        return bool(response.history) and (
+            str(response.url.with_query(None)) in LMS_LOGIN_PAGE_URLS
+        )
+
+    async def _acquireLmsSession(self, renew: bool = False):
+        """
+        lmsSession 인스턴스 변수에 세션 풀의 LMS 인증 세션을 할당합니다.
+
+        재사용 가능한 세션이 없다면 로그인을 수행하며,
+        같은 학생의 로그인이 이미 진행 중이라면 그 결과를 공유합니다.
+
+        Parameters:
+            renew: 등록된 세션을 무시하고 새로 로그인할지 여부
+        """
+        session = await lmsSessionPool.acquire(
+            self.lmsSessionKey, login=self._getLmsSession, renew=renew
+        )
+
+        # 기존 세션 반환 후 할당
+        await self._releaseLmsSession()
+        self.lmsSession = session
+
+    async def _releaseLmsSession(self):
+        """
+        LMS 인증 세션 사용을 종료하고 세션 풀에 반환합니다.
+        """
+        if self.lmsSession:
+            session, self.lmsSession = self.lmsSession, None
+            await lmsSessionPool.release(session)
+
+    async def _discardLmsSession(self, session: aiohttp.ClientSession):
+        """
+        만료된 LMS 인증 세션을 세션 풀에서 제거합니다.
+
+        Parameters:
+            session: 만료된 인증 세션
+        """
+        lmsSessionPool.invalidate(self.lmsSessionKey, session=session)
+        if self.lmsSession is session:
+            await self._releaseLmsSession()
+
     async def _checkAccess(
-        self, content: BeautifulSoup, exception: bool = True
+        self, content: Node, exception: bool = True
     ) -> bool | Exception:
         """
         페이지 접근 여부를 검증합니다.
 
         Parameters:
-            content: BeautifulSoup 객체
+            content: 문서 요소
             exception: 예외 발생 여부
         """
-        mainContainer = content.find("div", id="region-main")
+        region = AccessSchema.extract(content)["region"]
 
-        # LMS 시스템 경고
-        alert = mainContainer.find("div", class_="alert")
-        # 접근 제한 메세지
-        notify = mainContainer.find("div", class_="panel-heading")
-        if alert or notify:
+        # LMS 시스템 경고 또는 접근 제한 메세지
+        if region["alert"] or region["notify"]:
             if exception:
                 raise ExtractorException(errorType=ErrorType.INVALID_ACCESS)
             else:
                 return False
 
     @retryOnTimeout()
-    async def _getLmsSession(self):
+    async def _getLmsSession(self) -> aiohttp.ClientSession:
         """
-        lmsSession 인스턴스 변수에 LMS 인증 세션을 할당합니다.
+        LMS에 로그인하고, 인증 세션을 반환합니다.
+
+        반환된 세션은 세션 풀에 등록되어 이후 요청에서 재사용됩니다.
+
+        Returns:
+            session: LMS 인증 세션
         """
         # 세션 요청 헤더
         headers = {
@@ -83,12 +264,12 @@ class LmsExtractor:
         # 타임아웃 설정
         timeout = aiohttp.ClientTimeout(total=10)
 
-        # 세션 초기화
-        self.lmsSession = aiohttp.ClientSession(headers=headers, timeout=timeout)
+        # 세션 초기화 (공유 커넥터, 개별 쿠키 저장소)
+        session = createSession(headers=headers, timeout=timeout)
 
         try:
             # LMS 로그인 요청
-            async with self.lmsSession.post(
+            async with session.post(
                 LMS_LOGIN_URL, data=loginData, allow_redirects=False
             ) as loginResponse:
                 # 정상 응답 검증
@@ -103,19 +284,22 @@ class LmsExtractor:
                     raise ExtractorException(errorType=ErrorType.AUTHENTICATION_FAIL)
                 elif LMS_LOGIN_SUCCESS_URL in loginRedirectUrl:
                     # 로그인 상태 검증
-                    async with self.lmsSession.get(
+                    async with session.get(
                         LMS_MAIN_PAGE_URL, allow_redirects=False
                     ) as verifyResponse:
                         # 비정상 응답 검증
                         if verifyResponse.status == 303:
                             raise ExtractorException(errorType=ErrorType.LMS_ERROR)
-                    return
+
+                    return session
 
                 raise ExtractorException(errorType=ErrorType.LMS_ERROR)
 
         except ExtractorException:
+            await session.close()
             raise
         except Exception as e:
+            await session.close()
             raise ExtractorException(errorType=ErrorType.SYSTEM_ERROR) from e
 
     async def verifyAuthentication(self, getUser: bool) -> tuple:
@@ -132,7 +316,7 @@ class LmsExtractor:
         """
         try:
             # 인증 세션 생성
-            await self._getLmsSession()
+            await self._acquireLmsSession(renew=True)
 
             # 사용자 정보 추출
             if getUser:
@@ -146,9 +330,7 @@ class LmsExtractor:
             raise ExtractorException(errorType=ErrorType.SYSTEM_ERROR) from e
 
         finally:
-            if self.lmsSession:
-                await self.lmsSession.close()
-                self.lmsSession = None
+            await self._releaseLmsSession()
 
     async def _getUserData(self) -> dict:
         """
@@ -159,18 +341,16 @@ class LmsExtractor:
         """
         try:
             # 페이지 요청
-            content = await self._lmsFetch(LMS_USER_PAGE_URL)
+            content = await self._lmsFetch(LMS_USER_PAGE_URL, profile="user")
 
             # 사용자 데이터 생성
+            user = UserSchema.extract(content)
             userData = {}
-            userData["name"] = content.find("input", id="id_firstname").get("value")
-            userData["college"] = content.find("input", id="id_institution").get(
-                "value"
-            )
+            userData["name"] = user["name"]
+            userData["college"] = user["college"]
 
             # 전공, 학부 판별
-            major = content.find("input", id="id_department").get("value")
-            department, major = Utils.getDepartment(major=major)
+            department, major = Utils.getDepartment(major=user["major"])
             userData["department"] = department
             userData["major"] = major
             return userData
@@ -188,6 +368,8 @@ class LmsExtractor:
         """
         과거 강좌 목록을 스크래핑합니다.
 
+        종료된 학기의 강좌 목록은 저장소에 보관하며, 저장된 목록은 LMS에 요청하지 않고 반환합니다.
+
         Parameters:
             year: 연도
             semester: 학기
@@ -196,36 +378,55 @@ class LmsExtractor:
         Returns:
             courseList: 강좌 목록
         """
+        content = None
         try:
+            # 종료된 학기 저장소 조회
+            finished = Utils.isFinishedSemester(year=year, semester=semester)
+            if finished:
+                courseList = await termStore.get(
+                    "courses",
+                    studentId=self.studentId,
+                    password=self.password,
+                    year=year,
+                    semester=semester,
+                )
+                if courseList is not None:
+                    return courseList
+
             # 페이지 요청
             content = await self._lmsFetch(
-                LMS_PAST_COURSE_PAGE_URL.format(year, semester * 10)
+                LMS_PAST_COURSE_PAGE_URL.format(year, semester * 10),
+                profile="pastCourse",
             )
 
-            # 요소 선택
-            courseContainer = content.find("div", class_="course_lists")
-            courseTable = courseContainer.find("tbody", class_="my-course-lists")
-            courses = courseTable.find_all("tr")
+            # 요소 추출 (안내 행 제외)
+            courses = PastCoursePageSchema.extract(content)["courseList"]["courses"]
 
             # 강좌 존재 확인
-            if not courses or courses[0].find("td", colspan="5"):
+            if not courses:
                 raise ExtractorException(errorType=ErrorType.COURSE_NOT_EXIST)
 
             # 강좌 목록 생성
-            courseList = []
-            for course in courses:
-                columns = course.find_all("td")
-                courseTag = columns[1].find("a")
-                courseList.append(
-                    {
-                        "title": courseTag.text.strip().split("(")[0].strip(),
-                        "link": courseTag.get("href"),
-                        "identifier": courseTag.text.strip()
-                        .split("_")[1]
-                        .split(")")[0][-4:],
-                        "code": Utils.extractCodeFromUrl(courseTag.get("href"), "id"),
-                        "professor": columns[2].text.strip(),
-                    }
+            courseList = [
+                {
+                    "title": course["heading"].split("(")[0].strip(),
+                    "link": course["link"],
+                    "identifier": course["heading"].split("_")[1].split(")")[0][-4:],
+                    "code": Utils.extractCodeFromUrl(course["link"], "id"),
+                    "professor": course["professor"],
+                }
+                for course in courses
+            ]
+
+            # 종료된 학기 강좌 목록 저장
+            if finished:
+                await termStore.set(
+                    "courses",
+                    studentId=self.studentId,
+                    password=self.password,
+                    year=year,
+                    semester=semester,
+                    value=courseList,
                 )
             return courseList
 
@@ -237,9 +438,8 @@ class LmsExtractor:
             ) from e
 
         finally:
-            if close and self.lmsSession:
-                await self.lmsSession.close()
-                self.lmsSession = None
+            if close:
+                await self._releaseLmsSession()
 
     async def _getCourseList(self, close: bool = True) -> list:
         """
@@ -253,12 +453,11 @@ class LmsExtractor:
         """
         try:
             # 페이지 요청 및 권한 검증
-            content = await self._lmsFetch(LMS_MAIN_PAGE_URL)
+            content = await self._lmsFetch(LMS_MAIN_PAGE_URL, profile="main")
             await self._checkAccess(content=content)
 
-            # 요소 선택
-            courseContainer = content.find("div", class_="course_lists")
-            courses = courseContainer.find_all("li", class_="course_label_re")
+            # 요소 추출
+            courses = MainPageSchema.extract(content)["courseList"]["courses"]
 
             # 강좌 존재 확인
             if not courses:
@@ -267,16 +466,11 @@ class LmsExtractor:
             # 강좌 목록 생성
             courseList = [
                 {
-                    "title": course.find("h3").text.strip().split("(")[0].strip(),
-                    "link": (
-                        courseLink := course.find("a", class_="course_link").get("href")
-                    ),
-                    "identifier": course.find("h3")
-                    .text.strip()
-                    .split("_")[1]
-                    .split(")")[0][-4:],
-                    "code": Utils.extractCodeFromUrl(courseLink, "id"),
-                    "professor": course.find("p", class_="prof").text.strip(),
+                    "title": course["heading"].split("(")[0].strip(),
+                    "link": course["link"],
+                    "identifier": course["heading"].split("_")[1].split(")")[0][-4:],
+                    "code": Utils.extractCodeFromUrl(course["link"], "id"),
+                    "professor": course["professor"],
                 }
                 for course in courses
             ]
@@ -290,35 +484,88 @@ class LmsExtractor:
             ) from e
 
         finally:
-            if close and self.lmsSession:
-                await self.lmsSession.close()
-                self.lmsSession = None
+            if close:
+                await self._releaseLmsSession()
+
+    async def _getCourseHeader(self, courseCode: str) -> dict:
+        """
+        강좌 페이지에서 강좌 정보(제목, 분반 식별자, 담당 교수)를 스크래핑합니다.
+
+        강좌 페이지는 강좌 데이터 스크래핑과 같은 페이지 캐시를 사용하므로 추가 요청이 발생하지 않습니다.
+        강좌 페이지에서 강좌 정보를 찾지 못하면 강좌 목록에서 찾습니다.
+
+        Parameters:
+            courseCode: 강좌 코드
+
+        Returns:
+            courseData: 강좌 정보
+        """
+        try:
+            # 페이지 요청
+            content = await self._lmsFetch(
+                LMS_COURSE_PAGE_URL.format(courseCode), profile="course"
+            )
+
+            # 강좌 정보 추출
+            header = CourseHeaderSchema.extract(content)
+            heading = header["heading"]
+            if heading and header["professor"] and "_" in heading:
+                metrics.increment("lms.courseHeaderHit")
+                return {
+                    "title": heading.split("(")[0].strip(),
+                    "identifier": heading.split("_")[1].split(")")[0][-4:],
+                    "professor": header["professor"],
+                }
 
-    async def getCourseActivites(self, courseCode: str, close: bool = True) -> list:
+            # 강좌 목록에서 강좌 정보 검색
+            metrics.increment("lms.courseHeaderFallback")
+            courses = await self._getCourseList(close=False)
+            course = next(
+                (course for course in courses if course["code"] == courseCode), None
+            )
+            if not course:
+                raise ExtractorException(errorType=ErrorType.COURSE_NOT_EXIST)
+            return course
+
+        except ExtractorException:
+            raise
+        except Exception as e:
+            raise ExtractorException(
+                errorType=ErrorType.SCRAPE_ERROR, content=content
+            ) from e
+
+    async def getCourseActivites(
+        self, courseCode: str, close: bool = True, assignmentDetail: bool = True
+    ) -> list:
         """
         강좌의 주차별 활동 목록을 스크래핑합니다.
 
         Parameters:
             courseCode: 강좌 코드
             close: 세션 종료 여부
+            assignmentDetail: 과제 상세 정보 추출 여부
 
         Returns:
             courseActivityList: 강좌 주차별 활동 목록
         """
         try:
             # 페이지 요청 및 권한 검증
-            content = await self._lmsFetch(LMS_COURSE_PAGE_URL.format(courseCode))
+            content = await self._lmsFetch(
+                LMS_COURSE_PAGE_URL.format(courseCode), profile="course"
+            )
             await self._checkAccess(content=content)
 
-            # 요소 선택
-            sectionContainer = content.find("div", class_="total_sections")
-            sections = sectionContainer.find_all(
-                "li", id=re.compile(r"section-[1-9]\d*")
-            )
+            # 주차 섹션 추출
+            sections = CoursePageSchema.extract(content)["sectionList"]["sections"]
 
             # 활동 목록 스크래핑 비동기 처리
             tasks = [
-                self._getActivites(week=index, content=section)
+                self._getActivites(
+                    week=index,
+                    content=section,
+                    assignmentDetail=assignmentDetail,
+                    courseCode=courseCode,
+                )
                 for index, section in enumerate(sections, start=1)
             ]
             courseActivityList = await asyncio.gather(*tasks)
@@ -334,16 +581,23 @@ class LmsExtractor:
             ) from e
 
         finally:
-            if close and self.lmsSession:
-                await self.lmsSession.close()
-                self.lmsSession = None
-
-    async def _getActivites(self, week: int, content: BeautifulSoup) -> list:
+            if close:
+                await self._releaseLmsSession()
+
+    async def _getActivites(
+        self,
+        week: int,
+        content: Node,
+        assignmentDetail: bool = True,
+        courseCode: str | None = None,
+    ) -> list:
         """
         해당 주차의 활동들을 스크래핑합니다.
 
         Parameters:
-            content: BeautifulSoup 객체
+            content: 문서 요소
+            assignmentDetail: 과제 상세 정보 추출 여부
+            courseCode: 강좌 코드
 
         Returns:
             activityList: 주차별 활동 목록
@@ -354,10 +608,10 @@ class LmsExtractor:
             tasks = []
 
             # 요소 추출
-            activities = content.find_all("li", class_="activity")
+            activities = WeekSchema.extract(content)["activities"]
             for activity in activities:
                 # 활동 존재 여부 필터링
-                classList = activity.get("class", [])
+                classList = activity["classes"]
                 if len(classList) < 1:
                     continue
 
@@ -372,19 +626,12 @@ class LmsExtractor:
                 }
 
                 # 제목 스크래핑
-                titleElement = activity.find("span", class_="instancename")
-                if titleElement:
-                    # 불필요한 자식 요소 제거
-                    childElement = titleElement.find("span", class_="accesshide")
-                    if childElement:
-                        childElement.extract()
-                    activityData["title"] = titleElement.text.strip()
+                if activity["title"] is not None:
+                    activityData["title"] = activity["title"]
 
                 # 활동 링크 및 코드 스크래핑
-                activityLink = None
-                linkElement = activity.find("a")
-                if linkElement:
-                    activityLink = linkElement.get("href")
+                activityLink = activity["link"]
+                if activityLink is not None:
                     try:
                         activityData["code"] = Utils.extractCodeFromUrl(
                             url=activityLink, paramName="id"
@@ -395,30 +642,28 @@ class LmsExtractor:
 
                 # 활성 상태
                 activityData["available"] = (
-                    False
-                    if activity.find("div", class_="availability") or not activityLink
-                    else True
+                    False if activity["restriction"] or not activityLink else True
                 )
 
                 # 과제 유형 비동기 작업 추가
-                if activityType == "assignment" and activityData["available"] == True:
+                if (
+                    assignmentDetail
+                    and activityType == "assignment"
+                    and activityData["available"] == True
+                ):
                     tasks.append((activityData["code"], activityData))
 
                 # 강의 유형 추가 스크래핑
                 if activityType == "lecture":
-                    deadlineElement = activity.find("span", class_="text-ubstrap")
-                    lectureTimeElement = activity.find("span", class_="text-info")
-                    if deadlineElement and lectureTimeElement:
-                        startAt, deadline = map(
-                            str.strip, deadlineElement.text.split("~")
-                        )
+                    period = activity["period"]
+                    lectureTime = activity["lectureTime"]
+                    if period is not None and lectureTime is not None:
+                        startAt, deadline = map(str.strip, period.split("~"))
                         activityData.update(
                             {
                                 "startAt": startAt,
                                 "deadline": deadline,
-                                "lectureTime": lectureTimeElement.text.strip().replace(
-                                    ", ", ""
-                                ),
+                                "lectureTime": lectureTime.replace(", ", ""),
                             }
                         )
 
@@ -429,7 +674,9 @@ class LmsExtractor:
             if tasks:
                 results = await asyncio.gather(
                     *[
-                        self.getAssignment(assignmentCode=code, close=False)
+                        self.getAssignment(
+                            assignmentCode=code, close=False, courseCode=courseCode
+                        )
                         for code, _ in tasks
                     ]
                 )
@@ -450,46 +697,60 @@ class LmsExtractor:
                 errorType=ErrorType.SCRAPE_ERROR, content=content
             ) from e
 
-    async def getAssignment(self, assignmentCode: str, close: bool = True) -> dict:
+    async def getAssignment(
+        self, assignmentCode: str, close: bool = True, courseCode: str | None = None
+    ) -> dict:
         """
         과제 정보를 스크래핑합니다.
 
+        과제 설명은 강좌의 모든 수강생에게 동일하므로 강좌 단위 공유 캐시에서 재사용하며,
+        강좌 코드를 알 수 없다면 공유 캐시를 사용하지 않습니다.
+        과제 정보는 사용자별로 캐시하며, 마감 전에는 짧게, 마감 후에는 길게 보관합니다.
+
         Parameters:
             assignmentCode: 과제 코드
             close: 세션 종료 여부
+            courseCode: 과제가 속한 강좌 코드
 
         Returns:
             assignmentData: 과제 정보
         """
+        content = None
         try:
+            # 사용자별 과제 캐시 조회
+            cacheKey = (self.lmsSessionKey, assignmentCode)
+            assignmentData = lmsAssignmentCache.get(cacheKey)
+            if assignmentData is not None:
+                metrics.increment("lms.assignmentCacheHit")
+                return dict(assignmentData)
+            metrics.increment("lms.assignmentCacheMiss")
+
             # 페이지 요청 및 권한 검증
-            content = await self._lmsFetch(
-                LMS_ASSIGNMENT_PAGE_URL.format(assignmentCode)
-            )
+            assignmentUrl = LMS_ASSIGNMENT_PAGE_URL.format(assignmentCode)
+            content = await self._lmsFetch(assignmentUrl, profile="assignment")
             await self._checkAccess(content=content)
 
-            # 요소 선택
-            assignmentContainer = content.find("div", id="region-main")
-
-            # 과제 설명 스크래핑
-            descriptionContainer = assignmentContainer.find("div", id="intro")
-            childContainer = descriptionContainer.find("div", class_="no-overflow")
-            if childContainer:
-                description = Utils.extractContent(container=childContainer)
-            else:
-                description = Utils.extractContent(container=descriptionContainer)
+            # 요소 추출
+            assignment = AssignmentPageSchema.extract(content)["assignment"]
+
+            # 과제 설명 스크래핑 (강좌 단위 공유 캐시 우선)
+            scope = ("assignment", courseCode)
+            cacheUrl = Utils.normalizeUrl(assignmentUrl)
+            description = None
+            if courseCode is not None:
+                description = lmsContentCache.get(scope=scope, url=cacheUrl)
+            if description is None:
+                description = Utils.extractContent(
+                    container=assignment["introContent"] or assignment["intro"]
+                )
+                if courseCode is not None:
+                    lmsContentCache.set(scope=scope, url=cacheUrl, value=description)
 
             # 과제 정보 스크래핑
-            table = assignmentContainer.find("table", class_="generaltable").find_all(
-                "tr"
-            )
+            table = assignment["statusTable"]["rows"]
 
             # 팀 필드 존재 검증
-            rows = (
-                table[1:6]
-                if table[0].find_all("td")[0].get_text(strip=True) == "팀"
-                else table[0:5]
-            )
+            rows = table[1:6] if table[0]["cells"][0] == "팀" else table[0:5]
 
             keys = [
                 "submitStatus",
@@ -498,7 +759,7 @@ class LmsExtractor:
                 "timeLeft",
                 "lastModified",
             ]
-            values = [row.find_all("td")[1].get_text(strip=True) for row in rows]
+            values = [row["cells"][1] for row in rows]
 
             # 과제 정보 객체 생성
             assignmentData = dict(zip(keys, values))
@@ -523,6 +784,12 @@ class LmsExtractor:
                     "none",
                 )
 
+            # 마감 여부에 따른 만료 시간으로 캐시
+            lmsAssignmentCache.set(
+                cacheKey,
+                dict(assignmentData),
+                ttl=self._getAssignmentTtl(assignmentData=assignmentData),
+            )
             return assignmentData
 
         except ExtractorException:
@@ -533,54 +800,95 @@ class LmsExtractor:
             ) from e
 
         finally:
-            if close and self.lmsSession:
-                await self.lmsSession.close()
-                self.lmsSession = None
+            if close:
+                await self._releaseLmsSession()
+
+    @staticmethod
+    def _getAssignmentTtl(assignmentData: dict) -> float:
+        """
+        과제 정보의 캐시 만료 시간을 계산합니다.
+
+        마감이 지난 과제는 제출 상태가 더 이상 바뀌지 않으므로 LMS_ASSIGNMENT_CLOSED_TTL 동안 보관하고,
+        마감 전 과제는 LMS_ASSIGNMENT_TTL과 마감까지 남은 시간 중 짧은 시간 동안 보관합니다.
+        종료 일시를 해석할 수 없다면 남은 기한 문구로 마감 여부를 판단합니다.
+
+        Parameters:
+            assignmentData: 과제 정보
 
-    async def getCourseNotice(self, boardCode: str, close: bool = True) -> list:
+        Returns:
+            ttl: 캐시 만료 시간(초)
+        """
+        deadline = Utils.parseDateTime(assignmentData.get("deadline"))
+        if deadline is None:
+            if "마감이 지난" in (assignmentData.get("timeLeft") or ""):
+                return LMS_ASSIGNMENT_CLOSED_TTL
+            return LMS_ASSIGNMENT_TTL
+
+        remaining = (deadline - datetime.datetime.now()).total_seconds()
+        if remaining <= 0:
+            return LMS_ASSIGNMENT_CLOSED_TTL
+        return min(LMS_ASSIGNMENT_TTL, remaining)
+
+    async def getCourseNotice(
+        self,
+        boardCode: str,
+        close: bool = True,
+        knownNotices: set[str] | None = None,
+    ) -> list:
         """
         강좌 공지사항을 스크래핑합니다.
 
+        공지사항마다 링크와 게시일로 만든 식별값(fingerprint)을 반환하며,
+        클라이언트가 전달한 식별값과 같은 공지사항은 본문을 요청하지 않고 unchanged로 표시합니다.
+
         Parameters:
             boardCode: 공지사항 게시판 코드
             close: 세션 종료 여부
+            knownNotices: 클라이언트가 이미 가진 공지사항 식별값
 
         Returns:
             noticeList: 전체 공지사항 정보
         """
         try:
             # 페이지 요청 및 권한 검증
-            content = await self._lmsFetch(LMS_BOARD_PAGE_URL.format(boardCode))
+            content = await self._lmsFetch(
+                LMS_BOARD_PAGE_URL.format(boardCode), profile="board"
+            )
             await self._checkAccess(content=content)
 
-            # 요소 선택
-            container = content.find("tbody")
-
-            # 공지사항 목록 확인
-            firstRow = container.find("td") if container else None
-            if firstRow and firstRow.get("colspan") == "5":
-                return []
+            # 공지사항 목록 추출 (안내 행 제외)
+            notices = BoardPageSchema.extract(content)["board"]["notices"]
 
-            # 공지사항 목록 추출
-            notices = container.find_all("tr")
+            # 공지사항 식별값 생성 및 변경 여부 확인
+            knownNotices = knownNotices or set()
+            fingerprints = [
+                Utils.getNoticeFingerprint(link=notice["link"], date=notice["cells"][3])
+                for notice in notices
+            ]
 
-            # 비동기 작업 생성
+            # 새로운 공지사항 비동기 작업 생성 및 처리
             tasks = [
-                self._getNotice(link=notice.find("a").get("href")) for notice in notices
+                self._getNotice(link=notice["link"], boardCode=boardCode)
+                for notice, fingerprint in zip(notices, fingerprints)
+                if fingerprint not in knownNotices
             ]
-
-            # 비동기 작업 처리
-            noticeList = await asyncio.gather(*tasks)
+            fetchedNotices = iter(await asyncio.gather(*tasks))
 
             # 추가 정보 삽입
-            for index, notice in enumerate(noticeList):
-                notice["index"] = (
-                    notices[index].find_all("td")[0].text.strip() or "9999"
-                )
-                notice["title"] = notices[index].find("a").text.strip()
-                notice["professor"] = notices[index].find_all("td")[2].text.strip()
-                notice["date"] = notices[index].find_all("td")[3].text.strip()
-
+            noticeList = []
+            for row, fingerprint in zip(notices, fingerprints):
+                unchanged = fingerprint in knownNotices
+                notice = {"link": row["link"]} if unchanged else next(fetchedNotices)
+                notice["index"] = row["cells"][0] or "9999"
+                notice["title"] = row["title"]
+                notice["professor"] = row["cells"][2]
+                notice["date"] = row["cells"][3]
+                notice["fingerprint"] = fingerprint
+                notice["unchanged"] = unchanged
+                noticeList.append(notice)
+
+            if knownNotices:
+                metrics.increment("lms.noticeUnchanged", len(notices) - len(tasks))
             return noticeList
 
         except ExtractorException:
@@ -591,43 +899,50 @@ class LmsExtractor:
             ) from e
 
         finally:
-            if close and self.lmsSession:
-                await self.lmsSession.close()
-                self.lmsSession = None
+            if close:
+                await self._releaseLmsSession()
 
-    async def _getNotice(self, link: str) -> dict:
+    async def _getNotice(self, link: str, boardCode: str) -> dict:
         """
         공지사항 내용을 스크래핑하고 공지사항 객체를 반환합니다.
 
+        공지사항 내용은 게시판의 모든 수강생에게 동일하므로 게시판 단위 공유 캐시에서 재사용합니다.
+        링크는 사용자가 직접 요청한 게시판 목록에서 추출되므로 접근 권한은 목록 요청에서 검증됩니다.
+
         Parameters:
             link: 공지사항 링크
+            boardCode: 공지사항 게시판 코드
 
         Returns:
             noticeData: 공지사항 정보
         """
+        content = None
         try:
+            # 공유 캐시 조회
+            scope = ("notice", boardCode)
+            cacheUrl = Utils.normalizeUrl(link)
+            noticeData = lmsContentCache.get(scope=scope, url=cacheUrl)
+            if noticeData is not None:
+                return noticeData
+
             # 페이지 요청 및 권한 검증
-            content = await self._lmsFetch(link)
+            content = await self._lmsFetch(link, profile="notice")
             await self._checkAccess(content=content)
 
+            # 요소 추출
+            notice = NoticeSchema.extract(content)
+
             # 공지사항 객체 생성
             noticeData = {"link": link}
 
             # 파일 추출
-            fileContainer = content.find("ul", class_="files")
-            if fileContainer:
-                noticeData["files"] = [
-                    {
-                        "title": file.find("a").text.strip(),
-                        "link": file.find("a").get("href"),
-                    }
-                    for file in fileContainer.find_all("li")
-                ]
+            if notice["fileList"] is not None:
+                noticeData["files"] = notice["fileList"]["files"]
 
             # 공지사항 텍스트 추출
-            container = content.find("div", class_="text_to_html")
-            noticeData["content"] = Utils.extractContent(container=container)
+            noticeData["content"] = Utils.extractContent(container=notice["body"])
 
+            lmsContentCache.set(scope=scope, url=cacheUrl, value=noticeData)
             return noticeData
 
         except ExtractorException:
@@ -650,26 +965,29 @@ class LmsExtractor:
         """
 
         def extractAttendance(cell):
-            text = "".join(cell.find_all(text=True, recursive=False)).strip()
+            text = cell.getText(recursive=False).strip()
             return text == "O"
 
         try:
             # 페이지 요청 및 권한 검증
-            content = await self._lmsFetch(LMS_ATTENDANCE_PAGE_URL.format(courseCode))
+            content = await self._lmsFetch(
+                LMS_ATTENDANCE_PAGE_URL.format(courseCode), profile="attendance"
+            )
             if await self._checkAccess(content=content, exception=False) is False:
                 return None
 
-            # 요소 선택
-            table = content.select("table.user_progress_table tbody tr")
+            # 요소 추출
+            progressTable = AttendancePageSchema.extract(content)["table"]
+            table = progressTable["rows"] if progressTable else []
 
             attendanceData = []
             weekAttendance = False
             for row in table:
-                cells = row.find_all("td")
+                cells = row["cells"]
                 week = (
                     int(cells[0].text.strip())
                     if cells[0].text.strip().isdigit()
-                    and "text-center" in cells[0].get("class", [])
+                    and "text-center" in cells[0].classes
                     else None
                 )
                 title = cells[1].text.strip() if week else cells[0].text.strip()
@@ -704,6 +1022,5 @@ class LmsExtractor:
             ) from e
 
         finally:
-            if close and self.lmsSession:
-                await self.lmsSession.close()
-                self.lmsSession = None
+            if close:
+                await self._releaseLmsSession()
@@ -0,0 +1,194 @@
+import re
+
+from Scrape.extractor.parser import Node, Selector
+from Scrape.extractor.schema import (
+    Attr,
+    Classes,
+    Element,
+    Elements,
+    Nested,
+    Schema,
+    Text,
+    Texts,
+)
+
+# 목록이 비어 있을 때 표시되는 안내 행의 셀
+EMPTY_ROW_CELL = Selector('td[colspan="5"]')
+
+# 주차 섹션 id (section-0은 강좌 공지 섹션)
+WEEK_SECTION_ID = re.compile(r"section-[1-9]\d*")
+
+
+def _isListRow(row: Node) -> bool:
+    return row.selectOne(EMPTY_ROW_CELL) is None
+
+
+def _isWeekSection(section: Node) -> bool:
+    return bool(WEEK_SECTION_ID.search(section.get("id")))
+
+
+# LMS 공통
+class AccessAlertSchema(Schema):
+    # LMS 시스템 경고
+    alert = Element("div.alert")
+    # 접근 제한 메세지
+    notify = Element("div.panel-heading")
+
+
+class AccessSchema(Schema):
+    region = Nested("div#region-main", AccessAlertSchema, required=True)
+
+
+# LMS 사용자 정보
+class UserSchema(Schema):
+    name = Attr("input#id_firstname", "value", required=True)
+    college = Attr("input#id_institution", "value", required=True)
+    major = Attr("input#id_department", "value", required=True)
+
+
+# LMS 강좌 목록
+class CourseSchema(Schema):
+    heading = Text("h3", required=True)
+    link = Attr("a.course_link", "href", required=True)
+    professor = Text("p.prof", required=True)
+
+
+class CourseListSchema(Schema):
+    courses = Nested("li.course_label_re", CourseSchema, many=True)
+
+
+class MainPageSchema(Schema):
+    courseList = Nested("div.course_lists", CourseListSchema, required=True)
+
+
+# LMS 과거 강좌 목록
+class PastCourseSchema(Schema):
+    heading = Text("td:nth-of-type(2) a", required=True)
+    link = Attr("td:nth-of-type(2) a", "href", required=True)
+    professor = Text("td:nth-of-type(3)", required=True)
+
+
+class PastCourseListSchema(Schema):
+    courses = Nested("tr", PastCourseSchema, many=True, where=_isListRow)
+
+
+class PastCoursePageSchema(Schema):
+    courseList = Nested(
+        "div.course_lists tbody.my-course-lists", PastCourseListSchema, required=True
+    )
+
+
+# LMS 강좌 페이지
+class CourseContentSchema(Schema):
+    alert = Element("div.alert")
+
+
+class CourseHomeSchema(Schema):
+    content = Nested("div.course-content", CourseContentSchema, required=True)
+
+
+class CourseHeaderSchema(Schema):
+    heading = Text("div.coursename h1")
+    professor = Text("div.coursename p.prof")
+
+
+class CourseNoticeLinkSchema(Schema):
+    link = Attr("li#section-0 li.activity a", "href", required=True)
+
+
+class CourseSectionsSchema(Schema):
+    sections = Elements("li[id]", where=_isWeekSection)
+
+
+class CoursePageSchema(Schema):
+    sectionList = Nested("div.total_sections", CourseSectionsSchema, required=True)
+
+
+# LMS 주차별 활동
+class ActivitySchema(Schema):
+    classes = Classes()
+    title = Text("span.instancename", exclude="span.accesshide")
+    link = Attr("a", "href")
+    restriction = Element("div.availability")
+    period = Text("span.text-ubstrap", strip=False)
+    lectureTime = Text("span.text-info")
+
+
+class WeekSchema(Schema):
+    activities = Nested("li.activity", ActivitySchema, many=True)
+
+
+# LMS 과제
+class AssignmentRowSchema(Schema):
+    cells = Texts("td", compact=True)
+
+
+class AssignmentTableSchema(Schema):
+    rows = Nested("tr", AssignmentRowSchema, many=True)
+
+
+class AssignmentSchema(Schema):
+    intro = Element("div#intro", required=True)
+    introContent = Element("div#intro div.no-overflow")
+    statusTable = Nested("table.generaltable", AssignmentTableSchema, required=True)
+
+
+class AssignmentPageSchema(Schema):
+    assignment = Nested("div#region-main", AssignmentSchema, required=True)
+
+
+# LMS 공지사항 게시판
+class BoardRowSchema(Schema):
+    link = Attr("a", "href", required=True)
+    title = Text("a", required=True)
+    cells = Texts("td")
+
+
+class BoardSchema(Schema):
+    notices = Nested("tr", BoardRowSchema, many=True, where=_isListRow)
+
+
+class BoardPageSchema(Schema):
+    board = Nested("tbody", BoardSchema, required=True)
+
+
+# LMS 공지사항
+class NoticeFileSchema(Schema):
+    title = Text("a", required=True)
+    link = Attr("a", "href", required=True)
+
+
+class NoticeFileListSchema(Schema):
+    files = Nested("li", NoticeFileSchema, many=True)
+
+
+class NoticeSchema(Schema):
+    fileList = Nested("ul.files", NoticeFileListSchema)
+    body = Element("div.text_to_html", required=True)
+
+
+# LMS 온라인 강의 출석
+class AttendanceRowSchema(Schema):
+    cells = Elements("td")
+
+
+class AttendanceTableSchema(Schema):
+    rows = Nested("tbody tr", AttendanceRowSchema, many=True)
+
+
+class AttendancePageSchema(Schema):
+    table = Nested("table.user_progress_table", AttendanceTableSchema)
+
+
+# KUTIS 시간표
+class TimetableRowSchema(Schema):
+    cells = Elements("th, td")
+
+
+class TimetableSchema(Schema):
+    caution = Element("p.caution")
+    rows = Nested("tr", TimetableRowSchema, many=True)
+
+
+class TimetablePageSchema(Schema):
+    timetables = Nested("table.list06", TimetableSchema, many=True)
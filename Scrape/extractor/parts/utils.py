@@ -1,9 +1,16 @@
+import datetime
+import hashlib
+import re
 import urllib
 import urllib.parse
 
-from bs4 import BeautifulSoup
-
 from Scrape.extractor.exception import ErrorType, ExtractorException
+from Scrape.extractor.parser import Node
+
+# LMS 일시 표기 (예: 2024-03-20 23:59, 2024-03-20 23:59:59)
+DATETIME_PATTERN = re.compile(
+    r"(\d{4})-(\d{1,2})-(\d{1,2})\s+(\d{1,2}):(\d{2})(?::(\d{2}))?"
+)
 
 
 class Utils:
@@ -69,34 +76,55 @@ class Utils:
         return "", major
 
     @staticmethod
-    def extractContent(container: BeautifulSoup) -> str:
+    def extractContent(container: Node) -> str:
         """
         주어진 HTML 요소에서 텍스트를 추출합니다.
 
+        문단 요소(h1 ~ h6, p, div, li)별로 텍스트를 한 줄씩 추출하며, 문단 요소가 없다면 전체 텍스트를 추출합니다.
+        요소를 한 번만 순회하여 텍스트 조각 목록과 문단 요소별 조각 범위를 기록하므로,
+        중첩된 요소의 텍스트를 반복해서 순회하지 않고 문서도 변경하지 않습니다.
+
         Parameters:
-            container: BeautifulSoup 객체
+            container: 문서 요소
 
         Returns:
             content: 추출된 텍스트
         """
-        for lineBreak in container.find_all("br"):
-            lineBreak.replace_with("[BR]")
+        blockTags = {"h1", "h2", "h3", "h4", "h5", "h6", "p", "div", "li"}
 
-        contentList = []
-        elements = container.find_all(
-            ["h1", "h2", "h3", "h4", "h5", "h6", "p", "div", "li"], recursive=True
-        )
+        # 텍스트 조각 (공백 제거, 줄바꿈은 [BR] 조각)
+        tokens = []
+        # 문단 요소별 [시작 조각, 끝 조각, li 여부] (문서 순서)
+        blocks = []
+        openBlocks = []
 
-        if elements:
-            for element in elements:
-                if element.name == "li":
-                    text = element.get_text(separator=" ", strip=True)
+        for event, value in container.walk():
+            if event == "text":
+                text = value.strip()
+                if text:
+                    tokens.append(text)
+            elif event == "start":
+                if value == "br":
+                    tokens.append("[BR]")
+                if value in blockTags:
+                    blocks.append([len(tokens), None, value == "li"])
+                    openBlocks.append(blocks[-1])
                 else:
-                    text = element.get_text(strip=True)
+                    openBlocks.append(None)
+            else:
+                block = openBlocks.pop()
+                if block is not None:
+                    block[1] = len(tokens)
+
+        contentList = []
+        if blocks:
+            for start, end, isListItem in blocks:
+                separator = " " if isListItem else ""
+                text = separator.join(tokens[start:end])
                 if text:
                     contentList.append(text)
         else:
-            contentList.append(container.get_text(strip=True))
+            contentList.append("".join(tokens))
 
         content = "\n".join(contentList)
         return content.replace("[BR]", "")
@@ -112,3 +140,101 @@ class Utils:
             return queryParams.get(paramName)[0]
         except Exception as e:
             raise ExtractorException(errorType=ErrorType.EXTRACT_PARAMETER_ERROR) from e
+
+    @staticmethod
+    def normalizeUrl(url: str) -> str:
+        """
+        같은 페이지를 가리키는 Url이 같은 값을 갖도록 정규화합니다.
+
+        스킴과 호스트를 소문자로 변환하고, 쿼리 파라미터를 정렬하며, fragment를 제거합니다.
+
+        Parameters:
+            url: 정규화할 Url
+
+        Returns:
+            url: 정규화된 Url
+        """
+        parsedUrl = urllib.parse.urlsplit(url.strip())
+        query = urllib.parse.urlencode(
+            sorted(urllib.parse.parse_qsl(parsedUrl.query, keep_blank_values=True))
+        )
+        return urllib.parse.urlunsplit(
+            (
+                parsedUrl.scheme.lower(),
+                parsedUrl.netloc.lower(),
+                parsedUrl.path or "/",
+                query,
+                "",
+            )
+        )
+
+    @staticmethod
+    def getCredentialKey(studentId: str, password: str) -> tuple[str, str]:
+        """
+        학번과 비밀번호 해시로 인증 정보 키를 생성합니다.
+
+        Parameters:
+            studentId: 학번
+            password: 비밀번호
+
+        Returns:
+            key: 인증 정보 키
+        """
+        return studentId, hashlib.sha256(password.encode()).hexdigest()
+
+    @staticmethod
+    def getNoticeFingerprint(link: str, date: str) -> str:
+        """
+        공지사항 링크와 게시일로 공지사항 식별값을 생성합니다.
+
+        클라이언트는 이전 응답의 식별값을 전달하여 변경되지 않은 공지사항의 본문 요청을 생략할 수 있습니다.
+
+        Parameters:
+            link: 공지사항 링크
+            date: 공지사항 게시일
+
+        Returns:
+            fingerprint: 공지사항 식별값
+        """
+        value = f"{Utils.normalizeUrl(link)}\n{date}"
+        return hashlib.sha256(value.encode()).hexdigest()[:32]
+
+    @staticmethod
+    def isFinishedSemester(year: int, semester: int) -> bool:
+        """
+        학기가 종료되었는지 확인합니다.
+
+        1학기는 2학기가 시작되는 9월부터, 2학기는 다음 해 1학기가 시작되는 3월부터 종료된 것으로 판단합니다.
+
+        Parameters:
+            year: 연도
+            semester: 학기
+
+        Returns:
+            finished: 종료 여부
+        """
+        if semester == 1:
+            finishedAt = datetime.date(year, 9, 1)
+        else:
+            finishedAt = datetime.date(year + 1, 3, 1)
+        return datetime.date.today() >= finishedAt
+
+    @staticmethod
+    def parseDateTime(text: str | None) -> datetime.datetime | None:
+        """
+        LMS 일시 문자열을 변환합니다.
+
+        Parameters:
+            text: 일시 문자열
+
+        Returns:
+            dateTime: 일시, 변환할 수 없다면 None
+        """
+        match = DATETIME_PATTERN.search(text or "")
+        if match is None:
+            return None
+
+        try:
+            return datetime.datetime(*(int(value or 0) for value in match.groups()))
+        except ValueError:
+            return None
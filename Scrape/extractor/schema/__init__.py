@@ -0,0 +1,11 @@
+from .fields import (
+    Attr,
+    Classes,
+    Element,
+    Elements,
+    MissingElementError,
+    Nested,
+    Text,
+    Texts,
+)
+from .schema import Schema
@@ -0,0 +1,206 @@
+from typing import TYPE_CHECKING, Any, Callable
+
+from Scrape.extractor.parser import Node, Selector
+
+if TYPE_CHECKING:
+    from Scrape.extractor.schema.schema import Schema
+
+
+class MissingElementError(LookupError):
+    """
+    필수 필드의 요소가 문서에 없는 경우 발생하는 예외입니다.
+    """
+
+    def __init__(self, field: "Field"):
+        self.field: Field = field
+        super().__init__(f"{field.owner}.{field.name}: {field.selector!r}")
+
+
+class Field:
+    """
+    페이지 스키마의 필드입니다.
+
+    선택자는 필드 생성 시점(스키마 클래스 정의 시점)에 컴파일되며,
+    선택자에 맞는 첫 번째 요소를 convert로 변환한 값을 추출합니다.
+    선택자를 지정하지 않으면 기준 요소 자신을 변환합니다.
+
+    Parameters:
+        selector: CSS 선택자
+        required: 요소가 없는 경우 MissingElementError 발생 여부
+    """
+
+    def __init__(self, selector: str | None = None, required: bool = False):
+        self.selector: Selector | None = Selector(selector) if selector else None
+        self.required: bool = required
+
+        # 스키마 클래스 정의 시 지정
+        self.owner: str | None = None
+        self.name: str | None = None
+
+    def __set_name__(self, owner: type, name: str):
+        self.owner = owner.__name__
+        self.name = name
+
+    def extract(self, node: Node) -> Any:
+        """
+        기준 요소에서 필드 값을 추출합니다.
+
+        Parameters:
+            node: 기준 요소
+
+        Returns:
+            value: 필드 값, 요소가 없다면 None
+        """
+        element = node.selectOne(self.selector) if self.selector else node
+        if element is None:
+            if self.required:
+                raise MissingElementError(self)
+            return None
+        return self.convert(element)
+
+    def convert(self, element: Node) -> Any:
+        return element
+
+
+class Element(Field):
+    """
+    선택자에 맞는 첫 번째 요소를 그대로 추출합니다.
+    """
+
+
+class Elements(Field):
+    """
+    선택자에 맞는 모든 요소를 문서 순서대로 추출합니다.
+
+    Parameters:
+        selector: CSS 선택자
+        where: 지정 시 조건을 만족하는 요소만 추출
+    """
+
+    def __init__(self, selector: str, where: Callable[[Node], bool] | None = None):
+        super().__init__(selector)
+        self.where = where
+
+    def extract(self, node: Node) -> list:
+        return [
+            self.convert(element)
+            for element in node.select(self.selector)
+            if self.where is None or self.where(element)
+        ]
+
+
+class Text(Field):
+    """
+    요소의 텍스트를 추출합니다.
+
+    Parameters:
+        selector: CSS 선택자
+        strip: 전체 텍스트 앞뒤 공백 제거 여부
+        compact: 텍스트 조각별로 공백을 제거하고 빈 조각을 제외할지 여부
+        separator: 텍스트 조각 구분자
+        recursive: 하위 요소의 텍스트 포함 여부
+        exclude: 지정 시 텍스트 추출 전 선택자에 맞는 첫 번째 하위 요소를 문서에서 제거
+        required: 요소가 없는 경우 MissingElementError 발생 여부
+    """
+
+    def __init__(
+        self,
+        selector: str | None = None,
+        strip: bool = True,
+        compact: bool = False,
+        separator: str = "",
+        recursive: bool = True,
+        exclude: str | None = None,
+        required: bool = False,
+    ):
+        super().__init__(selector, required=required)
+        self.strip: bool = strip
+        self.compact: bool = compact
+        self.separator: str = separator
+        self.recursive: bool = recursive
+        self.exclude: Selector | None = Selector(exclude) if exclude else None
+
+    def convert(self, element: Node) -> str:
+        if self.exclude:
+            child = element.selectOne(self.exclude)
+            if child is not None:
+                child.remove()
+
+        text = element.getText(
+            separator=self.separator, strip=self.compact, recursive=self.recursive
+        )
+        return text.strip() if self.strip else text
+
+
+class Texts(Text):
+    """
+    선택자에 맞는 모든 요소의 텍스트를 문서 순서대로 추출합니다.
+    """
+
+    def extract(self, node: Node) -> list[str]:
+        return [self.convert(element) for element in node.select(self.selector)]
+
+
+class Attr(Field):
+    """
+    요소의 속성 값을 추출합니다.
+
+    Parameters:
+        selector: CSS 선택자
+        attr: 속성 이름
+        required: 요소가 없는 경우 MissingElementError 발생 여부
+    """
+
+    def __init__(self, selector: str | None, attr: str, required: bool = False):
+        super().__init__(selector, required=required)
+        self.attr: str = attr
+
+    def convert(self, element: Node) -> str | None:
+        return element.get(self.attr)
+
+
+class Classes(Field):
+    """
+    요소의 class 목록을 추출합니다.
+    """
+
+    def convert(self, element: Node) -> list[str]:
+        return element.classes
+
+
+class Nested(Field):
+    """
+    선택자에 맞는 요소를 기준으로 하위 스키마를 추출합니다.
+
+    Parameters:
+        selector: CSS 선택자
+        schema: 하위 스키마
+        many: 선택자에 맞는 모든 요소의 추출 여부, 미지정 시 첫 번째 요소만 추출
+        where: 지정 시 조건을 만족하는 요소만 추출 (many 사용 시)
+        required: 요소가 없는 경우 MissingElementError 발생 여부 (many 미사용 시)
+    """
+
+    def __init__(
+        self,
+        selector: str,
+        schema: type["Schema"],
+        many: bool = False,
+        where: Callable[[Node], bool] | None = None,
+        required: bool = False,
+    ):
+        super().__init__(selector, required=required)
+        self.schema: type[Schema] = schema
+        self.many: bool = many
+        self.where = where
+
+    def extract(self, node: Node) -> dict | list[dict] | None:
+        if not self.many:
+            return super().extract(node)
+        return [
+            self.convert(element)
+            for element in node.select(self.selector)
+            if self.where is None or self.where(element)
+        ]
+
+    def convert(self, element: Node) -> dict:
+        return self.schema.extract(element)
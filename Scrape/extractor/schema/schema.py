@@ -0,0 +1,38 @@
+from Scrape.extractor.parser import Node
+from Scrape.extractor.schema.fields import Field
+
+
+class Schema:
+    """
+    페이지 유형별 추출 필드를 선언하는 스키마입니다.
+
+    클래스 속성으로 선언한 필드는 클래스 정의 시점에 수집되며, 선택자도 이때 한 번만 컴파일됩니다.
+    extract는 선언 순서대로 필드를 한 번씩 추출하여 필드 이름을 키로 하는 딕셔너리를 반환합니다.
+    상위 스키마의 필드는 하위 스키마에 상속됩니다.
+    """
+
+    fields: dict[str, Field] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        fields = dict(cls.fields)
+        for name, value in vars(cls).items():
+            if isinstance(value, Field):
+                fields[name] = value
+        cls.fields = fields
+
+    @classmethod
+    def extract(cls, node: Node) -> dict:
+        """
+        기준 요소에서 스키마의 모든 필드를 추출합니다.
+
+        필수 필드의 요소가 없다면 MissingElementError가 발생합니다.
+
+        Parameters:
+            node: 기준 요소
+
+        Returns:
+            data: 필드 이름별 추출 값
+        """
+        return {name: field.extract(node) for name, field in cls.fields.items()}
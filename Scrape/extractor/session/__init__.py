@@ -0,0 +1,4 @@
+from .connector import createSession, getConnector
+from .limiter import AdaptiveLimiter, getLimiter
+from .pool import SessionPool
+from .response import getEncoding, iterResponse, readResponse, releaseEarly
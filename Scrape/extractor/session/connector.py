@@ -0,0 +1,105 @@
+import asyncio
+
+import aiohttp
+
+from Scrape.extractor.metrics import metrics
+
+# 커넥터 설정
+CONNECTOR_LIMIT = 200
+CONNECTOR_LIMIT_PER_HOST = 64
+CONNECTOR_DNS_CACHE_TTL = 60 * 5
+CONNECTOR_KEEPALIVE_TIMEOUT = 30
+
+_connectors: dict[asyncio.AbstractEventLoop, aiohttp.TCPConnector] = {}
+
+
+def getConnector() -> aiohttp.TCPConnector:
+    """
+    현재 이벤트 루프에서 공유하는 TCPConnector를 반환합니다.
+
+    모든 인증 세션이 하나의 커넥터를 사용하여 DNS 캐시와 keep-alive 연결을 재사용합니다.
+
+    Returns:
+        connector: 공유 TCPConnector
+    """
+    loop = asyncio.get_running_loop()
+
+    # 종료된 루프의 커넥터 정리
+    for closedLoop in [key for key in _connectors if key.is_closed()]:
+        del _connectors[closedLoop]
+
+    connector = _connectors.get(loop)
+    if connector is None or connector.closed:
+        connector = aiohttp.TCPConnector(
+            limit=CONNECTOR_LIMIT,
+            limit_per_host=CONNECTOR_LIMIT_PER_HOST,
+            ttl_dns_cache=CONNECTOR_DNS_CACHE_TTL,
+            keepalive_timeout=CONNECTOR_KEEPALIVE_TIMEOUT,
+        )
+        _connectors[loop] = connector
+    return connector
+
+
+def createSession(
+    headers: dict[str, str], timeout: aiohttp.ClientTimeout
+) -> aiohttp.ClientSession:
+    """
+    공유 커넥터를 사용하는 ClientSession을 생성합니다.
+
+    쿠키 저장소는 세션마다 분리되므로 학생 간 인증 정보는 공유되지 않습니다.
+
+    Parameters:
+        headers: 요청 헤더
+        timeout: 타임아웃 설정
+
+    Returns:
+        session: ClientSession 객체
+    """
+    return aiohttp.ClientSession(
+        headers=headers,
+        timeout=timeout,
+        connector=getConnector(),
+        connector_owner=False,
+        trace_configs=[_traceConfig],
+    )
+
+
+async def _onConnectionCreate(session, context, params):
+    metrics.increment("connection.created")
+
+
+async def _onConnectionReuse(session, context, params):
+    metrics.increment("connection.reused")
+
+
+async def _onConnectionQueued(session, context, params):
+    metrics.increment("connection.queued")
+
+
+async def _onDnsCacheHit(session, context, params):
+    metrics.increment("dns.cacheHit")
+
+
+async def _onDnsCacheMiss(session, context, params):
+    metrics.increment("dns.cacheMiss")
+
+
+def _connectionStats() -> dict:
+    created = metrics.get("connection.created")
+    reused = metrics.get("connection.reused")
+    total = created + reused
+    return {
+        "connectors": len(_connectors),
+        "reuseRate": round(reused / total, 4) if total else None,
+    }
+
+
+_traceConfig = aiohttp.TraceConfig()
+_traceConfig.on_connection_create_end.append(_onConnectionCreate)
+_traceConfig.on_connection_reuseconn.append(_onConnectionReuse)
+_traceConfig.on_connection_queued_start.append(_onConnectionQueued)
+_traceConfig.on_dns_cache_hit.append(_onDnsCacheHit)
+_traceConfig.on_dns_cache_miss.append(_onDnsCacheMiss)
+_traceConfig.freeze()
+
+metrics.registerGauge("connection", _connectionStats)
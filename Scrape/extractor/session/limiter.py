@@ -0,0 +1,217 @@
+import asyncio
+import time
+import urllib.parse
+from collections import deque
+from contextlib import asynccontextmanager
+
+import aiohttp
+
+from Scrape.extractor.metrics import metrics
+
+# 동시성 제한 설정
+LIMITER_INITIAL_LIMIT = 16
+LIMITER_MIN_LIMIT = 2
+LIMITER_MAX_LIMIT = 64
+LIMITER_LATENCY_TARGET = 2.0
+LIMITER_DECREASE_FACTOR = 0.7
+LIMITER_DECREASE_COOLDOWN = 1.0
+LIMITER_EWMA_WEIGHT = 0.2
+
+
+class LimiterSlot:
+    """
+    동시성 제한기에서 할당받은 요청 슬롯입니다.
+    """
+
+    def __init__(self):
+        self.failed: bool = False
+
+    def fail(self):
+        """
+        요청이 실패(5xx 응답 등)했음을 표시합니다.
+        """
+        self.failed = True
+
+
+class AdaptiveLimiter:
+    """
+    AIMD 방식으로 호스트에 대한 동시 요청 수를 조절하는 제한기입니다.
+
+    요청이 목표 지연 시간 안에 성공하면 한도를 조금씩 늘리고(additive increase),
+    지연 시간이 목표를 넘거나 실패하면 한도를 비율로 줄입니다(multiplicative decrease).
+    """
+
+    def __init__(
+        self,
+        initialLimit: float = LIMITER_INITIAL_LIMIT,
+        minLimit: float = LIMITER_MIN_LIMIT,
+        maxLimit: float = LIMITER_MAX_LIMIT,
+        latencyTarget: float = LIMITER_LATENCY_TARGET,
+    ):
+        self.limit: float = initialLimit
+        self.minLimit: float = minLimit
+        self.maxLimit: float = maxLimit
+        self.latencyTarget: float = latencyTarget
+
+        self.inFlight: int = 0
+        self.latency: float | None = None
+
+        self._waiters: deque[asyncio.Future] = deque()
+        self._lastDecrease: float = 0.0
+        self._stats: dict[str, int] = {
+            "admitted": 0,
+            "queued": 0,
+            "failed": 0,
+            "slow": 0,
+            "decreased": 0,
+        }
+
+    @asynccontextmanager
+    async def slot(self):
+        """
+        요청 슬롯을 할당받고, 요청 종료 시 지연 시간과 실패 여부를 반영합니다.
+
+        Returns:
+            slot: 요청 슬롯
+        """
+        await self.acquire()
+        slot = LimiterSlot()
+        startTime = time.monotonic()
+        try:
+            yield slot
+        except (asyncio.CancelledError, GeneratorExit):
+            self.release(latency=None, failed=False)
+            raise
+        except Exception as e:
+            # 타임아웃, 연결 오류, 5xx 응답만 과부하 신호로 처리
+            failed = slot.failed or isinstance(
+                e, (asyncio.TimeoutError, aiohttp.ClientConnectionError)
+            )
+            if isinstance(e, aiohttp.ClientResponseError) and e.status >= 500:
+                failed = True
+            self.release(latency=time.monotonic() - startTime, failed=failed)
+            raise
+        else:
+            self.release(latency=time.monotonic() - startTime, failed=slot.failed)
+
+    async def acquire(self):
+        """
+        동시 요청 한도 안에서 요청 슬롯을 할당받습니다.
+        """
+        if self.inFlight < int(self.limit) and not self._waiters:
+            self.inFlight += 1
+            self._stats["admitted"] += 1
+            return
+
+        # 슬롯 대기
+        self._stats["queued"] += 1
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # 할당받은 슬롯 반환
+                self.inFlight -= 1
+                self._wakeup()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+        self._stats["admitted"] += 1
+
+    def release(self, latency: float | None, failed: bool):
+        """
+        요청 슬롯을 반환하고 동시 요청 한도를 조정합니다.
+
+        Parameters:
+            latency: 요청 지연 시간(초), 취소된 요청은 None
+            failed: 요청 실패 여부
+        """
+        self.inFlight -= 1
+
+        if latency is not None:
+            self._adjust(latency=latency, failed=failed)
+        self._wakeup()
+
+    def stats(self) -> dict:
+        """
+        제한기 상태를 반환합니다.
+        """
+        return {
+            "limit": round(self.limit, 2),
+            "inFlight": self.inFlight,
+            "waiting": len(self._waiters),
+            "latency": round(self.latency, 4) if self.latency is not None else None,
+            **self._stats,
+        }
+
+    def _adjust(self, latency: float, failed: bool):
+        # 지연 시간 이동 평균 갱신
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += LIMITER_EWMA_WEIGHT * (latency - self.latency)
+
+        if failed:
+            self._stats["failed"] += 1
+        elif latency > self.latencyTarget:
+            self._stats["slow"] += 1
+        else:
+            # additive increase
+            self.limit = min(self.maxLimit, self.limit + 1 / self.limit)
+            return
+
+        # multiplicative decrease (연속 감소 방지)
+        now = time.monotonic()
+        if now - self._lastDecrease >= LIMITER_DECREASE_COOLDOWN:
+            self.limit = max(self.minLimit, self.limit * LIMITER_DECREASE_FACTOR)
+            self._lastDecrease = now
+            self._stats["decreased"] += 1
+
+    def _wakeup(self):
+        while self._waiters and self.inFlight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.inFlight += 1
+                waiter.set_result(None)
+
+
+_limiters: dict[asyncio.AbstractEventLoop, dict[str, AdaptiveLimiter]] = {}
+
+
+def getLimiter(url: str) -> AdaptiveLimiter:
+    """
+    현재 이벤트 루프에서 요청 Url의 호스트에 해당하는 동시성 제한기를 반환합니다.
+
+    제한기의 대기 Future는 생성된 이벤트 루프에서만 사용할 수 있으므로, 이벤트 루프별로 생성합니다.
+
+    Parameters:
+        url: 요청 Url
+
+    Returns:
+        limiter: 호스트 단위 동시성 제한기
+    """
+    loop = asyncio.get_running_loop()
+
+    # 종료된 루프의 제한기 정리
+    for closedLoop in [key for key in _limiters if key.is_closed()]:
+        del _limiters[closedLoop]
+
+    limiters = _limiters.setdefault(loop, {})
+    host = urllib.parse.urlsplit(url).netloc.lower()
+    limiter = limiters.get(host)
+    if limiter is None:
+        limiter = limiters[host] = AdaptiveLimiter()
+    return limiter
+
+
+def _limiterStats() -> dict:
+    return {
+        host: limiter.stats()
+        for loop, limiters in _limiters.items()
+        if not loop.is_closed()
+        for host, limiter in limiters.items()
+    }
+
+
+metrics.registerGauge("limiter", _limiterStats)
@@ -0,0 +1,149 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Hashable
+
+import aiohttp
+
+from Scrape.extractor.cache import LruCache
+
+
+@dataclass
+class PooledSession:
+    session: aiohttp.ClientSession
+    loop: asyncio.AbstractEventLoop
+    references: int = 0
+    retired: bool = False
+
+
+class SessionPool:
+    """
+    로그인된 인증 세션을 요청 간에 재사용하는 프로세스 단위 세션 풀입니다.
+
+    세션은 인증 정보 키별로 저장되며, TTL 만료 또는 LRU 제거 시 사용 중인
+    요청이 모두 반환한 뒤 종료됩니다.
+    같은 인증 정보로 동시에 들어온 로그인 요청은 하나의 로그인으로 병합됩니다.
+    """
+
+    def __init__(self, maxSize: int, ttl: float):
+        self._cache = LruCache(maxSize=maxSize, ttl=ttl, onEvict=self._retire)
+        self._leases: dict[aiohttp.ClientSession, PooledSession] = {}
+        self._flights: dict[Hashable, asyncio.Future] = {}
+        self._closeTasks: set[asyncio.Task] = set()
+
+    async def acquire(
+        self,
+        key: Hashable,
+        login: Callable[[], Awaitable[aiohttp.ClientSession]],
+        renew: bool = False,
+    ) -> aiohttp.ClientSession:
+        """
+        인증 세션을 대여합니다.
+
+        재사용 가능한 세션이 없다면 로그인하여 풀에 등록하며,
+        같은 키로 진행 중인 로그인이 있다면 새로 로그인하지 않고 그 결과를 기다립니다.
+
+        Parameters:
+            key: 인증 정보 키
+            login: 로그인 후 인증 세션을 반환하는 코루틴 함수
+            renew: 등록된 세션을 무시하고 새로 로그인할지 여부
+
+        Returns:
+            session: 인증 세션
+        """
+        loop = asyncio.get_running_loop()
+
+        if not renew:
+            entry: PooledSession | None = self._cache.get(key)
+            if entry is not None:
+                # 다른 이벤트 루프의 세션 또는 종료된 세션 폐기
+                if entry.loop is not loop or entry.session.closed:
+                    self._cache.delete(key)
+                else:
+                    entry.references += 1
+                    return entry.session
+
+        # 진행 중인 로그인 병합
+        flight = self._flights.get(key)
+        if flight is None or flight.get_loop() is not loop:
+            flight = loop.create_task(self._login(key, login))
+            self._flights[key] = flight
+
+        entry = await asyncio.shield(flight)
+        entry.references += 1
+        return entry.session
+
+    async def _login(
+        self, key: Hashable, login: Callable[[], Awaitable[aiohttp.ClientSession]]
+    ) -> PooledSession:
+        """
+        로그인을 수행하고 생성된 인증 세션을 풀에 등록합니다.
+        """
+        try:
+            session = await login()
+            entry = PooledSession(session=session, loop=asyncio.get_running_loop())
+            self._leases[session] = entry
+            self._cache.set(key, entry)
+            return entry
+
+        finally:
+            if self._flights.get(key) is asyncio.current_task():
+                del self._flights[key]
+
+    def invalidate(self, key: Hashable, session: aiohttp.ClientSession | None = None):
+        """
+        인증 세션을 풀에서 제거합니다.
+
+        Parameters:
+            key: 인증 정보 키
+            session: 지정 시 해당 세션이 등록된 경우에만 제거
+        """
+        entry: PooledSession | None = self._cache.get(key)
+        if entry is None:
+            return
+        if session is None or entry.session is session:
+            self._cache.delete(key)
+
+    async def release(self, session: aiohttp.ClientSession):
+        """
+        대여한 인증 세션을 반환합니다.
+
+        풀에서 제거된 세션은 마지막 반환 시점에 종료됩니다.
+
+        Parameters:
+            session: 인증 세션
+        """
+        entry = self._leases.get(session)
+        if entry is None:
+            # 풀에 등록되지 않은 세션 종료
+            await session.close()
+            return
+
+        entry.references = max(entry.references - 1, 0)
+        if entry.retired and entry.references == 0:
+            self._leases.pop(session, None)
+            await session.close()
+
+    def _retire(self, key: Hashable, entry: PooledSession):
+        """
+        풀에서 제거된 세션을 종료 대기 상태로 전환하고, 사용 중이 아니라면 종료합니다.
+        """
+        entry.retired = True
+        if entry.references > 0:
+            return
+
+        self._leases.pop(entry.session, None)
+        if entry.session.closed or entry.loop.is_closed():
+            return
+
+        # 세션이 생성된 이벤트 루프에서 종료
+        try:
+            runningLoop = asyncio.get_running_loop()
+        except RuntimeError:
+            runningLoop = None
+
+        if runningLoop is entry.loop:
+            task = entry.loop.create_task(entry.session.close())
+            self._closeTasks.add(task)
+            task.add_done_callback(self._closeTasks.discard)
+        else:
+            asyncio.run_coroutine_threadsafe(entry.session.close(), entry.loop)
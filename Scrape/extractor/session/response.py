@@ -0,0 +1,114 @@
+import codecs
+import time
+from typing import AsyncGenerator
+
+import aiohttp
+
+from Scrape.extractor.metrics import metrics
+
+# 스트리밍 본문 조각 크기
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# 연결 재사용을 위해 끝까지 읽는 남은 본문의 최대 크기
+RELEASE_DRAIN_LIMIT = 256 * 1024
+
+
+async def readResponse(
+    response: aiohttp.ClientResponse, defaultEncoding: str
+) -> tuple[bytes, str]:
+    """
+    응답 본문을 디코딩하지 않고 바이트로 읽고, 문서 인코딩을 반환합니다.
+
+    문자열 디코딩은 파서가 문서 인코딩으로 직접 수행하므로, 본문을 한 번만 처리합니다.
+    응답 헤더에 charset이 없거나 알 수 없는 charset이라면 기본 인코딩을 사용합니다.
+
+    Parameters:
+        response: 응답 객체
+        defaultEncoding: 호스트의 기본 문서 인코딩
+
+    Returns:
+        data: 응답 본문
+        encoding: 문서 인코딩
+    """
+    startTime = time.perf_counter()
+    data = await response.read()
+    metrics.increment("fetch.bytes", len(data))
+    metrics.increment("fetch.readSeconds", time.perf_counter() - startTime)
+    return data, getEncoding(response, defaultEncoding=defaultEncoding)
+
+
+async def iterResponse(
+    response: aiohttp.ClientResponse, chunkSize: int = STREAM_CHUNK_SIZE
+) -> AsyncGenerator[bytes, None]:
+    """
+    응답 본문을 수신되는 대로 조각 단위로 반환합니다.
+
+    Parameters:
+        response: 응답 객체
+        chunkSize: 최대 조각 크기
+
+    Returns:
+        chunk: 본문 조각
+    """
+    async for chunk in response.content.iter_chunked(chunkSize):
+        metrics.increment("fetch.bytes", len(chunk))
+        yield chunk
+
+
+async def releaseEarly(
+    response: aiohttp.ClientResponse, drainLimit: int = RELEASE_DRAIN_LIMIT
+):
+    """
+    본문을 끝까지 읽지 않은 응답의 연결을 반환합니다.
+
+    남은 본문이 작다면 끝까지 읽어 keep-alive 연결을 커넥터에 반환하고,
+    크거나(Content-Length 기준) 읽는 중 제한을 넘으면 연결을 종료합니다.
+
+    Parameters:
+        response: 응답 객체
+        drainLimit: 끝까지 읽는 남은 본문의 최대 크기
+    """
+    content = response.content
+    if content.at_eof():
+        response.release()
+        return
+
+    # 남은 본문 크기가 알려진 경우 바로 판단
+    if response.content_length is not None:
+        remaining = response.content_length - content.total_bytes
+        if remaining > drainLimit:
+            response.close()
+            metrics.increment("fetch.earlyClose")
+            return
+
+    drained = 0
+    while not content.at_eof():
+        chunk = await content.read(STREAM_CHUNK_SIZE)
+        drained += len(chunk)
+        if drained > drainLimit:
+            response.close()
+            metrics.increment("fetch.earlyClose")
+            return
+
+    metrics.increment("fetch.drainedBytes", drained)
+    response.release()
+
+
+def getEncoding(response: aiohttp.ClientResponse, defaultEncoding: str) -> str:
+    """
+    응답 헤더의 charset으로 문서 인코딩을 결정합니다.
+
+    Parameters:
+        response: 응답 객체
+        defaultEncoding: 호스트의 기본 문서 인코딩
+
+    Returns:
+        encoding: 문서 인코딩
+    """
+    if response.charset:
+        # 파서(libxml2)가 인식하는 이름으로 정규화 (예: ks_c_5601-1987 -> euc-kr)
+        try:
+            return codecs.lookup(response.charset).name.replace("_", "-")
+        except LookupError:
+            pass
+    return defaultEncoding
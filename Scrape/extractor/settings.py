@@ -0,0 +1,21 @@
+from typing import Any
+
+from django.conf import settings
+
+
+def getSetting(name: str, default: Any) -> Any:
+    """
+    Django 설정 값을 반환합니다.
+
+    Django 설정 없이 추출기를 사용하는 경우(벤치마크, 스크립트 등) 기본값을 반환합니다.
+
+    Parameters:
+        name: 설정 이름
+        default: 설정이 없는 경우 반환값
+
+    Returns:
+        value: 설정 값
+    """
+    if settings.configured:
+        return getattr(settings, name, default)
+    return default
@@ -0,0 +1,2 @@
+from .job import JobStore, jobStore
+from .term import TermStore, termStore
@@ -0,0 +1,120 @@
+import asyncio
+import json
+import sqlite3
+import time
+from typing import Any
+
+from Scrape.extractor.metrics import metrics
+from Scrape.extractor.settings import getSetting
+from Scrape.extractor.store.sqlite import SqliteStore
+
+# 저장소 기본값
+JOB_STORE_PATH = "data/job_store.sqlite3"
+
+
+class JobStore(SqliteStore):
+    """
+    추출 작업의 상태와 부분 결과, 최종 결과를 워커 프로세스 간에 공유하는 SQLite 저장소입니다.
+
+    작업은 등록한 워커 프로세스에서 실행되지만, 상태가 바뀔 때마다 저장소에 기록하므로
+    다른 워커 프로세스로 전달된 조회 요청도 같은 작업을 확인할 수 있습니다.
+    늦게 도착한 이전 상태가 최신 상태를 덮어쓰지 않도록 작업 버전이 증가한 경우에만 기록합니다.
+    결과에 개인 정보가 포함되므로 완료된 작업은 조회 즉시 제거하며, 조회되지 않은 작업도 만료 시 제거합니다.
+    """
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS job_data ("
+        " jobId TEXT PRIMARY KEY,"
+        " version INTEGER NOT NULL,"
+        " data TEXT NOT NULL,"
+        " expiresAt REAL NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS job_data_expiresAt ON job_data (expiresAt)",
+    )
+
+    async def get(self, jobId: str) -> dict | None:
+        """
+        저장된 작업 상태를 조회합니다.
+
+        저장소 오류는 저장된 작업이 없는 것으로 처리합니다.
+
+        Parameters:
+            jobId: 작업 ID
+
+        Returns:
+            job: 작업 상태, 없거나 만료되었다면 None
+        """
+        try:
+            row = await asyncio.to_thread(
+                self._execute,
+                "SELECT data FROM job_data WHERE jobId = ? AND expiresAt > ?",
+                (jobId, time.time()),
+            )
+        except sqlite3.Error:
+            metrics.increment("jobStore.error")
+            return None
+
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    async def set(self, jobId: str, version: int, value: Any, ttl: float):
+        """
+        작업 상태를 저장합니다.
+
+        저장소 오류와 직렬화할 수 없는 상태는 작업 실행에 영향을 주지 않도록 무시합니다.
+
+        Parameters:
+            jobId: 작업 ID
+            version: 작업 버전, 저장된 버전보다 큰 경우에만 기록
+            value: 작업 상태
+            ttl: 보관 시간(초)
+        """
+        try:
+            await asyncio.to_thread(
+                self._execute,
+                "INSERT INTO job_data (jobId, version, data, expiresAt)"
+                " VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (jobId) DO UPDATE SET"
+                " version = excluded.version,"
+                " data = excluded.data,"
+                " expiresAt = excluded.expiresAt"
+                " WHERE excluded.version > job_data.version",
+                (
+                    jobId,
+                    version,
+                    json.dumps(value, ensure_ascii=False),
+                    time.time() + ttl,
+                ),
+            )
+        except (sqlite3.Error, TypeError, ValueError):
+            metrics.increment("jobStore.error")
+
+    async def delete(self, jobId: str):
+        """
+        작업을 제거합니다.
+
+        Parameters:
+            jobId: 작업 ID
+        """
+        try:
+            await asyncio.to_thread(
+                self._execute, "DELETE FROM job_data WHERE jobId = ?", (jobId,)
+            )
+        except sqlite3.Error:
+            metrics.increment("jobStore.error")
+
+    async def purge(self):
+        """
+        만료된 작업을 제거합니다.
+        """
+        try:
+            await asyncio.to_thread(
+                self._execute,
+                "DELETE FROM job_data WHERE expiresAt <= ?",
+                (time.time(),),
+            )
+        except sqlite3.Error:
+            metrics.increment("jobStore.error")
+
+
+jobStore = JobStore(path=getSetting("EXTRACTOR_JOB_STORE_PATH", JOB_STORE_PATH))
@@ -0,0 +1,52 @@
+import sqlite3
+import threading
+from pathlib import Path
+
+
+class SqliteStore:
+    """
+    여러 워커 프로세스가 공유하는 SQLite 저장소의 기반 클래스입니다.
+
+    처음 연결할 때 schema의 테이블을 생성하며, 쿼리는 작업 스레드에서 실행합니다.
+    """
+
+    # 테이블 생성 쿼리
+    schema: tuple[str, ...] = ()
+
+    def __init__(self, path: str | Path):
+        self.path: Path = Path(path)
+
+        self._initialized: bool = False
+        self._lock = threading.Lock()
+
+    def _execute(self, query: str, params: tuple) -> tuple | None:
+        """
+        쿼리를 실행하고 첫 번째 행을 반환합니다. (작업 스레드에서 실행)
+        """
+        connection = self._connect()
+        try:
+            with connection:
+                return connection.execute(query, params).fetchone()
+        finally:
+            connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        저장소에 연결하고, 처음 연결하는 경우 테이블을 생성합니다.
+        """
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    connection = sqlite3.connect(self.path, timeout=5)
+                    try:
+                        # 여러 워커 프로세스의 동시 읽기 허용
+                        connection.execute("PRAGMA journal_mode=WAL")
+                        with connection:
+                            for query in self.schema:
+                                connection.execute(query)
+                    finally:
+                        connection.close()
+                    self._initialized = True
+
+        return sqlite3.connect(self.path, timeout=5)
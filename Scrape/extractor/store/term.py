@@ -0,0 +1,156 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+from Scrape.extractor.metrics import metrics
+from Scrape.extractor.settings import getSetting
+from Scrape.extractor.store.sqlite import SqliteStore
+
+# 저장소 기본값
+TERM_STORE_PATH = "data/term_store.sqlite3"
+TERM_STORE_RETENTION = 60 * 60 * 24 * 180
+
+
+class TermStore(SqliteStore):
+    """
+    종료된 학기의 추출 결과(강좌 목록, 시간표)를 보관하는 SQLite 저장소입니다.
+
+    종료된 학기의 데이터는 변하지 않으므로 보관 기간 동안 학교 시스템에 요청하지 않고 반환합니다.
+    비밀번호 변경 등으로 더 이상 조회되지 않는 데이터가 남지 않도록, 보관 기간이 지난 데이터는
+    저장 시점에 제거합니다.
+    학번과 비밀번호는 SECRET_KEY로 만든 HMAC 값으로만 저장하므로, 저장된 결과는
+    같은 인증 정보로 요청한 경우에만 반환됩니다.
+    """
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS term_data ("
+        " kind TEXT NOT NULL,"
+        " student TEXT NOT NULL,"
+        " year INTEGER NOT NULL,"
+        " semester INTEGER NOT NULL,"
+        " data TEXT NOT NULL,"
+        " createdAt REAL NOT NULL,"
+        " PRIMARY KEY (kind, student, year, semester))",
+        "CREATE INDEX IF NOT EXISTS term_data_createdAt ON term_data (createdAt)",
+    )
+
+    def __init__(
+        self, path: str | Path, secret: str, retention: float = TERM_STORE_RETENTION
+    ):
+        super().__init__(path)
+        self.retention: float = retention
+        self._secret: bytes = secret.encode()
+
+    async def get(
+        self, kind: str, studentId: str, password: str, year: int, semester: int
+    ) -> Any:
+        """
+        저장된 학기 데이터를 조회합니다.
+
+        저장소 오류는 저장된 데이터가 없는 것으로 처리합니다.
+
+        Parameters:
+            kind: 데이터 종류 ("courses", "timetable")
+            studentId: 학번
+            password: 비밀번호
+            year: 연도
+            semester: 학기
+
+        Returns:
+            value: 저장된 데이터, 없거나 보관 기간이 지났다면 None
+        """
+        student = self._getStudentKey(studentId=studentId, password=password)
+        try:
+            row = await asyncio.to_thread(
+                self._execute,
+                "SELECT data FROM term_data"
+                " WHERE kind = ? AND student = ? AND year = ? AND semester = ?"
+                " AND createdAt > ?",
+                (kind, student, year, semester, time.time() - self.retention),
+            )
+        except sqlite3.Error:
+            metrics.increment("termStore.error")
+            return None
+
+        if row is None:
+            metrics.increment("termStore.miss")
+            return None
+
+        metrics.increment("termStore.hit")
+        return json.loads(row[0])
+
+    async def set(
+        self,
+        kind: str,
+        studentId: str,
+        password: str,
+        year: int,
+        semester: int,
+        value: Any,
+    ):
+        """
+        학기 데이터를 저장합니다.
+
+        저장소 오류는 추출 결과에 영향을 주지 않도록 무시합니다.
+
+        Parameters:
+            kind: 데이터 종류 ("courses", "timetable")
+            studentId: 학번
+            password: 비밀번호
+            year: 연도
+            semester: 학기
+            value: 저장할 데이터
+        """
+        student = self._getStudentKey(studentId=studentId, password=password)
+        try:
+            await asyncio.to_thread(
+                self._execute,
+                "INSERT OR REPLACE INTO term_data"
+                " (kind, student, year, semester, data, createdAt)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    kind,
+                    student,
+                    year,
+                    semester,
+                    json.dumps(value, ensure_ascii=False),
+                    time.time(),
+                ),
+            )
+        except sqlite3.Error:
+            metrics.increment("termStore.error")
+            return
+
+        await self.purge()
+
+    async def purge(self):
+        """
+        보관 기간이 지난 데이터를 제거합니다.
+        """
+        try:
+            await asyncio.to_thread(
+                self._execute,
+                "DELETE FROM term_data WHERE createdAt <= ?",
+                (time.time() - self.retention,),
+            )
+        except sqlite3.Error:
+            metrics.increment("termStore.error")
+
+    def _getStudentKey(self, studentId: str, password: str) -> str:
+        """
+        학번과 비밀번호로 저장소 키를 생성합니다.
+        """
+        message = f"{studentId}\n{password}".encode()
+        return hmac.new(self._secret, message, hashlib.sha256).hexdigest()
+
+
+termStore = TermStore(
+    path=getSetting("EXTRACTOR_TERM_STORE_PATH", TERM_STORE_PATH),
+    secret=getSetting("SECRET_KEY", ""),
+    retention=getSetting("EXTRACTOR_TERM_STORE_RETENTION", TERM_STORE_RETENTION),
+)
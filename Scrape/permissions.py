@@ -0,0 +1,52 @@
+import hmac
+import ipaddress
+
+from django.conf import settings
+from rest_framework.permissions import BasePermission
+
+# 내부 접근 허용 기본값
+INTERNAL_ALLOWED_IPS = ("127.0.0.1", "::1")
+
+
+class InternalAccessPermission(BasePermission):
+    """
+    모니터링 등 내부용 API에 대한 접근을 제한하는 Permission입니다.
+
+    요청 주소(REMOTE_ADDR)가 EXTRACTOR_INTERNAL_ALLOWED_IPS의 주소 또는 네트워크에 속하거나,
+    EXTRACTOR_INTERNAL_TOKEN이 설정된 경우 Authorization 헤더로 같은 토큰(Bearer)을 전달한 요청만 허용합니다.
+    X-Forwarded-For 등 클라이언트가 조작할 수 있는 헤더는 사용하지 않습니다.
+    """
+
+    message = "내부 접근만 허용된 API입니다."
+
+    def has_permission(self, request, view) -> bool:
+        return self._hasToken(request) or self._isAllowedAddress(request)
+
+    @staticmethod
+    def _hasToken(request) -> bool:
+        token = getattr(settings, "EXTRACTOR_INTERNAL_TOKEN", "")
+        if not token:
+            return False
+
+        scheme, _, credential = request.headers.get("Authorization", "").partition(" ")
+        if scheme.lower() != "bearer":
+            return False
+        return hmac.compare_digest(credential.strip().encode(), token.encode())
+
+    @staticmethod
+    def _isAllowedAddress(request) -> bool:
+        try:
+            address = ipaddress.ip_address(request.META.get("REMOTE_ADDR", ""))
+        except ValueError:
+            return False
+
+        allowedIps = getattr(
+            settings, "EXTRACTOR_INTERNAL_ALLOWED_IPS", INTERNAL_ALLOWED_IPS
+        )
+        for allowed in allowedIps:
+            try:
+                if address in ipaddress.ip_network(allowed, strict=False):
+                    return True
+            except ValueError:
+                continue
+        return False
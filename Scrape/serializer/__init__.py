@@ -1,10 +1,13 @@
 from .auth import *
 from .course import *
+from .notice import *
 from .response.activity_response import *
 from .response.assignment_response import *
 from .response.attendance_response import *
 from .response.auth_response import *
 from .response.course_response import *
+from .response.job_response import *
+from .response.metrics_response import *
 from .response.notice_response import *
 from .response.timetable_response import *
 from .timetable import *
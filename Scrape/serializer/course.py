@@ -1,5 +1,31 @@
 from rest_framework import serializers
 
+from Scrape.extractor.parts.constants import LMS_COURSE_FIELDS
+
+
+class CourseFieldsField(serializers.MultipleChoiceField):
+    """
+    강좌 데이터 추출 항목을 목록 또는 쉼표로 구분된 문자열로 입력받는 필드입니다.
+
+    출석 정보는 활동 데이터에 병합되므로, 활동 항목 없이 출석 항목만 요청할 수 없습니다.
+    """
+
+    default_error_messages = {
+        "attendanceWithoutActivities": "출석(attendance)은 활동(activities)과 함께 요청해야 합니다.",
+    }
+
+    def __init__(self, **kwargs):
+        super().__init__(choices=LMS_COURSE_FIELDS, **kwargs)
+
+    def to_internal_value(self, data):
+        if isinstance(data, str):
+            data = [field.strip() for field in data.split(",") if field.strip()]
+        value = super().to_internal_value(data)
+
+        if "attendance" in value and "activities" not in value:
+            self.fail("attendanceWithoutActivities")
+        return value
+
 
 class CourseSerializer(serializers.Serializer):
     studentId = serializers.CharField(
@@ -32,3 +58,59 @@ class CourseSerializer(serializers.Serializer):
     )
 
     extract = serializers.BooleanField(required=False, default=True)
+
+    stream = serializers.BooleanField(
+        label="스트리밍 응답", required=False, default=False
+    )
+
+    include = CourseFieldsField(
+        label="추출 항목 (notices, activities, attendance), attendance는 activities와 함께 사용",
+        required=False,
+    )
+
+    assignmentDetail = serializers.BooleanField(
+        label="과제 상세 정보 추출 여부", required=False, default=True
+    )
+
+    knownNotices = serializers.ListField(
+        label="이미 가진 공지사항 식별값 (fingerprint)",
+        child=serializers.CharField(),
+        required=False,
+    )
+
+
+class CourseDetailSerializer(serializers.Serializer):
+    studentId = serializers.CharField(
+        label="학번",
+        required=True,
+        min_length=9,
+        max_length=9,
+        error_messages={
+            "required": "학번은 필수 항목입니다.",
+            "blank": "학번은 필수 항목입니다.",
+        },
+    )
+
+    password = serializers.CharField(
+        label="비밀번호",
+        required=True,
+        error_messages={
+            "required": "비밀번호는 필수 항목입니다.",
+            "blank": "비밀번호는 필수 항목입니다.",
+        },
+    )
+
+    include = CourseFieldsField(
+        label="추출 항목 (notices, activities, attendance), attendance는 activities와 함께 사용",
+        required=False,
+    )
+
+    assignmentDetail = serializers.BooleanField(
+        label="과제 상세 정보 추출 여부", required=False, default=True
+    )
+
+    knownNotices = serializers.ListField(
+        label="이미 가진 공지사항 식별값 (fingerprint)",
+        child=serializers.CharField(),
+        required=False,
+    )
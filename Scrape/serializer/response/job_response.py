@@ -0,0 +1,30 @@
+from rest_framework import serializers
+
+from Scrape.serializer.response.course_response import CourseItemSerializer
+
+
+class JobSubmitItemSerializer(serializers.Serializer):
+    jobId = serializers.CharField()
+    status = serializers.CharField()
+
+
+class JobSubmitResponseSerializer(serializers.Serializer):
+    data = JobSubmitItemSerializer()
+
+
+class JobItemSerializer(serializers.Serializer):
+    jobId = serializers.CharField()
+    status = serializers.ChoiceField(choices=["pending", "running", "done", "failed"])
+    partial = serializers.ListField(child=CourseItemSerializer())
+    result = serializers.ListField(child=CourseItemSerializer(), allow_null=True)
+    message = serializers.CharField(allow_null=True)
+    createdAt = serializers.FloatField()
+    finishedAt = serializers.FloatField(allow_null=True)
+
+
+class JobResponseSerializer(serializers.Serializer):
+    data = JobItemSerializer()
+
+
+class JobErrorResponse(serializers.Serializer):
+    message = serializers.CharField()
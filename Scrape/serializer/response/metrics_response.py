@@ -0,0 +1,10 @@
+from rest_framework import serializers
+
+
+class MetricsItemSerializer(serializers.Serializer):
+    counters = serializers.DictField(child=serializers.FloatField())
+    gauges = serializers.DictField()
+
+
+class MetricsResponseSerializer(serializers.Serializer):
+    data = MetricsItemSerializer()
@@ -8,12 +8,14 @@ class FileItemSerializer(serializers.Serializer):
 
 class NoticeItemSerializer(serializers.Serializer):
     link = serializers.CharField()
-    content = serializers.CharField()
+    content = serializers.CharField(required=False)
     index = serializers.CharField()
     title = serializers.CharField()
     professor = serializers.CharField()
     date = serializers.DateField()
-    files = serializers.ListField(child=FileItemSerializer())
+    files = serializers.ListField(child=FileItemSerializer(), required=False)
+    fingerprint = serializers.CharField()
+    unchanged = serializers.BooleanField()
 
 
 class NoticeResponseSerializer(serializers.Serializer):
@@ -0,0 +1,43 @@
+from bs4 import BeautifulSoup, Tag
+
+
+def extractContentReference(container: Tag) -> str:
+    """
+    단일 순회로 변경하기 전의 Utils.extractContent 구현입니다. (비교 기준)
+
+    줄바꿈(br) 요소를 [BR] 문자열로 교체하므로 문서를 변경합니다.
+
+    Parameters:
+        container: BeautifulSoup 요소
+
+    Returns:
+        content: 추출된 텍스트
+    """
+    for lineBreak in container.find_all("br"):
+        lineBreak.replace_with("[BR]")
+
+    contentList = []
+    elements = container.find_all(
+        ["h1", "h2", "h3", "h4", "h5", "h6", "p", "div", "li"], recursive=True
+    )
+
+    if elements:
+        for element in elements:
+            if element.name == "li":
+                text = element.get_text(separator=" ", strip=True)
+            else:
+                text = element.get_text(strip=True)
+            if text:
+                contentList.append(text)
+    else:
+        contentList.append(container.get_text(strip=True))
+
+    content = "\n".join(contentList)
+    return content.replace("[BR]", "")
+
+
+def parseReference(data: str | bytes) -> BeautifulSoup:
+    """
+    비교 기준 구현에 전달할 문서를 파싱합니다.
+    """
+    return BeautifulSoup(data, "lxml")
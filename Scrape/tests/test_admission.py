@@ -0,0 +1,124 @@
+import asyncio
+
+from django.test import SimpleTestCase
+
+from Scrape.extractor.admission import AdmissionController, AdmissionRejected
+from Scrape.extractor.exception import ErrorType
+from Scrape.extractor.parts import Utils
+
+VICTIM_KEY = Utils.getCredentialKey(studentId="201912345", password="password")
+ATTACKER_KEY = Utils.getCredentialKey(studentId="201912345", password="wrong")
+
+
+class AdmissionControllerTest(SimpleTestCase):
+    """
+    승인 제어기의 전체 한도, 학생별 한도, 대기 시간 초과, 재시도 권장 시간을 검증합니다.
+    """
+
+    def createController(self, **kwargs) -> AdmissionController:
+        options = {
+            "maxInFlight": 2,
+            "perStudent": 2,
+            "queueSize": 2,
+            "maxWait": 1.0,
+            "studentWait": 0.05,
+        }
+        options.update(kwargs)
+        return AdmissionController(**options)
+
+    async def testGlobalLimitQueues(self):
+        controller = self.createController(perStudent=8)
+        await controller.acquire(("a", "1"))
+        await controller.acquire(("b", "1"))
+
+        waiter = asyncio.create_task(controller.acquire(("c", "1")))
+        await asyncio.sleep(0)
+        self.assertFalse(waiter.done())
+        self.assertEqual(controller.stats()["waiting"], 1)
+
+        controller.release(("a", "1"))
+        await asyncio.wait_for(waiter, timeout=1)
+        self.assertEqual(controller.inFlight, 2)
+        self.assertEqual(controller.stats()["waiting"], 0)
+
+    async def testQueueFullRejected(self):
+        controller = self.createController(perStudent=8, queueSize=1)
+        await controller.acquire(("a", "1"))
+        await controller.acquire(("b", "1"))
+        waiter = asyncio.create_task(controller.acquire(("c", "1")))
+        await asyncio.sleep(0)
+
+        with self.assertRaises(AdmissionRejected) as context:
+            await controller.acquire(("d", "1"))
+        self.assertEqual(context.exception.type, ErrorType.SERVER_BUSY)
+        self.assertGreaterEqual(context.exception.retryAfter, 1)
+
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+        self.assertEqual(controller.stats()["waiting"], 0)
+
+    async def testQueueTimeoutRejected(self):
+        controller = self.createController(maxInFlight=1, perStudent=8, maxWait=0.05)
+        controller.serviceTime = 0.01
+        await controller.acquire(("a", "1"))
+
+        with self.assertRaises(AdmissionRejected) as context:
+            await controller.acquire(("b", "1"))
+        self.assertEqual(context.exception.type, ErrorType.SERVER_BUSY)
+        self.assertEqual(controller.inFlight, 1)
+        self.assertEqual(controller.stats()["waiting"], 0)
+        self.assertEqual(controller.stats()["students"], 1)
+
+    async def testPerStudentLimitRejected(self):
+        controller = self.createController(maxInFlight=8)
+        await controller.acquire(VICTIM_KEY)
+        await controller.acquire(VICTIM_KEY)
+
+        with self.assertRaises(AdmissionRejected) as context:
+            await controller.acquire(VICTIM_KEY)
+        self.assertEqual(context.exception.type, ErrorType.TOO_MANY_REQUESTS)
+        self.assertEqual(controller.inFlight, 2)
+
+    async def testPerStudentWaitsForRelease(self):
+        controller = self.createController(maxInFlight=8, studentWait=1.0)
+        await controller.acquire(VICTIM_KEY)
+        await controller.acquire(VICTIM_KEY)
+
+        waiter = asyncio.create_task(controller.acquire(VICTIM_KEY))
+        await asyncio.sleep(0.01)
+        self.assertFalse(waiter.done())
+
+        controller.release(VICTIM_KEY)
+        await asyncio.wait_for(waiter, timeout=1)
+        self.assertEqual(controller.inFlight, 2)
+
+    async def testPerStudentLimitKeyedOnCredential(self):
+        controller = self.createController(maxInFlight=8)
+        await controller.acquire(ATTACKER_KEY)
+        await controller.acquire(ATTACKER_KEY)
+
+        # 같은 학번이라도 다른 비밀번호로 보낸 요청은 슬롯을 공유하지 않음
+        await controller.acquire(VICTIM_KEY)
+        self.assertEqual(controller.inFlight, 3)
+
+    async def testRetryAfterFromServiceTime(self):
+        controller = self.createController(maxInFlight=8, perStudent=1)
+        controller.serviceTime = 2.4
+        await controller.acquire(VICTIM_KEY)
+
+        with self.assertRaises(AdmissionRejected) as context:
+            await controller.acquire(VICTIM_KEY)
+        self.assertEqual(context.exception.retryAfter, 3)
+
+        controller.serviceTime = 0.001
+        with self.assertRaises(AdmissionRejected) as context:
+            await controller.acquire(VICTIM_KEY)
+        self.assertEqual(context.exception.retryAfter, 1)
+
+    async def testSlotReleases(self):
+        controller = self.createController()
+        async with controller.slot(VICTIM_KEY):
+            self.assertEqual(controller.inFlight, 1)
+        self.assertEqual(controller.inFlight, 0)
+        self.assertEqual(controller.stats()["students"], 0)
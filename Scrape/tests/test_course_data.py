@@ -0,0 +1,176 @@
+import asyncio
+from pathlib import Path
+from unittest import mock
+from urllib.parse import urlparse
+
+from django.test import SimpleTestCase
+
+from Scrape.extractor import Extractor
+from Scrape.extractor.cache import ContentCache, LruCache
+from Scrape.extractor.parser import ParseProfile, parseDocument
+from Scrape.extractor.parts import lms
+from Scrape.extractor.parts.constants import LMS_COURSE_PAGE_URL
+from Scrape.serializer import CourseSerializer
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+# 경로별 응답 문서
+FIXTURE_PAGES = {
+    "/course/view.php": "lms_course.html",
+    "/mod/ubboard/view.php": "lms_board.html",
+    "/mod/ubboard/article.php": "lms_notice.html",
+    "/mod/assign/view.php": "lms_assignment.html",
+    "/report/ubcompletion/user_progress_a.php": "lms_attendance.html",
+}
+
+
+class FixtureExtractor(Extractor):
+    """
+    LMS 요청 대신 테스트 HTML 문서를 반환하고, 요청한 경로를 기록하는 추출기입니다.
+    """
+
+    def __init__(self):
+        super().__init__(studentId="201912345", password="password")
+        self.requests: list[str] = []
+
+    async def _lmsRequest(self, url: str, profile: ParseProfile | None = None):
+        path = urlparse(url).path
+        self.requests.append(path)
+        data = (FIXTURE_DIR / FIXTURE_PAGES[path]).read_bytes()
+        return await parseDocument(data, profile=profile)
+
+
+class CourseDataTest(SimpleTestCase):
+    """
+    강좌 데이터 추출 항목(include)과 공지사항 식별값(knownNotices)에 따른 요청, 결과를 검증합니다.
+    """
+
+    def setUp(self):
+        # 테스트 간 공유 캐시 분리
+        for name, cache in (
+            ("lmsContentCache", ContentCache(name="test", maxSize=64, ttl=60)),
+            ("lmsAssignmentCache", LruCache(maxSize=64, ttl=60)),
+        ):
+            patcher = mock.patch.object(lms, name, cache)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def getCourseData(self, **kwargs) -> tuple[dict, list[str]]:
+        extractor = FixtureExtractor()
+        course = {"link": LMS_COURSE_PAGE_URL.format("40101"), "code": "40101"}
+        course = await extractor._getCourseData(course, **kwargs)
+        return course, extractor.requests
+
+    async def testAllFields(self):
+        course, requests = await self.getCourseData()
+        self.assertEqual(len(course["notices"]), 3)
+        self.assertIn("/report/ubcompletion/user_progress_a.php", requests)
+
+        lectures = [
+            activity
+            for week in course["activities"]
+            for activity in week["activities"]
+            if activity.get("type") == "lecture"
+        ]
+        self.assertTrue(lectures)
+        self.assertTrue(all("attendance" in lecture for lecture in lectures))
+
+    async def testNoticesOnly(self):
+        course, requests = await self.getCourseData(include={"notices"})
+        self.assertIn("notices", course)
+        self.assertNotIn("activities", course)
+        self.assertNotIn("/report/ubcompletion/user_progress_a.php", requests)
+        self.assertNotIn("/mod/assign/view.php", requests)
+
+    async def testActivitiesWithoutAttendance(self):
+        course, requests = await self.getCourseData(include={"activities"})
+        self.assertNotIn("notices", course)
+        self.assertNotIn("/mod/ubboard/view.php", requests)
+        self.assertNotIn("/report/ubcompletion/user_progress_a.php", requests)
+        for week in course["activities"]:
+            for activity in week["activities"]:
+                self.assertNotIn("attendance", activity)
+
+    async def testKnownNotices(self):
+        course, requests = await self.getCourseData(include={"notices"})
+        self.assertEqual(requests.count("/mod/ubboard/article.php"), 3)
+        self.assertFalse(any(notice["unchanged"] for notice in course["notices"]))
+
+        known = course["notices"][0]
+        course, requests = await self.getCourseData(
+            include={"notices"}, knownNotices={known["fingerprint"]}
+        )
+        notices = {notice["fingerprint"]: notice for notice in course["notices"]}
+        self.assertTrue(notices[known["fingerprint"]]["unchanged"])
+        self.assertNotIn("content", notices[known["fingerprint"]])
+        self.assertEqual(sum(notice["unchanged"] for notice in course["notices"]), 1)
+
+
+class DelayedExtractor(Extractor):
+    """
+    강좌 목록 순서와 반대로 강좌 데이터 추출이 완료되는 추출기입니다.
+    """
+
+    def __init__(self, count: int):
+        super().__init__(studentId="201912345", password="password")
+        self.courseList = [{"code": str(index)} for index in range(count)]
+
+    async def _getCourseList(self, close: bool = True) -> list:
+        return self.courseList
+
+    async def _getCourseData(self, course: dict, **kwargs) -> dict:
+        await asyncio.sleep(0.01 * (len(self.courseList) - int(course["code"])))
+        return course
+
+    async def _releaseLmsSession(self):
+        pass
+
+
+class CoursesOrderTest(SimpleTestCase):
+    """
+    모든 강좌 추출 결과의 반환 순서를 검증합니다.
+    """
+
+    async def testGetCoursesKeepsListOrder(self):
+        courses = await DelayedExtractor(3).getCourses(
+            year=None, semester=None, extract=True
+        )
+        self.assertEqual([course["code"] for course in courses], ["0", "1", "2"])
+
+    async def testIterCoursesCompletionOrder(self):
+        courses = DelayedExtractor(3).iterCourses(
+            year=None, semester=None, extract=True
+        )
+        codes = [course["code"] async for course in courses]
+        self.assertEqual(codes, ["2", "1", "0"])
+
+
+class CourseSerializerIncludeTest(SimpleTestCase):
+    """
+    강좌 데이터 추출 항목(include) 입력 검증을 확인합니다.
+    """
+
+    def validate(self, include):
+        serializer = CourseSerializer(
+            data={"studentId": "201912345", "password": "password", "include": include}
+        )
+        return serializer.is_valid(), serializer
+
+    def testCommaSeparated(self):
+        valid, serializer = self.validate("notices, activities")
+        self.assertTrue(valid)
+        self.assertEqual(
+            set(serializer.validated_data["include"]), {"notices", "activities"}
+        )
+
+    def testAttendanceWithActivities(self):
+        valid, _ = self.validate(["activities", "attendance"])
+        self.assertTrue(valid)
+
+    def testAttendanceOnlyRejected(self):
+        valid, serializer = self.validate(["attendance"])
+        self.assertFalse(valid)
+        self.assertIn("include", serializer.errors)
+
+        valid, _ = self.validate("notices,attendance")
+        self.assertFalse(valid)
@@ -0,0 +1,92 @@
+import asyncio
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from Scrape.extractor.admission import AdmissionController
+from Scrape.extractor.exception import ErrorType, ExtractorException
+from Scrape.views import base, course
+from Scrape.views.course import CourseStream, CourseView
+
+
+class Courses:
+    """
+    강좌 데이터를 순서대로 반환하고, 종료 여부를 기록하는 비동기 제너레이터입니다.
+    """
+
+    def __init__(self, count: int, error: Exception | None = None):
+        self.count: int = count
+        self.error: Exception | None = error
+        self.closed: bool = False
+
+    async def __call__(self):
+        try:
+            if self.error is not None:
+                raise self.error
+            for index in range(self.count):
+                await asyncio.sleep(0)
+                yield {"code": str(index)}
+        finally:
+            self.closed = True
+
+
+class CourseStreamTest(SimpleTestCase):
+    """
+    강좌 스트리밍 응답의 실행 슬롯 할당, 반환 시점을 검증합니다.
+    """
+
+    def setUp(self):
+        self.admission = AdmissionController(
+            maxInFlight=2, perStudent=2, queueSize=2, maxWait=1.0
+        )
+        for module in (base, course):
+            patcher = mock.patch.object(module, "admission", self.admission)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def startStream(self, courses: Courses) -> CourseStream:
+        view = CourseView()
+        view.headers = {}
+        stream = CourseStream(view=view, courses=courses())
+        await stream.start(studentId="201912345", password="password")
+        return stream
+
+    async def testReleasedAfterStream(self):
+        courses = Courses(3)
+        stream = await self.startStream(courses)
+        self.assertEqual(self.admission.inFlight, 1)
+
+        lines = [line async for line in stream]
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(courses.closed)
+        self.assertEqual(self.admission.inFlight, 0)
+
+    async def testReleasedOnCloseBeforeIteration(self):
+        courses = Courses(3)
+        stream = await self.startStream(courses)
+
+        # 응답 종료 처리는 별도 스레드에서 호출됨
+        await asyncio.to_thread(stream.close)
+        await asyncio.sleep(0.01)
+        self.assertTrue(courses.closed)
+        self.assertEqual(self.admission.inFlight, 0)
+
+    async def testReleasedOnDisconnect(self):
+        courses = Courses(3)
+        stream = await self.startStream(courses)
+
+        lines = aiter(stream)
+        await anext(lines)
+        await asyncio.to_thread(stream.close)
+        await asyncio.sleep(0.01)
+        self.assertTrue(courses.closed)
+        self.assertEqual(self.admission.inFlight, 0)
+
+    async def testListErrorReleased(self):
+        courses = Courses(
+            3, error=ExtractorException(errorType=ErrorType.TIMETABLE_NOT_EXIST)
+        )
+        with self.assertRaises(ExtractorException):
+            await self.startStream(courses)
+        self.assertTrue(courses.closed)
+        self.assertEqual(self.admission.inFlight, 0)
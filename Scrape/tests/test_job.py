@@ -0,0 +1,199 @@
+import asyncio
+import tempfile
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+from Scrape.extractor.admission import AdmissionController
+from Scrape.extractor.exception import ErrorType, ExtractorException
+from Scrape.extractor.job import Job, JobQueue
+from Scrape.extractor.store import JobStore
+
+CREDENTIAL_KEY = ("201912345", "credential")
+
+
+class JobTestCase(SimpleTestCase):
+    """
+    임시 디렉토리의 작업 저장소를 사용하는 테스트 기반 클래스입니다.
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.store = JobStore(path=Path(directory.name) / "job_store.sqlite3")
+        self.queues: list[JobQueue] = []
+
+    def createQueue(self, **kwargs) -> JobQueue:
+        options = {
+            "workers": 1,
+            "maxSize": 4,
+            "ttl": 60,
+            "maxResults": 16,
+            "store": self.store,
+        }
+        options.update(kwargs)
+        queue = JobQueue(**options)
+        self.queues.append(queue)
+        return queue
+
+    async def closeQueues(self):
+        workers = [worker for queue in self.queues for worker in queue._workers]
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    async def waitFinished(self, queue: JobQueue, job: Job):
+        # 최종 상태가 저장소에 기록될 때까지 대기
+        for _ in range(200):
+            if job.id not in queue._active:
+                return
+            await asyncio.sleep(0.01)
+        self.fail("작업이 완료되지 않았습니다.")
+
+
+class JobQueueTest(JobTestCase):
+    """
+    작업 큐의 실행, 부분 결과, 결과 제거, 승인 제어 동작을 검증합니다.
+    """
+
+    async def testRunWithPartial(self):
+        queue = self.createQueue()
+        started = asyncio.Event()
+        proceed = asyncio.Event()
+
+        async def run(job: Job) -> list:
+            await queue.addPartial(job, "first")
+            started.set()
+            await proceed.wait()
+            return ["first", "second"]
+
+        job = await queue.submit(run)
+        await started.wait()
+
+        value = await queue.get(job.id)
+        self.assertEqual(value["status"], "running")
+        self.assertEqual(value["partial"], ["first"])
+
+        proceed.set()
+        await self.waitFinished(queue, job)
+        value = await queue.get(job.id)
+        self.assertEqual(value["status"], "done")
+        self.assertEqual(value["result"], ["first", "second"])
+        self.assertEqual(value["partial"], [])
+        await self.closeQueues()
+
+    async def testFinishedRemovedAfterFetch(self):
+        queue = self.createQueue()
+
+        async def run(job: Job) -> str:
+            return "result"
+
+        job = await queue.submit(run)
+        await self.waitFinished(queue, job)
+
+        self.assertEqual((await queue.get(job.id))["result"], "result")
+        self.assertIsNone(await queue.get(job.id))
+        self.assertIsNone(await self.store.get(job.id))
+        await self.closeQueues()
+
+    async def testSharedAcrossQueues(self):
+        queue = self.createQueue()
+        other = self.createQueue()
+
+        async def run(job: Job) -> str:
+            return "result"
+
+        job = await queue.submit(run)
+        await self.waitFinished(queue, job)
+
+        # 다른 워커 프로세스에서 조회한 결과도 한 번만 반환
+        self.assertEqual((await other.get(job.id))["result"], "result")
+        self.assertIsNone(await other.get(job.id))
+        await self.closeQueues()
+
+    async def testFailedKeepsPartial(self):
+        queue = self.createQueue()
+
+        async def run(job: Job):
+            await queue.addPartial(job, "first")
+            raise ExtractorException(errorType=ErrorType.TIMETABLE_NOT_EXIST)
+
+        job = await queue.submit(run)
+        await self.waitFinished(queue, job)
+
+        value = await queue.get(job.id)
+        self.assertEqual(value["status"], "failed")
+        self.assertEqual(value["partial"], ["first"])
+        self.assertEqual(value["message"], ErrorType.TIMETABLE_NOT_EXIST.message)
+        await self.closeQueues()
+
+    async def testQueueFull(self):
+        queue = self.createQueue(workers=0, maxSize=1)
+
+        async def run(job: Job):
+            return None
+
+        await queue.submit(run)
+        with self.assertRaises(ExtractorException) as context:
+            await queue.submit(run)
+        self.assertEqual(context.exception.type, ErrorType.JOB_QUEUE_FULL)
+        await self.closeQueues()
+
+    async def testRunsInAdmissionSlot(self):
+        admission = AdmissionController(
+            maxInFlight=4, perStudent=1, queueSize=4, maxWait=1.0, studentWait=0
+        )
+        queue = self.createQueue(admission=admission)
+        inFlight = []
+
+        async def run(job: Job):
+            inFlight.append(admission.inFlight)
+
+        job = await queue.submit(run, credentialKey=CREDENTIAL_KEY)
+        await self.waitFinished(queue, job)
+        self.assertEqual(inFlight, [1])
+        self.assertEqual(admission.inFlight, 0)
+
+        # 학생별 한도를 넘으면 작업 실패
+        await admission.acquire(CREDENTIAL_KEY)
+        job = await queue.submit(run, credentialKey=CREDENTIAL_KEY)
+        await self.waitFinished(queue, job)
+        admission.release(CREDENTIAL_KEY)
+
+        value = await queue.get(job.id)
+        self.assertEqual(value["status"], "failed")
+        self.assertEqual(value["message"], ErrorType.TOO_MANY_REQUESTS.message)
+        self.assertEqual(inFlight, [1])
+        await self.closeQueues()
+
+
+class JobStoreTest(JobTestCase):
+    """
+    작업 저장소의 버전, 만료, 제거 동작을 검증합니다.
+    """
+
+    async def testNewerVersionOnly(self):
+        await self.store.set(jobId="job", version=2, value={"status": "done"}, ttl=60)
+        await self.store.set(
+            jobId="job", version=1, value={"status": "running"}, ttl=60
+        )
+        self.assertEqual(await self.store.get("job"), {"status": "done"})
+
+    async def testExpired(self):
+        await self.store.set(jobId="job", version=1, value={}, ttl=-1)
+        self.assertIsNone(await self.store.get("job"))
+
+        await self.store.purge()
+        row = await asyncio.to_thread(
+            self.store._execute, "SELECT COUNT(*) FROM job_data", ()
+        )
+        self.assertEqual(row[0], 0)
+
+    async def testDelete(self):
+        await self.store.set(jobId="job", version=1, value={}, ttl=60)
+        await self.store.delete("job")
+        self.assertIsNone(await self.store.get("job"))
+
+    async def testUnserializableIgnored(self):
+        await self.store.set(jobId="job", version=1, value={"value": object()}, ttl=60)
+        self.assertIsNone(await self.store.get("job"))
@@ -0,0 +1,45 @@
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+from Scrape.extractor.parts.kutis import KutisExtractor
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+
+class KutisLoginNoticeTest(SimpleTestCase):
+    """
+    세션이 거부된 KUTIS 200 응답(로그인 페이지 이동 안내)을 구분하는지 검증합니다.
+    """
+
+    def testScriptRedirect(self):
+        body = (
+            "<html><script>alert('세션이 만료되었습니다.');"
+            " top.location.href = '/webkutis/view/indexWeb.jsp';</script></html>"
+        ).encode()
+        self.assertTrue(KutisExtractor._isKutisLoginNotice(body))
+
+    def testLocationReplace(self):
+        body = b"<script>location.replace('https://kutis.kyonggi.ac.kr/webkutis/view/indexWeb.jsp')</script>"
+        self.assertTrue(KutisExtractor._isKutisLoginNotice(body))
+
+    def testMetaRefresh(self):
+        body = b'<html><head><meta http-equiv="Refresh" content="0; url=/webkutis/view/indexWeb.jsp"></head></html>'
+        self.assertTrue(KutisExtractor._isKutisLoginNotice(body))
+
+    def testTimetablePage(self):
+        body = (FIXTURE_DIR / "kutis_timetable.html").read_bytes()
+        self.assertFalse(KutisExtractor._isKutisLoginNotice(body))
+
+    def testLogoutLinkInPage(self):
+        # 일반 페이지 메뉴의 로그아웃 버튼은 이동 안내로 판단하지 않음
+        body = (
+            (FIXTURE_DIR / "kutis_timetable.html")
+            .read_bytes()
+            .replace(
+                b"<body>",
+                b"<body><a onclick=\"location.href='/webkutis/view/indexWeb.jsp'\">logout</a>"
+                + b"<!-- menu -->" * 400,
+            )
+        )
+        self.assertFalse(KutisExtractor._isKutisLoginNotice(body))
@@ -0,0 +1,72 @@
+from django.test import SimpleTestCase
+
+from Scrape.extractor.cache import LruCache
+
+
+class LruCacheTest(SimpleTestCase):
+    """
+    TTL 만료, LRU 제거, 제거 콜백 동작을 검증합니다.
+    """
+
+    def setUp(self):
+        self.evicted = []
+        self.cache = LruCache(
+            maxSize=3,
+            ttl=60,
+            onEvict=lambda key, value: self.evicted.append((key, value)),
+        )
+
+    def testGetSet(self):
+        self.cache.set("a", 1)
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertIsNone(self.cache.get("missing"))
+        self.assertEqual(self.cache.get("missing", 0), 0)
+        self.assertIn("a", self.cache)
+
+    def testLeastRecentlyUsedEvicted(self):
+        for key in ("a", "b", "c"):
+            self.cache.set(key, key)
+        # a를 최근 사용 항목으로 갱신
+        self.cache.get("a")
+        self.cache.set("d", "d")
+
+        self.assertEqual(self.evicted, [("b", "b")])
+        self.assertEqual([key for key, _ in self.cache.items()], ["c", "a", "d"])
+
+    def testExpiredOnGet(self):
+        self.cache.set("a", 1, ttl=0)
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(self.evicted, [("a", 1)])
+
+    def testExpiredOldestPurgedOnSet(self):
+        self.cache.set("a", 1, ttl=0)
+        self.cache.set("b", 2)
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(self.evicted, [("a", 1)])
+
+    def testExpiredBehindLivePurgedPeriodically(self):
+        self.cache.set("a", 1)
+        self.cache.set("b", 2, ttl=0)
+        # 앞쪽의 유효한 항목 뒤에 있는 만료 항목은 전체 정리 전까지 남음
+        self.assertEqual(len(self.cache), 2)
+
+        self.cache.set("c", 3)
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.evicted, [("b", 2)])
+
+    def testReplaceEvictsPrevious(self):
+        self.cache.set("a", 1)
+        self.cache.set("a", 2)
+        self.assertEqual(self.evicted, [("a", 1)])
+        self.assertEqual(self.cache.get("a"), 2)
+
+        # 같은 값으로 갱신한 경우 제거 콜백을 호출하지 않음
+        self.cache.set("a", 2)
+        self.assertEqual(self.evicted, [("a", 1)])
+
+    def testDelete(self):
+        self.cache.set("a", 1)
+        self.cache.delete("a")
+        self.cache.delete("a")
+        self.assertNotIn("a", self.cache)
+        self.assertEqual(self.evicted, [("a", 1)])
@@ -0,0 +1,207 @@
+import re
+from pathlib import Path
+from typing import Any
+
+from django.test import SimpleTestCase
+
+from Scrape.extractor.parser import Node, ParseProfile
+from Scrape.extractor.parser.lxml_backend import LxmlDocumentStream, parseLxml
+from Scrape.extractor.parser.soup_backend import parseSoup
+from Scrape.extractor.parts.constants import LMS_PARSE_PROFILES
+from Scrape.extractor.parts.schemas import (
+    AssignmentPageSchema,
+    AttendancePageSchema,
+    BoardPageSchema,
+    CourseHeaderSchema,
+    CourseHomeSchema,
+    CourseNoticeLinkSchema,
+    CoursePageSchema,
+    MainPageSchema,
+    NoticeSchema,
+    PastCoursePageSchema,
+    TimetablePageSchema,
+    UserSchema,
+    WeekSchema,
+)
+from Scrape.extractor.parts.utils import Utils
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+# (HTML 문서, 문서 인코딩, 부분 파싱 설정 이름, 스키마 목록)
+SCHEMA_CASES = (
+    ("lms_main.html", None, "main", (MainPageSchema,)),
+    ("lms_past_course.html", None, "pastCourse", (PastCoursePageSchema,)),
+    ("lms_user.html", None, "user", (UserSchema,)),
+    (
+        "lms_course.html",
+        None,
+        "course",
+        (
+            CourseHeaderSchema,
+            CourseHomeSchema,
+            CourseNoticeLinkSchema,
+            CoursePageSchema,
+        ),
+    ),
+    ("lms_board.html", None, "board", (BoardPageSchema,)),
+    ("lms_board_empty.html", None, "board", (BoardPageSchema,)),
+    ("lms_notice.html", None, "notice", (NoticeSchema,)),
+    ("lms_assignment.html", None, "assignment", (AssignmentPageSchema,)),
+    ("lms_attendance.html", None, "attendance", (AttendancePageSchema,)),
+    ("kutis_timetable.html", "euc-kr", None, (TimetablePageSchema,)),
+)
+
+# 텍스트 추출 옵션
+TEXT_OPTIONS = (
+    {},
+    {"strip": True},
+    {"separator": " ", "strip": True, "lineBreak": "[BR]"},
+    {"recursive": False},
+)
+
+# 요소 검색 조건
+FIND_CASES = (
+    (("div",), {"class_": "text_to_html"}),
+    (("td",), {}),
+    (("li",), {"id": re.compile(r"section-[1-9]\d*")}),
+    ((["td", "th"],), {}),
+    ((None,), {"class_": "activity"}),
+    (("a",), {"href": re.compile(r"/mod/")}),
+)
+
+
+def _loadFixture(name: str) -> bytes:
+    return (FIXTURE_DIR / name).read_bytes()
+
+
+def _getProfile(name: str | None) -> ParseProfile | None:
+    if name is None:
+        return None
+    return ParseProfile(name=name, rules=LMS_PARSE_PROFILES[name])
+
+
+def _normalize(value: Any) -> Any:
+    """
+    스키마 추출 결과의 요소를 백엔드와 무관한 값으로 변환합니다.
+    """
+    if isinstance(value, Node):
+        return {
+            "name": value.name,
+            "classes": value.classes,
+            "text": value.getText(separator=" ", strip=True, lineBreak="\n"),
+        }
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def _extract(content: Node, schemas: tuple) -> list:
+    return [_normalize(schema.extract(content)) for schema in schemas]
+
+
+class ParserParityTest(SimpleTestCase):
+    """
+    lxml 파싱 백엔드와 BeautifulSoup 파싱 백엔드의 추출 결과가 같은지 검증합니다.
+    """
+
+    def testSchemaParity(self):
+        for name, encoding, profileName, schemas in SCHEMA_CASES:
+            data = _loadFixture(name)
+            profile = _getProfile(profileName)
+
+            with self.subTest(fixture=name):
+                expected = _extract(parseSoup(data, encoding), schemas)
+                self.assertEqual(_extract(parseLxml(data, encoding), schemas), expected)
+
+                # 부분 파싱은 스키마가 사용하는 요소를 유지
+                if profile is not None:
+                    self.assertEqual(
+                        _extract(parseSoup(data, encoding, profile), schemas), expected
+                    )
+                    self.assertEqual(
+                        _extract(parseLxml(data, encoding, profile), schemas), expected
+                    )
+
+    def testStreamParity(self):
+        for name, encoding, profileName, schemas in SCHEMA_CASES:
+            if profileName is None:
+                continue
+            data = _loadFixture(name)
+
+            with self.subTest(fixture=name):
+                stream = LxmlDocumentStream(encoding, _getProfile(profileName))
+                for offset in range(0, len(data), 256):
+                    stream.feed(data[offset : offset + 256])
+
+                self.assertTrue(stream.done)
+                self.assertEqual(
+                    _extract(stream.close(), schemas),
+                    _extract(parseLxml(data, encoding), schemas),
+                )
+
+    def testWeekActivityParity(self):
+        data = _loadFixture("lms_course.html")
+        profile = _getProfile("course")
+
+        results = []
+        for parse in (parseLxml, parseSoup):
+            sections = CoursePageSchema.extract(parse(data, None, profile))
+            results.append(
+                [
+                    _normalize(WeekSchema.extract(section))
+                    for section in sections["sectionList"]["sections"]
+                ]
+            )
+
+        self.assertEqual(len(results[0]), 3)
+        self.assertEqual(results[0], results[1])
+
+    def testNodeParity(self):
+        for name, encoding, _, _ in SCHEMA_CASES:
+            data = _loadFixture(name)
+            lxmlContent = parseLxml(data, encoding)
+            soupContent = parseSoup(data, encoding)
+
+            for args, kwargs in FIND_CASES:
+                with self.subTest(fixture=name, find=(args, kwargs)):
+                    lxmlNodes = lxmlContent.findAll(*args, **kwargs)
+                    soupNodes = soupContent.findAll(*args, **kwargs)
+                    self.assertEqual(
+                        [node.name for node in lxmlNodes],
+                        [node.name for node in soupNodes],
+                    )
+
+                    for lxmlNode, soupNode in zip(lxmlNodes, soupNodes):
+                        self.assertEqual(lxmlNode.classes, soupNode.classes)
+                        self.assertEqual(lxmlNode.get("id"), soupNode.get("id"))
+                        self.assertEqual(lxmlNode.get("href"), soupNode.get("href"))
+                        for options in TEXT_OPTIONS:
+                            self.assertEqual(
+                                lxmlNode.getText(**options),
+                                soupNode.getText(**options),
+                            )
+
+    def testExtractContentParity(self):
+        data = _loadFixture("lms_notice.html")
+
+        bodies = [
+            parse(data).find("div", class_="text_to_html")
+            for parse in (parseLxml, parseSoup)
+        ]
+        contents = [Utils.extractContent(body) for body in bodies]
+
+        self.assertIn("중간고사 일정을 안내드립니다.", contents[0])
+        self.assertEqual(contents[0], contents[1])
+
+    def testRemoveParity(self):
+        data = _loadFixture("lms_course.html")
+
+        titles = []
+        for parse in (parseLxml, parseSoup):
+            title = parse(data).find("span", class_="instancename")
+            title.find("span", class_="accesshide").remove()
+            titles.append(title.text)
+
+        self.assertEqual(titles, ["공지사항", "공지사항"])
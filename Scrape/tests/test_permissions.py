@@ -0,0 +1,42 @@
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+
+
+@override_settings(
+    EXTRACTOR_INTERNAL_ALLOWED_IPS=["127.0.0.1", "10.0.0.0/8"],
+    EXTRACTOR_INTERNAL_TOKEN="token",
+)
+class InternalAccessPermissionTest(SimpleTestCase):
+    """
+    지표 조회 API의 내부 접근 제한을 검증합니다.
+    """
+
+    def get(self, **extra):
+        return self.client.get(reverse("Scrape:metrics"), **extra)
+
+    def testAllowedAddress(self):
+        self.assertEqual(self.get(REMOTE_ADDR="127.0.0.1").status_code, 200)
+        self.assertEqual(self.get(REMOTE_ADDR="10.1.2.3").status_code, 200)
+
+    def testExternalAddressRejected(self):
+        self.assertEqual(self.get(REMOTE_ADDR="203.0.113.1").status_code, 403)
+
+    def testForwardedHeaderIgnored(self):
+        response = self.get(REMOTE_ADDR="203.0.113.1", HTTP_X_FORWARDED_FOR="127.0.0.1")
+        self.assertEqual(response.status_code, 403)
+
+    def testToken(self):
+        response = self.get(
+            REMOTE_ADDR="203.0.113.1", HTTP_AUTHORIZATION="Bearer token"
+        )
+        self.assertEqual(response.status_code, 200)
+
+        response = self.get(
+            REMOTE_ADDR="203.0.113.1", HTTP_AUTHORIZATION="Bearer wrong"
+        )
+        self.assertEqual(response.status_code, 403)
+
+    @override_settings(EXTRACTOR_INTERNAL_TOKEN="")
+    def testEmptyTokenDisabled(self):
+        response = self.get(REMOTE_ADDR="203.0.113.1", HTTP_AUTHORIZATION="Bearer ")
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,140 @@
+import asyncio
+
+from django.test import SimpleTestCase
+
+from Scrape.extractor.cache.result import ResultCache
+from Scrape.extractor.exception import ErrorType, ExtractorException
+
+CREDENTIAL_KEY = ("201912345", "credential")
+
+
+class Loader:
+    """
+    호출 횟수를 기록하고, 지정된 값 또는 예외를 반환하는 추출 함수입니다.
+    """
+
+    def __init__(self, value="first", delay: float = 0):
+        self.value = value
+        self.delay: float = delay
+        self.calls: int = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if isinstance(self.value, Exception):
+            raise self.value
+        return self.value
+
+
+class ResultCacheTest(SimpleTestCase):
+    """
+    사용자별 추출 결과 캐시의 유효 시간, 병합, 무효화 동작을 검증합니다.
+    """
+
+    def setUp(self):
+        self.cache = ResultCache(maxSize=16)
+
+    async def get(self, load, ttl=60, grace=0, endpoint="timetable", params=None):
+        return await self.cache.get(
+            endpoint=endpoint,
+            credentialKey=CREDENTIAL_KEY,
+            params=params or {},
+            load=load,
+            ttl=ttl,
+            grace=grace,
+        )
+
+    async def testFreshHit(self):
+        load = Loader()
+        self.assertEqual(await self.get(load), "first")
+        self.assertEqual(await self.get(load), "first")
+        self.assertEqual(load.calls, 1)
+
+    async def testParamsSeparateEntries(self):
+        load = Loader()
+        await self.get(load, params={"year": 2024})
+        await self.get(load, params={"year": 2023})
+        self.assertEqual(load.calls, 2)
+
+    async def testStaleWhileRevalidate(self):
+        load = Loader()
+        await self.get(load, ttl=0.05, grace=60)
+        await asyncio.sleep(0.1)
+
+        # 유효 시간이 지난 결과를 즉시 반환하고 백그라운드에서 갱신
+        load.value = "second"
+        self.assertEqual(await self.get(load, ttl=0.05, grace=60), "first")
+        await asyncio.sleep(0.05)
+        self.assertEqual(load.calls, 2)
+        self.assertEqual(await self.get(load, ttl=60), "second")
+
+    async def testExpiredAfterGrace(self):
+        load = Loader()
+        await self.get(load, ttl=0.02, grace=0.02)
+        await asyncio.sleep(0.1)
+
+        load.value = "second"
+        self.assertEqual(await self.get(load, ttl=0.02, grace=0.02), "second")
+        self.assertEqual(load.calls, 2)
+
+    async def testCoalescing(self):
+        load = Loader(delay=0.05)
+        results = await asyncio.gather(*(self.get(load) for _ in range(5)))
+        self.assertEqual(results, ["first"] * 5)
+        self.assertEqual(load.calls, 1)
+
+    async def testCoalescedFailureNotCached(self):
+        load = Loader(ExtractorException(errorType=ErrorType.LMS_ERROR), delay=0.05)
+        results = await asyncio.gather(
+            *(self.get(load) for _ in range(3)), return_exceptions=True
+        )
+        self.assertTrue(all(isinstance(r, ExtractorException) for r in results))
+        self.assertEqual(load.calls, 1)
+
+        load.value = "recovered"
+        self.assertEqual(await self.get(load), "recovered")
+
+    async def testCancelledWaiterKeepsFlight(self):
+        load = Loader(delay=0.05)
+        first = asyncio.ensure_future(self.get(load))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        # 먼저 요청한 클라이언트가 끊겨도 진행 중인 추출 결과를 공유
+        self.assertEqual(await self.get(load), "first")
+        self.assertEqual(load.calls, 1)
+
+    async def testInvalidateOnCredentialErrors(self):
+        for errorType in (
+            ErrorType.AUTHENTICATION_FAIL,
+            ErrorType.KUTIS_PASSWORD_ERROR,
+        ):
+            with self.subTest(errorType=errorType):
+                self.cache = ResultCache(maxSize=16)
+                await self.get(Loader("courses"), endpoint="course", ttl=60)
+                await self.get(Loader("old"), ttl=0.02, grace=60)
+                await asyncio.sleep(0.05)
+
+                # 백그라운드 갱신 중 인증 정보가 거부되면 같은 인증 정보의 모든 결과 제거
+                rejected = Loader(ExtractorException(errorType=errorType))
+                self.assertEqual(await self.get(rejected, ttl=0.02, grace=60), "old")
+                await asyncio.sleep(0.05)
+                self.assertEqual(self.cache.stats()["size"], 0)
+
+                with self.assertRaises(ExtractorException):
+                    await self.get(rejected)
+
+    async def testKeepOnOtherErrors(self):
+        await self.get(Loader("old"), ttl=0.02, grace=60)
+        await asyncio.sleep(0.05)
+
+        failing = Loader(ExtractorException(errorType=ErrorType.TIMETABLE_NOT_EXIST))
+        self.assertEqual(await self.get(failing, ttl=0.02, grace=60), "old")
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.cache.stats()["size"], 1)
+
+    async def testInvalidate(self):
+        await self.get(Loader(), endpoint="course")
+        await self.get(Loader(), endpoint="timetable")
+        self.cache.invalidate(CREDENTIAL_KEY)
+        self.assertEqual(self.cache.stats()["size"], 0)
@@ -0,0 +1,142 @@
+import asyncio
+
+import aiohttp
+from django.test import SimpleTestCase
+
+from Scrape.extractor.session import SessionPool
+
+
+class Login:
+    """
+    호출 횟수를 기록하고, 새 인증 세션 또는 지정된 예외를 반환하는 로그인 함수입니다.
+    """
+
+    def __init__(self, delay: float = 0, error: Exception | None = None):
+        self.delay: float = delay
+        self.error: Exception | None = error
+        self.calls: int = 0
+        self.sessions: list[aiohttp.ClientSession] = []
+
+    async def __call__(self) -> aiohttp.ClientSession:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+
+        session = aiohttp.ClientSession()
+        self.sessions.append(session)
+        return session
+
+
+class SessionPoolTest(SimpleTestCase):
+    """
+    인증 세션 풀의 재사용, 로그인 병합, LRU/TTL 제거 동작을 검증합니다.
+    """
+
+    async def closeAll(self, login: Login):
+        # 종료 작업 실행 후 남은 세션 정리
+        await asyncio.sleep(0)
+        for session in login.sessions:
+            await session.close()
+
+    async def testReuseAfterRelease(self):
+        pool = SessionPool(maxSize=4, ttl=60)
+        login = Login()
+
+        session = await pool.acquire("a", login)
+        await pool.release(session)
+        self.assertIs(await pool.acquire("a", login), session)
+        self.assertEqual(login.calls, 1)
+        self.assertFalse(session.closed)
+        await self.closeAll(login)
+
+    async def testLoginSingleFlight(self):
+        pool = SessionPool(maxSize=4, ttl=60)
+        login = Login(delay=0.01)
+
+        sessions = await asyncio.gather(*(pool.acquire("a", login) for _ in range(5)))
+        self.assertEqual(login.calls, 1)
+        self.assertTrue(all(session is sessions[0] for session in sessions))
+
+        # 다른 인증 정보는 병합하지 않음
+        other = await pool.acquire("b", login)
+        self.assertIsNot(other, sessions[0])
+        self.assertEqual(login.calls, 2)
+        await self.closeAll(login)
+
+    async def testFailedLoginNotCached(self):
+        pool = SessionPool(maxSize=4, ttl=60)
+        failure = Login(delay=0.01, error=RuntimeError("login"))
+
+        results = await asyncio.gather(
+            pool.acquire("a", failure),
+            pool.acquire("a", failure),
+            return_exceptions=True,
+        )
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+        self.assertEqual(failure.calls, 1)
+
+        login = Login()
+        await pool.acquire("a", login)
+        self.assertEqual(login.calls, 1)
+        await self.closeAll(login)
+
+    async def testLeastRecentlyUsedClosedAfterRelease(self):
+        pool = SessionPool(maxSize=1, ttl=60)
+        login = Login()
+
+        first = await pool.acquire("a", login)
+        second = await pool.acquire("b", login)
+
+        # 사용 중인 세션은 반환될 때까지 종료하지 않음
+        await asyncio.sleep(0)
+        self.assertFalse(first.closed)
+        await pool.release(first)
+        self.assertTrue(first.closed)
+
+        await pool.release(second)
+        self.assertFalse(second.closed)
+        await self.closeAll(login)
+
+    async def testEvictedIdleSessionClosed(self):
+        pool = SessionPool(maxSize=1, ttl=60)
+        login = Login()
+
+        first = await pool.acquire("a", login)
+        await pool.release(first)
+        await pool.acquire("b", login)
+
+        await asyncio.sleep(0)
+        self.assertTrue(first.closed)
+        await self.closeAll(login)
+
+    async def testExpiredSessionRenewed(self):
+        pool = SessionPool(maxSize=4, ttl=0.05)
+        login = Login()
+
+        first = await pool.acquire("a", login)
+        await asyncio.sleep(0.06)
+        second = await pool.acquire("a", login)
+        self.assertIsNot(first, second)
+        self.assertEqual(login.calls, 2)
+
+        await asyncio.sleep(0)
+        self.assertFalse(first.closed)
+        await pool.release(first)
+        self.assertTrue(first.closed)
+        await self.closeAll(login)
+
+    async def testInvalidateOnlyMatchingSession(self):
+        pool = SessionPool(maxSize=4, ttl=60)
+        login = Login()
+
+        session = await pool.acquire("a", login)
+        other = aiohttp.ClientSession()
+        pool.invalidate("a", session=other)
+        await pool.release(session)
+        self.assertIs(await pool.acquire("a", login), session)
+
+        pool.invalidate("a", session=session)
+        self.assertIsNot(await pool.acquire("a", login), session)
+        await other.close()
+        await self.closeAll(login)
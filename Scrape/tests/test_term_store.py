@@ -0,0 +1,66 @@
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+from Scrape.extractor.store import TermStore
+
+
+class TermStoreTest(SimpleTestCase):
+    """
+    종료된 학기 데이터 저장소의 인증 정보 구분과 보관 기간을 검증합니다.
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.store = TermStore(
+            path=Path(directory.name) / "term_store.sqlite3",
+            secret="secret",
+            retention=60,
+        )
+
+    async def get(self, password="password"):
+        return await self.store.get(
+            kind="courses",
+            studentId="201912345",
+            password=password,
+            year=2023,
+            semester=1,
+        )
+
+    async def set(self, value, password="password"):
+        await self.store.set(
+            kind="courses",
+            studentId="201912345",
+            password=password,
+            year=2023,
+            semester=1,
+            value=value,
+        )
+
+    async def count(self) -> int:
+        row = await asyncio.to_thread(
+            self.store._execute, "SELECT COUNT(*) FROM term_data", ()
+        )
+        return row[0]
+
+    async def testCredentialScoped(self):
+        await self.set(["course"])
+        self.assertEqual(await self.get(), ["course"])
+        self.assertIsNone(await self.get(password="other"))
+
+    async def testRetention(self):
+        await self.set(["course"])
+        await asyncio.to_thread(
+            self.store._execute,
+            "UPDATE term_data SET createdAt = ?",
+            (time.time() - 120,),
+        )
+        self.assertIsNone(await self.get())
+
+        # 저장 시 보관 기간이 지난 데이터 제거
+        await self.set(["other"], password="other")
+        self.assertEqual(await self.count(), 1)
@@ -0,0 +1,93 @@
+import random
+
+from django.test import SimpleTestCase
+
+from Scrape.extractor.parser.lxml_backend import parseLxml
+from Scrape.extractor.parser.soup_backend import parseSoup
+from Scrape.extractor.parts.utils import Utils
+from Scrape.tests.reference import extractContentReference, parseReference
+
+# 임의 본문 생성에 사용하는 요소와 텍스트
+BODY_TAGS = (
+    "div",
+    "p",
+    "li",
+    "ul",
+    "span",
+    "b",
+    "h2",
+    "br",
+    "script",
+    "a",
+    "table",
+    "tr",
+    "td",
+    "i",
+)
+BODY_TEXTS = ("  hello ", "wor ld", "\n", " ", "&amp; x", "한글 ", "&nbsp;", "")
+
+
+def generateBody(rand: random.Random, depth: int = 0, maxDepth: int = 6) -> str:
+    """
+    주석, 스크립트, 줄바꿈, 중첩 요소가 섞인 임의의 공지사항 본문을 생성합니다.
+    """
+    parts = []
+    for _ in range(rand.randint(0, 4)):
+        choice = rand.random()
+        if choice < 0.3:
+            parts.append(rand.choice(BODY_TEXTS))
+        elif choice < 0.35:
+            parts.append("<!-- comment -->")
+        elif depth < maxDepth:
+            tag = rand.choice(BODY_TAGS)
+            if tag == "br":
+                parts.append("<br>")
+            elif tag == "script":
+                parts.append("<script>var s = '<p>';</script>")
+            else:
+                parts.append(
+                    f"<{tag}>{generateBody(rand, depth + 1, maxDepth)}</{tag}>"
+                )
+    return "".join(parts)
+
+
+def wrapBody(body: str) -> str:
+    return f"<html><body><div class='text_to_html'>{body}</div></body></html>"
+
+
+class ExtractContentTest(SimpleTestCase):
+    """
+    Utils.extractContent가 이전 구현과 같은 텍스트를 추출하는지 검증합니다.
+    """
+
+    def testReferenceParity(self):
+        rand = random.Random(13)
+        for index in range(3000):
+            document = wrapBody(generateBody(rand))
+            expected = extractContentReference(
+                parseReference(document).find("div", class_="text_to_html")
+            )
+
+            for parse in (parseLxml, parseSoup):
+                container = parse(document.encode(), "utf-8").find(
+                    "div", class_="text_to_html"
+                )
+                with self.subTest(case=index, backend=parse.__name__):
+                    self.assertEqual(Utils.extractContent(container), expected)
+
+    def testDocumentUnchanged(self):
+        document = wrapBody("<p>첫 줄<br>둘째 줄</p><ul><li>항목<br>하나</li></ul>")
+
+        for parse in (parseLxml, parseSoup):
+            container = parse(document.encode(), "utf-8").find(
+                "div", class_="text_to_html"
+            )
+            with self.subTest(backend=parse.__name__):
+                self.assertEqual(
+                    Utils.extractContent(container), "첫 줄둘째 줄\n항목  하나"
+                )
+                # 반복 추출 시에도 같은 결과 (문서 미변경)
+                self.assertEqual(
+                    Utils.extractContent(container), "첫 줄둘째 줄\n항목  하나"
+                )
+                self.assertEqual(len(container.findAll("br")), 2)
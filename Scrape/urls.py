@@ -7,7 +7,10 @@ from Scrape.views import (
     AttendanceView,
     AuthenticationView,
     CourseDetailView,
+    CourseJobDetailView,
+    CourseJobView,
     CourseView,
+    MetricsView,
     NoticeView,
     TimetableView,
 )
@@ -16,6 +19,7 @@ app_name = "Scrape"
 
 urlpatterns = [
     path("", lambda request: HttpResponse(status=200), name="check"),
+    path("metrics/", MetricsView.as_view(), name="metrics"),
     path(
         "v1/",
         include(
@@ -23,6 +27,12 @@ urlpatterns = [
                 path("auth/", AuthenticationView.as_view(), name="auth"),
                 path("timetable/", TimetableView.as_view(), name="timetable"),
                 path("course/", CourseView.as_view(), name="course"),
+                path("course/job/", CourseJobView.as_view(), name="course_job"),
+                path(
+                    "course/job/<str:jobId>/",
+                    CourseJobDetailView.as_view(),
+                    name="course_job_detail",
+                ),
                 path(
                     "course/<str:courseCode>/",
                     CourseDetailView.as_view(),
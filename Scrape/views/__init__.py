@@ -3,5 +3,7 @@ from .assignment import *
 from .attendance import *
 from .auth import *
 from .course import *
+from .job import *
+from .metrics import *
 from .notice import *
 from .timetable import *
@@ -1,21 +1,21 @@
-import asyncio
-
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
-from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
 
 from Scrape.extractor import Extractor
 from Scrape.extractor.exception import ErrorType, ExtractorException
 from Scrape.serializer import AssignmentResponseSerializer, AuthSerializer
+from Scrape.views.base import AsyncGenericAPIView
 
 
-class AssignmentView(GenericAPIView):
+class AssignmentView(AsyncGenericAPIView):
     """
     해당 과제의 정보를 추출하는 View입니다.
     """
 
     serializer_class = AuthSerializer
+    resultCacheTtl = 30
+    resultCacheGrace = 60 * 2
 
     @extend_schema(
         tags=["강좌 API"],
@@ -24,7 +24,7 @@ class AssignmentView(GenericAPIView):
         request=AuthSerializer,
         responses={status.HTTP_200_OK: AssignmentResponseSerializer},
     )
-    def post(self, request, *args, **kwargs):
+    async def post(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
 
         if serializer.is_valid():
@@ -33,20 +33,24 @@ class AssignmentView(GenericAPIView):
             assignmentCode = self.kwargs.get("assignmentCode")
 
             try:
-                extractor = Extractor(studentId=studentId, password=password)
-                assignment = asyncio.run(
-                    extractor.getAssignment(assignmentCode=assignmentCode)
+                assignment = await self.getCachedResult(
+                    studentId=studentId,
+                    password=password,
+                    params={"assignmentCode": assignmentCode},
+                    load=lambda: Extractor(
+                        studentId=studentId, password=password
+                    ).getAssignment(assignmentCode=assignmentCode),
                 )
 
                 return Response({"data": assignment}, status=status.HTTP_200_OK)
 
             except ExtractorException as e:
-                e.logError()
+                await self.logException(e)
                 return Response({"message": e.message}, status=e.type.httpStatus)
             except Exception as e:
-                ExtractorException(
-                    errorType=ErrorType.SYSTEM_ERROR, message=str(e)
-                ).logError()
+                await self.logException(
+                    ExtractorException(errorType=ErrorType.SYSTEM_ERROR, message=str(e))
+                )
                 return Response(
                     {"message": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
                 )
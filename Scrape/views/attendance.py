@@ -1,21 +1,21 @@
-import asyncio
-
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
-from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
 
 from Scrape.extractor import Extractor
 from Scrape.extractor.exception import ErrorType, ExtractorException
 from Scrape.serializer import AttendancesResponseSerializer, AuthSerializer
+from Scrape.views.base import AsyncGenericAPIView
 
 
-class AttendanceView(GenericAPIView):
+class AttendanceView(AsyncGenericAPIView):
     """
     강좌의 강의 출석 정보를 추출하는 View입니다.
     """
 
     serializer_class = AuthSerializer
+    resultCacheTtl = 60
+    resultCacheGrace = 60 * 5
 
     @extend_schema(
         tags=["강좌 API"],
@@ -24,7 +24,7 @@ class AttendanceView(GenericAPIView):
         request=AuthSerializer,
         responses={status.HTTP_200_OK: AttendancesResponseSerializer},
     )
-    def post(self, request, *args, **kwargs):
+    async def post(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
 
         if serializer.is_valid():
@@ -33,20 +33,24 @@ class AttendanceView(GenericAPIView):
             courseCode = self.kwargs.get("courseCode")
 
             try:
-                extractor = Extractor(studentId=studentId, password=password)
-                attendances = asyncio.run(
-                    extractor.getLectureAttendance(courseCode=courseCode)
+                attendances = await self.getCachedResult(
+                    studentId=studentId,
+                    password=password,
+                    params={"courseCode": courseCode},
+                    load=lambda: Extractor(
+                        studentId=studentId, password=password
+                    ).getLectureAttendance(courseCode=courseCode),
                 )
 
                 return Response({"data": attendances}, status=status.HTTP_200_OK)
 
             except ExtractorException as e:
-                e.logError()
+                await self.logException(e)
                 return Response({"message": e.message}, status=e.type.httpStatus)
             except Exception as e:
-                ExtractorException(
-                    errorType=ErrorType.SYSTEM_ERROR, message=str(e)
-                ).logError()
+                await self.logException(
+                    ExtractorException(errorType=ErrorType.SYSTEM_ERROR, message=str(e))
+                )
                 return Response(
                     {"message": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
                 )
@@ -1,16 +1,15 @@
-import asyncio
-
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
-from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
 
 from Scrape.extractor import Extractor
+from Scrape.extractor.admission import AdmissionRejected
 from Scrape.extractor.exception import ErrorType, ExtractorException
 from Scrape.serializer import AuthResponseSerializer, AuthUserSerializer
+from Scrape.views.base import AsyncGenericAPIView
 
 
-class AuthenticationView(GenericAPIView):
+class AuthenticationView(AsyncGenericAPIView):
     """
     학생 정보를 추출하는 View입니다.
     """
@@ -24,7 +23,7 @@ class AuthenticationView(GenericAPIView):
         request=AuthUserSerializer,
         responses={status.HTTP_200_OK: AuthResponseSerializer},
     )
-    def post(self, request, *args, **kwargs):
+    async def post(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
 
         if serializer.is_valid():
@@ -33,9 +32,13 @@ class AuthenticationView(GenericAPIView):
             getUser = serializer.validated_data.get("extract")
 
             try:
-                extractor = Extractor(studentId=studentId, password=password)
-                verification, userData, message = asyncio.run(
-                    extractor.verifyAuthentication(getUser=getUser)
+                verification, userData, message = await self.getCachedResult(
+                    studentId=studentId,
+                    password=password,
+                    params={"extract": getUser},
+                    load=lambda: Extractor(
+                        studentId=studentId, password=password
+                    ).verifyAuthentication(getUser=getUser),
                 )
 
                 return Response(
@@ -47,17 +50,21 @@ class AuthenticationView(GenericAPIView):
                     status=status.HTTP_200_OK,
                 )
 
+            except AdmissionRejected as e:
+                # 과부하 거절은 인증 실패와 구분하여 응답 (Retry-After 헤더 포함)
+                return Response({"message": e.message}, status=e.type.httpStatus)
+
             except ExtractorException as e:
-                e.logError()
+                await self.logException(e)
                 return Response(
                     {"verification": False, "userData": None, "message": e.message},
                     status=status.HTTP_200_OK,
                 )
 
             except Exception as e:
-                ExtractorException(
-                    errorType=ErrorType.SYSTEM_ERROR, message=str(e)
-                ).logError()
+                await self.logException(
+                    ExtractorException(errorType=ErrorType.SYSTEM_ERROR, message=str(e))
+                )
                 return Response(
                     {"message": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
                 )
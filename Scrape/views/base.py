@@ -0,0 +1,135 @@
+import asyncio
+import sys
+from typing import Any, Awaitable, Callable
+
+from rest_framework.generics import GenericAPIView
+
+from Scrape.extractor.admission import AdmissionRejected, admission
+from Scrape.extractor.cache import resultCache
+from Scrape.extractor.exception import ExtractorException
+from Scrape.extractor.parts import Utils
+
+
+class AsyncGenericAPIView(GenericAPIView):
+    """
+    비동기 핸들러를 지원하는 GenericAPIView입니다.
+
+    ASGI 서버에서는 요청을 받은 이벤트 루프에서 핸들러를 직접 실행하므로,
+    스크래핑 대기 중에도 워커가 다른 요청을 처리할 수 있습니다.
+    """
+
+    # 요청 본문의 학번, 비밀번호로 인증하므로 세션 인증을 사용하지 않습니다.
+    authentication_classes = ()
+
+    # 사용자별 결과 캐시 유효 시간(초), 미지정 시 캐시하지 않음
+    resultCacheTtl: float | None = None
+    # 유효 시간이 지난 결과를 즉시 반환하고 백그라운드에서 다시 추출하는 유예 시간(초)
+    resultCacheGrace: float = 0
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            self.initial(request, *args, **kwargs)
+
+            # 요청 메서드 핸들러 선택
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if asyncio.iscoroutine(response):
+                response = await response
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def logException(self, exception: ExtractorException):
+        """
+        예외 로그를 이벤트 루프 밖에서 기록합니다.
+
+        로그 핸들러의 Webhook 전송이 이벤트 루프를 막지 않도록 별도 스레드에서 실행합니다.
+
+        Parameters:
+            exception: 기록할 예외
+        """
+        await asyncio.to_thread(exception.logError, excInfo=sys.exc_info())
+
+    async def getCachedResult(
+        self,
+        studentId: str,
+        password: str,
+        params: dict,
+        load: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        사용자별 결과 캐시에서 추출 결과를 반환하고, 없다면 추출합니다.
+
+        결과는 View, 인증 정보, 요청 인자 단위로 저장되며 resultCacheTtl이 없다면 항상 추출합니다.
+        같은 View, 인증 정보, 요청 인자로 진행 중인 추출이 있다면 그 결과를 함께 기다립니다.
+        추출은 인증 정보 단위로 승인 제어기의 실행 슬롯 안에서 실행되며, 거절된 경우 Retry-After 헤더를 설정합니다.
+
+        Parameters:
+            studentId: 학번
+            password: 비밀번호
+            params: 결과에 영향을 주는 요청 인자
+            load: 결과를 추출하는 코루틴 함수
+
+        Returns:
+            value: 추출 결과
+        """
+
+        credentialKey = Utils.getCredentialKey(studentId=studentId, password=password)
+
+        async def admitted() -> Any:
+            async with admission.slot(credentialKey):
+                return await load()
+
+        try:
+            if self.resultCacheTtl is None:
+                return await admitted()
+
+            return await resultCache.get(
+                endpoint=type(self).__name__,
+                credentialKey=credentialKey,
+                params=params,
+                load=admitted,
+                ttl=self.resultCacheTtl,
+                grace=self.resultCacheGrace,
+            )
+
+        except AdmissionRejected as e:
+            self.headers["Retry-After"] = str(e.retryAfter)
+            raise
+
+    async def admit(self, studentId: str, password: str) -> tuple[str, str]:
+        """
+        승인 제어기에서 인증 정보 단위로 실행 슬롯을 할당받습니다.
+
+        거절된 경우 Retry-After 헤더를 설정하며, 할당받은 슬롯은 반환된 인증 정보 키로
+        admission.release를 호출하여 반환해야 합니다.
+
+        Parameters:
+            studentId: 학번
+            password: 비밀번호
+
+        Returns:
+            credentialKey: 인증 정보 키
+        """
+        credentialKey = Utils.getCredentialKey(studentId=studentId, password=password)
+        try:
+            await admission.acquire(credentialKey)
+            return credentialKey
+        except AdmissionRejected as e:
+            self.headers["Retry-After"] = str(e.retryAfter)
+            raise
@@ -1,38 +1,48 @@
 import asyncio
+import time
+from typing import AsyncGenerator
 
+from django.http import StreamingHttpResponse
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
-from rest_framework.generics import GenericAPIView
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 
 from Scrape.extractor import Extractor
+from Scrape.extractor.admission import admission
 from Scrape.extractor.exception import ErrorType, ExtractorException
 from Scrape.serializer import (
-    AuthSerializer,
+    CourseDetailSerializer,
     CourseNotExistResponse,
     CourseResponseSerializer,
     CourseSerializer,
 )
+from Scrape.views.base import AsyncGenericAPIView
 
 
-class CourseView(GenericAPIView):
+class CourseView(AsyncGenericAPIView):
     """
     해당 학기의 모든 강좌의 정보를 추출하는 View입니다.
+
+    stream 옵션을 사용하면 강좌별 추출이 완료되는 즉시 NDJSON 한 줄({"data": 강좌})로 응답합니다.
+    스트리밍 중 발생한 예외는 마지막 줄({"message": 메세지})로 전달됩니다.
     """
 
     serializer_class = CourseSerializer
+    resultCacheTtl = 60
+    resultCacheGrace = 60 * 5
 
     @extend_schema(
         tags=["강좌 API"],
         summary="강좌 추출",
-        description="모든 강좌의 정보를 추출합니다.",
+        description="모든 강좌의 정보를 추출합니다. stream 옵션 사용 시 강좌별로 추출이 완료되는 즉시 NDJSON(application/x-ndjson)으로 응답합니다.",
         request=CourseSerializer,
         responses={
             status.HTTP_200_OK: CourseResponseSerializer,
             status.HTTP_404_NOT_FOUND: CourseNotExistResponse,
         },
     )
-    def post(self, request, *args, **kwargs):
+    async def post(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
 
         if serializer.is_valid():
@@ -41,59 +51,234 @@ class CourseView(GenericAPIView):
             year = serializer.validated_data.get("year")
             semester = serializer.validated_data.get("semester")
             extract = serializer.validated_data.get("extract")
+            stream = serializer.validated_data.get("stream")
+            include = serializer.validated_data.get("include")
+            assignmentDetail = serializer.validated_data.get("assignmentDetail")
+            knownNotices = set(serializer.validated_data.get("knownNotices", ()))
 
             try:
-                extractor = Extractor(studentId=studentId, password=password)
-                courses = asyncio.run(
-                    extractor.getCourses(year=year, semester=semester, extract=extract)
+                if stream:
+                    extractor = Extractor(studentId=studentId, password=password)
+                    return await self.streamCourses(
+                        studentId,
+                        password,
+                        extractor.iterCourses(
+                            year=year,
+                            semester=semester,
+                            extract=extract,
+                            include=include,
+                            assignmentDetail=assignmentDetail,
+                            knownNotices=knownNotices,
+                        ),
+                    )
+
+                courses = await self.getCachedResult(
+                    studentId=studentId,
+                    password=password,
+                    params={
+                        "year": year,
+                        "semester": semester,
+                        "extract": extract,
+                        "include": include,
+                        "assignmentDetail": assignmentDetail,
+                        "knownNotices": knownNotices,
+                    },
+                    load=lambda: Extractor(
+                        studentId=studentId, password=password
+                    ).getCourses(
+                        year=year,
+                        semester=semester,
+                        extract=extract,
+                        include=include,
+                        assignmentDetail=assignmentDetail,
+                        knownNotices=knownNotices,
+                    ),
                 )
 
                 return Response({"data": courses}, status=status.HTTP_200_OK)
 
             except ExtractorException as e:
-                e.logError()
+                await self.logException(e)
                 return Response({"message": e.message}, status=e.type.httpStatus)
             except Exception as e:
-                ExtractorException(
-                    errorType=ErrorType.SYSTEM_ERROR, message=str(e)
-                ).logError()
+                await self.logException(
+                    ExtractorException(errorType=ErrorType.SYSTEM_ERROR, message=str(e))
+                )
                 return Response(
                     {"message": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
                 )
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    async def streamCourses(
+        self, studentId: str, password: str, courses: AsyncGenerator[dict, None]
+    ) -> StreamingHttpResponse:
+        """
+        강좌 데이터를 추출이 완료되는 순서대로 NDJSON으로 응답합니다.
+
+        첫 번째 강좌가 완료될 때까지 기다린 뒤 응답을 시작하므로,
+        인증 실패, 강좌 없음 등 강좌 목록 단계의 예외는 일반 오류 응답으로 처리됩니다.
+
+        Parameters:
+            studentId: 학번
+            password: 비밀번호
+            courses: 강좌 데이터 비동기 제너레이터
+
+        Returns:
+            response: 스트리밍 응답
+        """
+        stream = CourseStream(view=self, courses=courses)
+        await stream.start(studentId=studentId, password=password)
+
+        response = StreamingHttpResponse(
+            stream, content_type="application/x-ndjson", status=status.HTTP_200_OK
+        )
+        # 프록시 버퍼링 없이 강좌별로 전달
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+
+class CourseStream:
+    """
+    강좌 데이터 제너레이터를 NDJSON 줄 단위로 반환하는 스트림입니다.
+
+    승인 제어기의 실행 슬롯은 강좌 추출을 시작하는 start 시점에 할당받고,
+    모든 줄을 반환했거나 응답이 닫힌 시점(클라이언트 연결 종료 포함)에 진행 중인 스크래핑을 취소하고 반환합니다.
+    """
+
+    def __init__(self, view: AsyncGenericAPIView, courses: AsyncGenerator[dict, None]):
+        self.view: AsyncGenericAPIView = view
+        self.courses: AsyncGenerator[dict, None] = courses
+
+        self._renderer = JSONRenderer()
+        self._loop = asyncio.get_running_loop()
+        self._first: dict | None = None
+        self._credentialKey: tuple[str, str] | None = None
+        self._startTime: float = 0
+        self._closed: bool = False
+        self._closing: asyncio.Future | None = None
 
-class CourseDetailView(GenericAPIView):
+    async def start(self, studentId: str, password: str):
+        """
+        실행 슬롯을 할당받고, 첫 번째 강좌가 완료될 때까지 기다립니다.
+
+        할당 거절, 강좌 목록 단계의 예외는 슬롯을 반환한 뒤 그대로 전달됩니다.
+
+        Parameters:
+            studentId: 학번
+            password: 비밀번호
+        """
+        try:
+            self._credentialKey = await self.view.admit(studentId, password)
+            self._startTime = time.monotonic()
+            self._first = await anext(self.courses, None)
+        except BaseException:
+            await self.aclose()
+            raise
+
+    async def __aiter__(self) -> AsyncGenerator[bytes, None]:
+        try:
+            if self._first is not None:
+                yield self._render({"data": self._first})
+            async for course in self.courses:
+                yield self._render({"data": course})
+
+        except ExtractorException as e:
+            await self.view.logException(e)
+            yield self._render({"message": e.message})
+        except Exception as e:
+            await self.view.logException(
+                ExtractorException(errorType=ErrorType.SYSTEM_ERROR, message=str(e))
+            )
+            yield self._render({"message": str(e)})
+
+        finally:
+            await self.aclose()
+
+    async def aclose(self):
+        """
+        진행 중인 스크래핑을 취소하고, 실행 슬롯을 반환합니다.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        await self.courses.aclose()
+        if self._credentialKey is not None:
+            admission.release(
+                self._credentialKey, serviceTime=time.monotonic() - self._startTime
+            )
+
+    def close(self):
+        """
+        응답이 닫힐 때 호출됩니다.
+
+        클라이언트 연결 종료로 스트리밍을 시작하지 못했거나 중단된 경우에도 슬롯이 반환되도록,
+        요청을 처리한 이벤트 루프에 aclose를 예약합니다. 응답 종료 처리는 별도 스레드에서 호출될 수 있습니다.
+        """
+        if self._closed or self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._scheduleClose)
+
+    def _scheduleClose(self):
+        self._closing = asyncio.ensure_future(self.aclose())
+
+    def _render(self, data: dict) -> bytes:
+        return self._renderer.render(data) + b"\n"
+
+
+class CourseDetailView(AsyncGenericAPIView):
     """
     특정 강좌의 정보를 추출하는 View입니다.
     """
 
-    serializer_class = AuthSerializer
+    serializer_class = CourseDetailSerializer
+    resultCacheTtl = 60
+    resultCacheGrace = 60 * 5
 
     @extend_schema(
         tags=["강좌 API"],
         summary="강좌 상세 정보 추출",
         description="특정 강좌의 상세 정보를 추출합니다.",
+        request=CourseDetailSerializer,
         responses={
             status.HTTP_200_OK: CourseResponseSerializer,
             status.HTTP_404_NOT_FOUND: CourseNotExistResponse,
         },
     )
-    def post(self, request, *args, **kwargs):
+    async def post(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
 
         if serializer.is_valid():
             studentId = serializer.validated_data.get("studentId")
             password = serializer.validated_data.get("password")
             courseCode = self.kwargs.get("courseCode")
+            include = serializer.validated_data.get("include")
+            assignmentDetail = serializer.validated_data.get("assignmentDetail")
+            knownNotices = set(serializer.validated_data.get("knownNotices", ()))
 
             try:
-                extractor = Extractor(studentId=studentId, password=password)
-                course = asyncio.run(extractor.getCourseDetail(courseCode=courseCode))
+                course = await self.getCachedResult(
+                    studentId=studentId,
+                    password=password,
+                    params={
+                        "courseCode": courseCode,
+                        "include": include,
+                        "assignmentDetail": assignmentDetail,
+                        "knownNotices": knownNotices,
+                    },
+                    load=lambda: Extractor(
+                        studentId=studentId, password=password
+                    ).getCourseDetail(
+                        courseCode=courseCode,
+                        include=include,
+                        assignmentDetail=assignmentDetail,
+                        knownNotices=knownNotices,
+                    ),
+                )
                 return Response({"data": course}, status=status.HTTP_200_OK)
 
             except ExtractorException as e:
-                e.logError()
+                await self.logException(e)
 
                 if e.type == ErrorType.COURSE_NOT_EXIST:
                     return Response(
@@ -101,9 +286,9 @@ class CourseDetailView(GenericAPIView):
                     )
                 return Response({"message": e.message}, status=e.type.httpStatus)
             except Exception as e:
-                ExtractorException(
-                    errorType=ErrorType.SYSTEM_ERROR, message=str(e)
-                ).logError()
+                await self.logException(
+                    ExtractorException(errorType=ErrorType.SYSTEM_ERROR, message=str(e))
+                )
                 return Response(
                     {"message": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
                 )
@@ -0,0 +1,115 @@
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.response import Response
+
+from Scrape.extractor import Extractor
+from Scrape.extractor.exception import ErrorType, ExtractorException
+from Scrape.extractor.job import Job, jobQueue
+from Scrape.extractor.parts import Utils
+from Scrape.serializer import (
+    CourseSerializer,
+    JobErrorResponse,
+    JobResponseSerializer,
+    JobSubmitResponseSerializer,
+)
+from Scrape.views.base import AsyncGenericAPIView
+
+
+class CourseJobView(AsyncGenericAPIView):
+    """
+    강좌 추출 작업을 등록하는 View입니다.
+
+    작업은 대기열에 등록된 뒤 작업자가 실행하므로, 추출 시간과 관계없이 즉시 응답합니다.
+    작업자는 실행 시점에 승인 제어기의 실행 슬롯을 할당받으며, 거절된 작업은 실패로 처리됩니다.
+    """
+
+    serializer_class = CourseSerializer
+
+    @extend_schema(
+        tags=["작업 API"],
+        summary="강좌 추출 작업 등록",
+        description="모든 강좌의 정보를 추출하는 작업을 등록하고 작업 ID를 반환합니다. 결과는 작업 조회 API로 확인합니다.",
+        request=CourseSerializer,
+        responses={
+            status.HTTP_202_ACCEPTED: JobSubmitResponseSerializer,
+            status.HTTP_503_SERVICE_UNAVAILABLE: JobErrorResponse,
+        },
+    )
+    async def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+
+        if serializer.is_valid():
+            studentId = serializer.validated_data.get("studentId")
+            password = serializer.validated_data.get("password")
+            year = serializer.validated_data.get("year")
+            semester = serializer.validated_data.get("semester")
+            extract = serializer.validated_data.get("extract")
+            include = serializer.validated_data.get("include")
+            assignmentDetail = serializer.validated_data.get("assignmentDetail")
+            knownNotices = set(serializer.validated_data.get("knownNotices", ()))
+
+            async def run(job: Job) -> list:
+                # 강좌별로 완료되는 즉시 부분 결과에 추가
+                extractor = Extractor(studentId=studentId, password=password)
+                async for course in extractor.iterCourses(
+                    year=year,
+                    semester=semester,
+                    extract=extract,
+                    include=include,
+                    assignmentDetail=assignmentDetail,
+                    knownNotices=knownNotices,
+                ):
+                    await jobQueue.addPartial(job, course)
+                return list(job.partial)
+
+            try:
+                job = await jobQueue.submit(
+                    run,
+                    credentialKey=Utils.getCredentialKey(
+                        studentId=studentId, password=password
+                    ),
+                )
+                return Response(
+                    {"data": {"jobId": job.id, "status": job.status.value}},
+                    status=status.HTTP_202_ACCEPTED,
+                    headers={"Location": f"{request.path}{job.id}/"},
+                )
+
+            except ExtractorException as e:
+                await self.logException(e)
+                return Response({"message": e.message}, status=e.type.httpStatus)
+            except Exception as e:
+                await self.logException(
+                    ExtractorException(errorType=ErrorType.SYSTEM_ERROR, message=str(e))
+                )
+                return Response(
+                    {"message": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                )
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+class CourseJobDetailView(AsyncGenericAPIView):
+    """
+    강좌 추출 작업의 상태와 결과를 조회하는 View입니다.
+
+    작업 ID는 추측할 수 없는 임의 값이며, 작업 결과 조회 권한으로 사용됩니다.
+    완료 또는 실패한 작업은 한 번 조회되면 제거됩니다.
+    """
+
+    @extend_schema(
+        tags=["작업 API"],
+        summary="강좌 추출 작업 조회",
+        description="작업 상태와 완료된 강좌(partial), 최종 결과(result)를 조회합니다. 완료된 작업은 한 번 조회되면 제거되며, 조회되지 않더라도 일정 시간 후 만료됩니다.",
+        responses={
+            status.HTTP_200_OK: JobResponseSerializer,
+            status.HTTP_404_NOT_FOUND: JobErrorResponse,
+        },
+    )
+    async def get(self, request, *args, **kwargs):
+        job = await jobQueue.get(self.kwargs.get("jobId"))
+        if job is None:
+            return Response(
+                {"message": ErrorType.JOB_NOT_EXIST.message},
+                status=ErrorType.JOB_NOT_EXIST.httpStatus,
+            )
+        return Response({"data": job}, status=status.HTTP_200_OK)
@@ -0,0 +1,28 @@
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.generics import GenericAPIView
+from rest_framework.response import Response
+
+from Scrape.extractor.metrics import metrics
+from Scrape.permissions import InternalAccessPermission
+from Scrape.serializer import MetricsResponseSerializer
+
+
+class MetricsView(GenericAPIView):
+    """
+    워커 프로세스의 스크래핑 지표를 조회하는 View입니다.
+
+    내부 주소 또는 내부 토큰으로 요청한 경우에만 응답합니다.
+    """
+
+    authentication_classes = ()
+    permission_classes = (InternalAccessPermission,)
+
+    @extend_schema(
+        tags=["모니터링 API"],
+        summary="스크래핑 지표 조회",
+        description="요청을 처리한 워커 프로세스의 연결 재사용 등 스크래핑 지표를 조회합니다. 내부 주소 또는 내부 토큰(Authorization: Bearer)으로 요청한 경우에만 응답합니다.",
+        responses={status.HTTP_200_OK: MetricsResponseSerializer},
+    )
+    def get(self, request, *args, **kwargs):
+        return Response({"data": metrics.snapshot()}, status=status.HTTP_200_OK)
@@ -1,50 +1,57 @@
-import asyncio
-
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
-from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
 
 from Scrape.extractor import Extractor
 from Scrape.extractor.exception import ErrorType, ExtractorException
-from Scrape.serializer import AuthSerializer, NoticeResponseSerializer
+from Scrape.serializer import NoticeResponseSerializer, NoticeSerializer
+from Scrape.views.base import AsyncGenericAPIView
 
 
-class NoticeView(GenericAPIView):
+class NoticeView(AsyncGenericAPIView):
     """
     해당 강좌의 모든 공지를 추출하는 View입니다.
     """
 
-    serializer_class = AuthSerializer
+    serializer_class = NoticeSerializer
+    resultCacheTtl = 60 * 2
+    resultCacheGrace = 60 * 10
 
     @extend_schema(
         tags=["강좌 API"],
         summary="강좌 공지사항 추출",
-        description="강좌의 모든 공지사항을 추출합니다.",
-        request=AuthSerializer,
+        description="강좌의 모든 공지사항을 추출합니다. knownNotices로 전달한 식별값과 같은 공지사항은 본문 없이 unchanged로 표시됩니다.",
+        request=NoticeSerializer,
         responses={status.HTTP_200_OK: NoticeResponseSerializer},
     )
-    def post(self, request, *args, **kwargs):
+    async def post(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
 
         if serializer.is_valid():
             studentId = serializer.validated_data.get("studentId")
             password = serializer.validated_data.get("password")
             boardCode = self.kwargs.get("boardCode")
+            knownNotices = set(serializer.validated_data.get("knownNotices", ()))
 
             try:
-                extractor = Extractor(studentId=studentId, password=password)
-                notices = asyncio.run(extractor.getCourseNotice(boardCode=boardCode))
+                notices = await self.getCachedResult(
+                    studentId=studentId,
+                    password=password,
+                    params={"boardCode": boardCode, "knownNotices": knownNotices},
+                    load=lambda: Extractor(
+                        studentId=studentId, password=password
+                    ).getCourseNotice(boardCode=boardCode, knownNotices=knownNotices),
+                )
 
                 return Response({"data": notices}, status=status.HTTP_200_OK)
 
             except ExtractorException as e:
-                e.logError()
+                await self.logException(e)
                 return Response({"message": e.message}, status=e.type.httpStatus)
             except Exception as e:
-                ExtractorException(
-                    errorType=ErrorType.SYSTEM_ERROR, message=str(e)
-                ).logError()
+                await self.logException(
+                    ExtractorException(errorType=ErrorType.SYSTEM_ERROR, message=str(e))
+                )
                 return Response(
                     {"message": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
                 )
@@ -1,21 +1,21 @@
-import asyncio
-
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
-from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
 
 from Scrape.extractor import Extractor
 from Scrape.extractor.exception import ErrorType, ExtractorException
 from Scrape.serializer import TimetableResponseSerializer, TimetableSerializer
+from Scrape.views.base import AsyncGenericAPIView
 
 
-class TimetableView(GenericAPIView):
+class TimetableView(AsyncGenericAPIView):
     """
     이용자의 시간표 정보를 추출합니다.
     """
 
     serializer_class = TimetableSerializer
+    resultCacheTtl = 60 * 10
+    resultCacheGrace = 60 * 60
 
     @extend_schema(
         tags=["시간표 API"],
@@ -24,7 +24,7 @@ class TimetableView(GenericAPIView):
         request=TimetableSerializer,
         responses={status.HTTP_200_OK: TimetableResponseSerializer},
     )
-    def post(self, request, *args, **kwargs):
+    async def post(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
 
         if serializer.is_valid():
@@ -34,20 +34,24 @@ class TimetableView(GenericAPIView):
             semester = serializer.validated_data.get("semester")
 
             try:
-                extractor = Extractor(studentId=studentId, password=password)
-                timetable = asyncio.run(
-                    extractor.getTimetable(year=year, semester=semester)
+                timetable = await self.getCachedResult(
+                    studentId=studentId,
+                    password=password,
+                    params={"year": year, "semester": semester},
+                    load=lambda: Extractor(
+                        studentId=studentId, password=password
+                    ).getTimetable(year=year, semester=semester),
                 )
 
                 return Response({"data": timetable}, status=status.HTTP_200_OK)
 
             except ExtractorException as e:
-                e.logError()
+                await self.logException(e)
                 return Response({"message": e.message}, status=e.type.httpStatus)
             except Exception as e:
-                ExtractorException(
-                    errorType=ErrorType.SYSTEM_ERROR, message=str(e)
-                ).logError()
+                await self.logException(
+                    ExtractorException(errorType=ErrorType.SYSTEM_ERROR, message=str(e))
+                )
                 return Response(
                     {"message": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
                 )
@@ -0,0 +1,74 @@
+"""
+공지사항 본문 텍스트 추출(Utils.extractContent) 벤치마크입니다.
+
+중첩 깊이와 문단 수가 다른 큰 공지사항 본문에서 이전 구현(BeautifulSoup, 문서 변경)과
+현재 구현(단일 순회)의 추출 시간을 파싱 백엔드별로 측정합니다.
+
+사용법 (프로젝트 루트에서 실행):
+    python -m benchmarks.extract_content [--repeat 5]
+"""
+
+import argparse
+import copy
+import time
+
+from Scrape.extractor.parser.lxml_backend import parseLxml
+from Scrape.extractor.parser.soup_backend import parseSoup
+from Scrape.extractor.parts.utils import Utils
+from Scrape.tests.reference import extractContentReference, parseReference
+
+# (중첩 깊이, 문단 수)
+BODY_SIZES = ((5, 200), (10, 50), (40, 50), (120, 20), (150, 200))
+
+
+def nestedBody(depth: int, width: int) -> str:
+    if depth == 0:
+        return "<p>공지 내용 텍스트<br>둘째 줄</p>" * width
+    return f"<div><span>머리말</span>{nestedBody(depth - 1, width)}</div>"
+
+
+def measure(run, containers: list) -> float:
+    """
+    요소별 추출 시간의 평균(ms)을 반환합니다.
+    """
+    startTime = time.perf_counter()
+    for container in containers:
+        run(container)
+    return (time.perf_counter() - startTime) / len(containers) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'depth':>5} {'width':>5} {'reference':>10} {'bs4':>8} {'lxml':>8}")
+    for depth, width in BODY_SIZES:
+        document = (
+            "<html><body><div class='text_to_html'>"
+            f"{nestedBody(depth, width)}</div></body></html>"
+        )
+
+        # 이전 구현은 문서를 변경하므로 측정 전에 문서를 복사
+        soup = parseReference(document)
+        copies = [
+            copy.copy(soup).find("div", class_="text_to_html")
+            for _ in range(args.repeat)
+        ]
+        reference = measure(extractContentReference, copies)
+
+        results = []
+        for parse in (parseSoup, parseLxml):
+            container = parse(document.encode(), "utf-8").find(
+                "div", class_="text_to_html"
+            )
+            results.append(measure(Utils.extractContent, [container] * args.repeat))
+
+        print(
+            f"{depth:>5} {width:>5} {reference:>8.1f}ms"
+            f" {results[0]:>6.1f}ms {results[1]:>6.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
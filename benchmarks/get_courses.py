@@ -0,0 +1,216 @@
+"""
+강좌 추출(Extractor.getCourses) 종단 간 벤치마크입니다.
+
+테스트 HTML 문서로 LMS 페이지(메인, 강좌, 게시판, 공지사항, 과제, 출석)를 응답하는 로컬 LMS 서버에서
+로그인부터 모든 강좌의 공지사항, 활동, 출석 추출까지의 전체 소요 시간과 이벤트 루프가 멈춘 최대 시간(loop lag)을
+파싱 실행 방식("inline", "thread")과 파싱 백엔드("lxml", "bs4")별로 측정합니다.
+페이지에는 LMS 사이드바 크기의 요소를 추가하며, 측정마다 강좌 ID를 바꿔 캐시를 사용하지 않습니다.
+
+사용법 (프로젝트 루트에서 실행):
+    python -m benchmarks.get_courses [--courses 7] [--filler 1000] [--latency 0.03]
+"""
+
+import argparse
+import asyncio
+import re
+import time
+from pathlib import Path
+
+from aiohttp import web
+
+from Scrape.extractor import Extractor
+from Scrape.extractor import extractor as extractorModule
+from Scrape.extractor.parser import executor
+from Scrape.extractor.parts import lms
+from Scrape.extractor.session import getConnector
+
+FIXTURE_DIR = Path(__file__).resolve().parent.parent / "Scrape" / "tests" / "fixtures"
+LMS_URL = "https://lms.kyonggi.ac.kr"
+
+# 경로별 응답 문서
+PAGES = {
+    "/course/view.php": "lms_course.html",
+    "/mod/ubboard/view.php": "lms_board.html",
+    "/mod/ubboard/article.php": "lms_notice.html",
+    "/mod/assign/view.php": "lms_assignment.html",
+    "/report/ubcompletion/user_progress_a.php": "lms_attendance.html",
+    "/user/user_edit.php": "lms_user.html",
+}
+
+COURSE_ITEM_PATTERN = re.compile(
+    r"<li class=\"course_label_re_\d+ course_label_re\">.*?</li>", re.S
+)
+MODULE_ID_PATTERN = re.compile(r"(view\.php\?id=)(\d+)")
+ARTICLE_ID_PATTERN = re.compile(r"(article\.php\?id=)\d+(&amp;bwid=)(\d+)")
+
+
+class MockLms:
+    """
+    테스트 HTML 문서로 응답하는 로컬 LMS 서버입니다.
+
+    강좌, 게시판 페이지의 링크는 요청한 ID를 포함하도록 바꿔, 강좌마다 다른 페이지를 요청하게 합니다.
+    """
+
+    def __init__(self, courses: int, filler: int, latency: float):
+        self.courses: int = courses
+        self.latency: float = latency
+        self.generation: int = 0
+        self.requests: int = 0
+        self.baseUrl: str = ""
+
+        sidebar = "<div class='block'>{}</div>".format(
+            "".join(f"<p>sidebar {i} <a href='#'>link</a></p>" for i in range(filler))
+        )
+        self._pages = {path: self._load(name, sidebar) for path, name in PAGES.items()}
+        self._main = self._load("lms_main.html", sidebar)
+
+        self._runner: web.AppRunner | None = None
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self.handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.baseUrl = f"http://127.0.0.1:{port}"
+
+        # 추출기의 LMS 주소를 로컬 서버로 변경
+        for module in (lms, extractorModule):
+            for name, value in list(vars(module).items()):
+                if isinstance(value, str) and value.startswith(LMS_URL):
+                    setattr(module, name, value.replace(LMS_URL, self.baseUrl))
+                elif isinstance(value, tuple) and all(
+                    isinstance(item, str) and item.startswith(LMS_URL) for item in value
+                ):
+                    setattr(
+                        module,
+                        name,
+                        tuple(item.replace(LMS_URL, self.baseUrl) for item in value),
+                    )
+
+    async def close(self):
+        await self._runner.cleanup()
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+
+        if request.path == "/login/index.php" and request.method == "POST":
+            response = web.Response(
+                status=303,
+                headers={"Location": f"{self.baseUrl}/login/index.php?testsession=1"},
+            )
+            response.set_cookie("MoodleSession", f"session{self.requests}")
+            return response
+
+        if request.path == "/":
+            return self._html(self._getMainPage())
+
+        page = self._pages.get(request.path)
+        if page is None:
+            return web.Response(status=404)
+
+        pageId = request.query.get("id", "0")
+        if request.path == "/course/view.php":
+            page = MODULE_ID_PATTERN.sub(
+                lambda match: f"{match[1]}{pageId}{match[2]}", page
+            )
+        elif request.path == "/mod/ubboard/view.php":
+            page = ARTICLE_ID_PATTERN.sub(
+                lambda match: f"{match[1]}{pageId}{match[2]}{pageId}{match[3]}", page
+            )
+        return self._html(page)
+
+    def _getMainPage(self) -> str:
+        # 측정마다 다른 강좌 ID 사용
+        self.generation += 1
+        matches = list(COURSE_ITEM_PATTERN.finditer(self._main))
+        item = matches[0][0]
+        items = "".join(
+            item.replace("id=40101", f"id={self.generation}{index:03d}").replace(
+                "_A1234", f"_A{index:04d}"
+            )
+            for index in range(self.courses)
+        )
+        return (
+            self._main[: matches[0].start()] + items + self._main[matches[-1].end() :]
+        )
+
+    def _load(self, name: str, sidebar: str) -> str:
+        page = (FIXTURE_DIR / name).read_text(encoding="utf-8")
+        return page.replace(LMS_URL, "").replace("</body>", sidebar + "</body>")
+
+    def _html(self, page: str) -> web.Response:
+        # 링크는 로컬 서버 주소로 응답
+        page = page.replace('href="/', f'href="{self.baseUrl}/')
+        return web.Response(text=page, content_type="text/html", charset="utf-8")
+
+
+async def measure(server: MockLms) -> tuple[float, float, int]:
+    """
+    강좌를 추출하고 (전체 소요 시간, 최대 이벤트 루프 지연, 강좌 수)를 반환합니다. (ms)
+    """
+    lag = 0.0
+    done = False
+
+    async def probe():
+        nonlocal lag
+        while not done:
+            startTime = time.perf_counter()
+            await asyncio.sleep(0.01)
+            lag = max(lag, time.perf_counter() - startTime - 0.01)
+
+    probeTask = asyncio.create_task(probe())
+    await asyncio.sleep(0)
+
+    startTime = time.perf_counter()
+    courses = await Extractor(
+        studentId=f"bench{server.generation}", password="password"
+    ).getCourses(year=None, semester=None, extract=True)
+    elapsed = time.perf_counter() - startTime
+
+    done = True
+    await probeTask
+    return elapsed * 1000, lag * 1000, len(courses)
+
+
+async def run(args: argparse.Namespace):
+    server = MockLms(courses=args.courses, filler=args.filler, latency=args.latency)
+    await server.start()
+
+    try:
+        print(
+            f"{'executor':>8} {'backend':>7} {'courses':>7} {'total':>9} {'max lag':>9}"
+        )
+        for backend in ("lxml", "bs4"):
+            for mode in ("inline", "thread"):
+                executor.PARSE_BACKEND = backend
+                executor.PARSE_EXECUTOR = mode
+
+                # 실행기 생성 및 연결 준비
+                await measure(server)
+                results = [await measure(server) for _ in range(args.repeat)]
+                elapsed, lag, courses = min(results)
+                print(
+                    f"{mode:>8} {backend:>7} {courses:>7}"
+                    f" {elapsed:>7.0f}ms {lag:>7.0f}ms"
+                )
+    finally:
+        await getConnector().close()
+        await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--courses", type=int, default=7)
+    parser.add_argument("--filler", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.03)
+    parser.add_argument("--repeat", type=int, default=3)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
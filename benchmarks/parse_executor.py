@@ -0,0 +1,91 @@
+"""
+HTML 파싱 실행 방식(EXTRACTOR_PARSE_EXECUTOR) 벤치마크입니다.
+
+강좌 페이지 여러 개를 동시에 파싱하는 동안 이벤트 루프가 멈춘 최대 시간(loop lag)과
+전체 소요 시간을 실행 방식("inline", "thread")과 파싱 백엔드("lxml", "bs4")별로 측정합니다.
+페이지는 테스트 HTML 문서에 LMS 사이드바 크기의 요소를 추가하여 생성합니다.
+
+사용법 (프로젝트 루트에서 실행):
+    python -m benchmarks.parse_executor [--documents 35] [--filler 1000]
+"""
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+
+from Scrape.extractor.parser import executor, parseDocument
+
+FIXTURE_DIR = Path(__file__).resolve().parent.parent / "Scrape" / "tests" / "fixtures"
+
+# 강좌별로 요청하는 페이지
+PAGES = (
+    "lms_course.html",
+    "lms_board.html",
+    "lms_notice.html",
+    "lms_assignment.html",
+    "lms_attendance.html",
+)
+
+
+def loadDocuments(count: int, filler: int) -> list[bytes]:
+    sidebar = "<div class='block'>{}</div>".format(
+        "".join(f"<p>sidebar {i} <a href='#'>link</a></p>" for i in range(filler))
+    ).encode()
+
+    pages = [(FIXTURE_DIR / name).read_bytes() for name in PAGES]
+    pages = [page.replace(b"</body>", sidebar + b"</body>") for page in pages]
+    return [pages[index % len(pages)] for index in range(count)]
+
+
+async def measure(documents: list[bytes]) -> tuple[float, float]:
+    """
+    문서를 동시에 파싱하고 (전체 소요 시간, 최대 이벤트 루프 지연)을 반환합니다. (ms)
+    """
+    lag = 0.0
+    done = False
+
+    async def probe():
+        nonlocal lag
+        while not done:
+            startTime = time.perf_counter()
+            await asyncio.sleep(0.01)
+            lag = max(lag, time.perf_counter() - startTime - 0.01)
+
+    probeTask = asyncio.create_task(probe())
+    await asyncio.sleep(0)
+
+    startTime = time.perf_counter()
+    await asyncio.gather(*(parseDocument(document) for document in documents))
+    elapsed = time.perf_counter() - startTime
+
+    done = True
+    await probeTask
+    return elapsed * 1000, lag * 1000
+
+
+async def run(args: argparse.Namespace):
+    documents = loadDocuments(args.documents, args.filler)
+
+    print(f"{'executor':>8} {'backend':>7} {'total':>9} {'max lag':>9}")
+    for backend in ("lxml", "bs4"):
+        for mode in ("inline", "thread"):
+            executor.PARSE_BACKEND = backend
+            executor.PARSE_EXECUTOR = mode
+
+            # 실행기 생성 및 캐시 준비
+            await measure(documents[:2])
+            elapsed, lag = min([await measure(documents) for _ in range(args.repeat)])
+            print(f"{mode:>8} {backend:>7} {elapsed:>7.0f}ms {lag:>7.0f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--documents", type=int, default=35)
+    parser.add_argument("--filler", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()